@@ -1,45 +1,138 @@
-"""Application settings using Pydantic Settings."""
+"""Application settings loaded from environment variables."""
 
+import os
 from functools import lru_cache
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Any, Callable
 
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+ENV_FILE = ".env"
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-    )
 
-    # Application
-    environment: str = "development"
-    app_name: str = "payment-service"
-    app_version: str = "1.0.0"
-    debug: bool = True
+def _to_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    normalized = value.strip().lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off", ""):
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
 
-    # Server
-    host: str = "0.0.0.0"
-    port: int = 8000
 
+# Field name -> (parser, default)
+_FIELDS: dict[str, tuple[Callable[[str], Any], Any]] = {
+    # Application
+    "environment": (str, "development"),
+    "app_name": (str, "payment-service"),
+    "app_version": (str, "1.0.0"),
+    "debug": (_to_bool, True),
+    "log_format": (str, "text"),  # "text" or "json"
+    # Server
+    "host": (str, "0.0.0.0"),
+    "port": (int, 8000),
+    "cors_allow_origins": (str, "*"),  # comma-separated; empty disables CORS
+    "enable_docs": (_to_bool, True),  # never served in production
     # Database (SQLite)
-    database_path: str = "data/payments.db"
-
+    "database_path": (str, "data/payments.db"),
+    "sqlite_synchronous": (str, "NORMAL"),
+    "sqlite_read_pool_size": (int, 4),
     # Redis
-    redis_host: str = "localhost"
-    redis_port: int = 6379
-    idempotency_ttl_seconds: int = 86400  # 24 hours
-
+    "redis_host": (str, "localhost"),
+    "redis_port": (int, 6379),
+    "redis_max_connections": (int, 64),
+    "idempotency_ttl_seconds": (int, 86400),  # 24 hours
+    # Payment cache (in-process)
+    "payment_cache_size": (int, 10000),
+    "payment_cache_ttl_seconds": (int, 60),
+    "payment_recent_cache_ttl_seconds": (float, 1.0),
     # Business Rules
-    max_retries: int = 3
-    retry_success_probability: float = 0.5
+    "max_retries": (int, 3),
+    "retry_success_probability": (float, 0.5),
+}
+
+
+class Settings:
+    """
+    Application settings loaded from environment variables.
+
+    Each field is resolved on first access (environment variable first,
+    then the .env file, then the default) and cached on the instance.
+    A malformed value raises ValueError on the first access of its field,
+    not when the settings are created.
+    """
+
+    environment: str
+    app_name: str
+    app_version: str
+    debug: bool
+    log_format: str
+    host: str
+    port: int
+    cors_allow_origins: str
+    enable_docs: bool
+    database_path: str
+    sqlite_synchronous: str
+    sqlite_read_pool_size: int
+    redis_host: str
+    redis_port: int
+    redis_max_connections: int
+    idempotency_ttl_seconds: int
+    payment_cache_size: int
+    payment_cache_ttl_seconds: int
+    payment_recent_cache_ttl_seconds: float
+    max_retries: int
+    retry_success_probability: float
+
+    def __init__(self, env_file: str | None = ENV_FILE) -> None:
+        """
+        Initialize settings.
+
+        Args:
+            env_file: Path of the dotenv file used as fallback (optional)
+        """
+        self._env_file = env_file
+        self._env_file_values: dict[str, str | None] | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve and cache a settings field on first access."""
+        field = _FIELDS.get(name)
+        if field is None:
+            raise AttributeError(f"'Settings' object has no attribute '{name}'")
+
+        parser, default = field
+        raw = self._lookup(name)
+        try:
+            value = default if raw is None else parser(raw)
+        except ValueError as exc:
+            raise ValueError(f"Invalid value for {name.upper()}: {raw!r}") from exc
+
+        # Cache in __dict__ so later reads skip __getattr__ entirely
+        self.__dict__[name] = value
+        return value
+
+    def _lookup(self, name: str) -> str | None:
+        """Find the raw value for a field (case-insensitive)."""
+        env_name = name.upper()
+        raw = os.environ.get(env_name, os.environ.get(name))
+        if raw is not None:
+            return raw
+
+        # .env is only parsed when a field is missing from the environment
+        if self._env_file_values is None:
+            values = dotenv_values(self._env_file) if self._env_file else {}
+            self._env_file_values = {k.upper(): v for k, v in values.items()}
+        return self._env_file_values.get(env_name)
 
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.environment == "development"
 
+    @property
+    def docs_enabled(self) -> bool:
+        """Check if the OpenAPI document and docs UIs should be served."""
+        return self.enable_docs and self.environment != "production"
+
     @property
     def redis_url(self) -> str:
         """Build Redis connection URL."""
@@ -49,4 +142,4 @@ class Settings(BaseSettings):
 @lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
\ No newline at end of file
+    return Settings()
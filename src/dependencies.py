@@ -16,6 +16,9 @@ from src.modules.payments.application.ports.idempotency_service import Idempoten
 from src.modules.payments.infrastructure.persistence.sqlite_payment_repository import (
     SQLitePaymentRepository,
 )
+from src.modules.payments.infrastructure.persistence.cached_payment_repository import (
+    CachedPaymentRepository,
+)
 from src.modules.payments.infrastructure.services.simulated_payment_processor import (
     SimulatedPaymentProcessor,
 )
@@ -71,11 +74,16 @@ RedisClientDep = Annotated[RedisClient, Depends(get_redis_client)]
 # REPOSITORIES
 # ============================================
 
-def get_payment_repository(
-    connection: SQLiteConnectionDep,
-) -> PaymentRepository:
-    """Get payment repository."""
-    return SQLitePaymentRepository(connection=connection)
+@lru_cache(maxsize=1)
+def get_payment_repository() -> PaymentRepository:
+    """Get payment repository singleton."""
+    settings = get_settings()
+    return CachedPaymentRepository(
+        repository=SQLitePaymentRepository(connection=get_sqlite_connection()),
+        maxsize=settings.payment_cache_size,
+        ttl_seconds=settings.payment_cache_ttl_seconds,
+        recent_ttl_seconds=settings.payment_recent_cache_ttl_seconds,
+    )
 
 
 PaymentRepositoryDep = Annotated[PaymentRepository, Depends(get_payment_repository)]
@@ -85,19 +93,19 @@ PaymentRepositoryDep = Annotated[PaymentRepository, Depends(get_payment_reposito
 # SERVICES
 # ============================================
 
+@lru_cache(maxsize=1)
 def get_payment_processor() -> PaymentProcessor:
-    """Get payment processor."""
+    """Get payment processor singleton."""
     return SimulatedPaymentProcessor()
 
 
 PaymentProcessorDep = Annotated[PaymentProcessor, Depends(get_payment_processor)]
 
 
-def get_idempotency_service(
-    redis_client: RedisClientDep,
-) -> IdempotencyService:
-    """Get idempotency service."""
-    return RedisIdempotencyService(redis_client=redis_client)
+@lru_cache(maxsize=1)
+def get_idempotency_service() -> IdempotencyService:
+    """Get idempotency service singleton."""
+    return RedisIdempotencyService(redis_client=get_redis_client())
 
 
 IdempotencyServiceDep = Annotated[IdempotencyService, Depends(get_idempotency_service)]
@@ -106,52 +114,68 @@ IdempotencyServiceDep = Annotated[IdempotencyService, Depends(get_idempotency_se
 # ============================================
 # USE CASES
 # ============================================
+# Use cases are stateless, so each one is built once per process.
+# Routes depend on async wrappers: FastAPI awaits them inline, whereas
+# sync dependencies are dispatched to the threadpool on every request.
 
-def get_create_payment_use_case(
-    payment_repository: PaymentRepositoryDep,
-    payment_processor: PaymentProcessorDep,
-    idempotency_service: IdempotencyServiceDep,
-) -> CreatePaymentUseCase:
-    """Get create payment use case."""
+@lru_cache(maxsize=1)
+def get_create_payment_use_case() -> CreatePaymentUseCase:
+    """Get create payment use case singleton."""
     return CreatePaymentUseCase(
-        payment_repository=payment_repository,
-        payment_processor=payment_processor,
-        idempotency_service=idempotency_service,
+        payment_repository=get_payment_repository(),
+        payment_processor=get_payment_processor(),
+        idempotency_service=get_idempotency_service(),
     )
 
 
-CreatePaymentUseCaseDep = Annotated[CreatePaymentUseCase, Depends(get_create_payment_use_case)]
+async def create_payment_use_case_dependency() -> CreatePaymentUseCase:
+    """Resolve the create payment use case without a threadpool hop."""
+    return get_create_payment_use_case()
+
+
+CreatePaymentUseCaseDep = Annotated[CreatePaymentUseCase, Depends(create_payment_use_case_dependency)]
+
 
+@lru_cache(maxsize=1)
+def get_get_payment_use_case() -> GetPaymentUseCase:
+    """Get get payment use case singleton."""
+    return GetPaymentUseCase(payment_repository=get_payment_repository())
 
-def get_get_payment_use_case(
-    payment_repository: PaymentRepositoryDep,
-) -> GetPaymentUseCase:
-    """Get get payment use case."""
-    return GetPaymentUseCase(payment_repository=payment_repository)
 
+async def get_payment_use_case_dependency() -> GetPaymentUseCase:
+    """Resolve the get payment use case without a threadpool hop."""
+    return get_get_payment_use_case()
 
-GetPaymentUseCaseDep = Annotated[GetPaymentUseCase, Depends(get_get_payment_use_case)]
 
+GetPaymentUseCaseDep = Annotated[GetPaymentUseCase, Depends(get_payment_use_case_dependency)]
 
-def get_retry_payment_use_case(
-    payment_repository: PaymentRepositoryDep,
-    payment_processor: PaymentProcessorDep,
-) -> RetryPaymentUseCase:
-    """Get retry payment use case."""
+
+@lru_cache(maxsize=1)
+def get_retry_payment_use_case() -> RetryPaymentUseCase:
+    """Get retry payment use case singleton."""
     return RetryPaymentUseCase(
-        payment_repository=payment_repository,
-        payment_processor=payment_processor,
+        payment_repository=get_payment_repository(),
+        payment_processor=get_payment_processor(),
     )
 
 
-RetryPaymentUseCaseDep = Annotated[RetryPaymentUseCase, Depends(get_retry_payment_use_case)]
+async def retry_payment_use_case_dependency() -> RetryPaymentUseCase:
+    """Resolve the retry payment use case without a threadpool hop."""
+    return get_retry_payment_use_case()
+
+
+RetryPaymentUseCaseDep = Annotated[RetryPaymentUseCase, Depends(retry_payment_use_case_dependency)]
+
+
+@lru_cache(maxsize=1)
+def get_list_payments_use_case() -> ListPaymentsUseCase:
+    """Get list payments use case singleton."""
+    return ListPaymentsUseCase(payment_repository=get_payment_repository())
 
 
-def get_list_payments_use_case(
-    payment_repository: PaymentRepositoryDep,
-) -> ListPaymentsUseCase:
-    """Get list payments use case."""
-    return ListPaymentsUseCase(payment_repository=payment_repository)
+async def list_payments_use_case_dependency() -> ListPaymentsUseCase:
+    """Resolve the list payments use case without a threadpool hop."""
+    return get_list_payments_use_case()
 
 
-ListPaymentsUseCaseDep = Annotated[ListPaymentsUseCase, Depends(get_list_payments_use_case)]
\ No newline at end of file
+ListPaymentsUseCaseDep = Annotated[ListPaymentsUseCase, Depends(list_payments_use_case_dependency)]
\ No newline at end of file
@@ -29,5 +29,7 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.is_development,
+        loop="uvloop",
+        http="httptools",
         log_level="info" if settings.debug else "warning",
     )
\ No newline at end of file
@@ -4,10 +4,13 @@ from dataclasses import dataclass
 from decimal import Decimal
 from datetime import datetime
 
+import orjson
+
 from src.modules.payments.domain.payment import Payment
+from src.modules.payments.domain.payment_status import PaymentStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreatePaymentRequest:
     """Request DTO for creating a payment."""
 
@@ -17,41 +20,42 @@ class CreatePaymentRequest:
     idempotency_key: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetPaymentRequest:
     """Request DTO for getting a payment."""
 
     payment_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryPaymentRequest:
     """Request DTO for retrying a payment."""
 
     payment_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ListPaymentsRequest:
     """Request DTO for listing payments."""
 
-    status: str | None = None
+    status: PaymentStatus | None = None
     limit: int = 100
-    offset: int = 0
+    cursor: str | None = None
+    include_total: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaymentResponse:
     """Response DTO for payment operations."""
 
     payment_id: str
     reference: str
-    amount: float
+    amount: str
     currency: str
     status: str
     retries: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
     @classmethod
     def from_entity(cls, payment: Payment) -> "PaymentResponse":
@@ -67,14 +71,44 @@ class PaymentResponse:
         return cls(
             payment_id=payment.payment_id,
             reference=payment.reference,
-            amount=float(payment.amount),
+            amount=str(payment.amount),
             currency=payment.currency,
-            status=payment.status.value,
+            status=payment.status,
             retries=payment.retries,
-            created_at=payment.created_at.isoformat(),
-            updated_at=payment.updated_at.isoformat(),
+            created_at=payment.created_at,
+            updated_at=payment.updated_at,
         )
 
+    @classmethod
+    def from_entities(cls, payments: list[Payment]) -> list["PaymentResponse"]:
+        """
+        Create response DTOs for a page of Payment entities.
+
+        Equivalent to calling from_entity per payment, with the lookups
+        hoisted out of the loop.
+
+        Args:
+            payments: The payment entities
+
+        Returns:
+            List of PaymentResponse DTOs, in the same order
+        """
+        _cls = cls
+        _str = str
+        return [
+            _cls(
+                p.payment_id,
+                p.reference,
+                _str(p.amount),
+                p.currency,
+                p.status,
+                p.retries,
+                p.created_at,
+                p.updated_at,
+            )
+            for p in payments
+        ]
+
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -88,21 +122,29 @@ class PaymentResponse:
             "updated_at": self.updated_at,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes without building an intermediate dict."""
+        return orjson.dumps(self)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ListPaymentsResponse:
     """Response DTO for listing payments."""
 
     payments: list[PaymentResponse]
-    total: int
+    next_cursor: str | None
     limit: int
-    offset: int
+    total: int | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
             "payments": [p.to_dict() for p in self.payments],
-            "total": self.total,
+            "next_cursor": self.next_cursor,
             "limit": self.limit,
-            "offset": self.offset,
-        }
\ No newline at end of file
+            "total": self.total,
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes, encoding nested payments in one pass."""
+        return orjson.dumps(self)
\ No newline at end of file
@@ -1,9 +1,30 @@
 """Application ports (interfaces) for external dependencies."""
 
-from src.modules.payments.application.ports.payment_processor import PaymentProcessor
-from src.modules.payments.application.ports.idempotency_service import IdempotencyService
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.modules.payments.application.ports.payment_processor import PaymentProcessor
+    from src.modules.payments.application.ports.idempotency_service import IdempotencyService
+
+# Exported name -> defining submodule, imported on first access (PEP 562)
+_EXPORTS = {
+    "PaymentProcessor": "payment_processor",
+    "IdempotencyService": "idempotency_service",
+}
 
 __all__ = [
     "PaymentProcessor",
     "IdempotencyService",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a port only when it is first accessed."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
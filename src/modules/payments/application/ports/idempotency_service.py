@@ -1,9 +1,23 @@
 """Idempotency service interface (port)."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any
 
 
+@dataclass(frozen=True)
+class ClaimResult:
+    """Result of claiming an idempotency key."""
+
+    existing_result: dict[str, Any] | None
+    lock_token: str | None
+
+    @property
+    def lock_acquired(self) -> bool:
+        """Whether the key's lock was acquired by this claim."""
+        return self.lock_token is not None
+
+
 class IdempotencyService(ABC):
     """
     Abstract idempotency service.
@@ -25,6 +39,24 @@ class IdempotencyService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def try_claim(self, idempotency_key: str, ttl_ms: int = 10000) -> ClaimResult:
+        """
+        Atomically check an idempotency key and lock it if unused.
+
+        Either returns the stored result for the key, or tries to
+        acquire the key's lock, in a single operation.
+
+        Args:
+            idempotency_key: The idempotency key to claim
+            ttl_ms: Lock time-to-live in milliseconds
+
+        Returns:
+            ClaimResult with the stored result (if any) and the lock
+            token when the lock was acquired
+        """
+        pass
+
     @abstractmethod
     async def save_result(
         self,
@@ -41,7 +73,26 @@ class IdempotencyService(ABC):
         pass
 
     @abstractmethod
-    async def acquire_lock(self, idempotency_key: str, ttl_ms: int = 10000) -> bool:
+    async def save_result_and_release(
+        self,
+        idempotency_key: str,
+        result: dict[str, Any],
+        lock_token: str,
+    ) -> None:
+        """
+        Save result for an idempotency key and release its lock.
+
+        Args:
+            idempotency_key: The idempotency key
+            result: The result to store
+            lock_token: Token returned when the lock was acquired
+        """
+        pass
+
+    @abstractmethod
+    async def acquire_lock(
+        self, idempotency_key: str, ttl_ms: int = 10000
+    ) -> str | None:
         """
         Acquire a distributed lock for an idempotency key.
 
@@ -53,16 +104,17 @@ class IdempotencyService(ABC):
             ttl_ms: Lock time-to-live in milliseconds
 
         Returns:
-            True if lock was acquired, False otherwise
+            The lock token if the lock was acquired, None otherwise
         """
         pass
 
     @abstractmethod
-    async def release_lock(self, idempotency_key: str) -> None:
+    async def release_lock(self, idempotency_key: str, lock_token: str) -> None:
         """
         Release a distributed lock.
 
         Args:
             idempotency_key: The idempotency key to unlock
+            lock_token: Token returned when the lock was acquired
         """
         pass
\ No newline at end of file
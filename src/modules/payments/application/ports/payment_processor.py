@@ -2,7 +2,6 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from decimal import Decimal
 
 
 @dataclass(frozen=True)
@@ -23,13 +22,13 @@ class PaymentProcessor(ABC):
     """
 
     @abstractmethod
-    async def process(self, payment_id: str, amount: Decimal) -> ProcessingResult:
+    async def process(self, payment_id: str, amount_minor: int) -> ProcessingResult:
         """
         Process a payment.
 
         Args:
             payment_id: The payment identifier
-            amount: The payment amount
+            amount_minor: The payment amount in minor units (cents)
 
         Returns:
             ProcessingResult indicating success or failure
@@ -37,7 +36,7 @@ class PaymentProcessor(ABC):
         pass
 
     @abstractmethod
-    async def process_retry(self, payment_id: str, amount: Decimal) -> ProcessingResult:
+    async def process_retry(self, payment_id: str, amount_minor: int) -> ProcessingResult:
         """
         Process a payment retry.
 
@@ -46,7 +45,7 @@ class PaymentProcessor(ABC):
 
         Args:
             payment_id: The payment identifier
-            amount: The payment amount
+            amount_minor: The payment amount in minor units (cents)
 
         Returns:
             ProcessingResult indicating success or failure
@@ -1,13 +1,36 @@
 """Payment use cases - application business logic."""
 
-from src.modules.payments.application.use_cases.create_payment import CreatePaymentUseCase
-from src.modules.payments.application.use_cases.get_payment import GetPaymentUseCase
-from src.modules.payments.application.use_cases.retry_payment import RetryPaymentUseCase
-from src.modules.payments.application.use_cases.list_payments import ListPaymentsUseCase
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.modules.payments.application.use_cases.create_payment import CreatePaymentUseCase
+    from src.modules.payments.application.use_cases.get_payment import GetPaymentUseCase
+    from src.modules.payments.application.use_cases.retry_payment import RetryPaymentUseCase
+    from src.modules.payments.application.use_cases.list_payments import ListPaymentsUseCase
+
+# Exported name -> defining submodule, imported on first access (PEP 562)
+_EXPORTS = {
+    "CreatePaymentUseCase": "create_payment",
+    "GetPaymentUseCase": "get_payment",
+    "RetryPaymentUseCase": "retry_payment",
+    "ListPaymentsUseCase": "list_payments",
+}
 
 __all__ = [
     "CreatePaymentUseCase",
     "GetPaymentUseCase",
     "RetryPaymentUseCase",
     "ListPaymentsUseCase",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a use case only when it is first accessed."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,9 @@
 """Create payment use case."""
 
+import asyncio
+from logging import INFO
+from typing import Any, Literal
+
 from src.modules.payments.domain.payment import Payment
 from src.modules.payments.domain.repository import PaymentRepository
 from src.modules.payments.application.ports.payment_processor import PaymentProcessor
@@ -7,6 +11,8 @@ from src.modules.payments.application.ports.idempotency_service import Idempoten
 from src.modules.payments.application.dtos import CreatePaymentRequest, PaymentResponse
 from src.shared.utils.logger import Logger
 
+logger = Logger("USE_CASE:CREATE_PAYMENT")
+
 
 class CreatePaymentUseCase:
     """
@@ -15,12 +21,14 @@ class CreatePaymentUseCase:
     This use case orchestrates:
     1. Idempotency check (return existing if duplicate)
     2. Payment entity creation with validation
-    3. Initial persistence in PENDING status
-    4. Payment processing (simulated)
-    5. Status update based on processing result
-    6. Idempotency key storage
+    3. Payment processing (simulated)
+    4. Persistence with the final status
+    5. Idempotency key storage and lock release
     """
 
+    # Backoff (seconds) between checks while another request holds the lock
+    CLAIM_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4)
+
     def __init__(
         self,
         payment_repository: PaymentRepository,
@@ -38,7 +46,6 @@ class CreatePaymentUseCase:
         self._payment_repository = payment_repository
         self._payment_processor = payment_processor
         self._idempotency_service = idempotency_service
-        self._logger = Logger("USE_CASE:CREATE_PAYMENT")
 
     async def execute(self, request: CreatePaymentRequest) -> tuple[PaymentResponse, bool]:
         """
@@ -54,53 +61,23 @@ class CreatePaymentUseCase:
         Raises:
             PaymentValidationError: If payment data is invalid
         """
-        self._logger.info(
-            "Creating payment",
-            extra={
-                "reference": request.reference,
-                "amount": float(request.amount),
-                "currency": request.currency,
-                "idempotency_key": request.idempotency_key,
-            },
-        )
-
-        # Step 1: Check idempotency - return existing if duplicate
-        existing_result = await self._idempotency_service.get_existing_result(
-            request.idempotency_key
-        )
-
-        if existing_result:
-            self._logger.info(
-                "Idempotency key found, returning existing payment",
-                extra={"payment_id": existing_result.get("payment_id")},
-            )
-            existing_payment = await self._payment_repository.find_by_id(
-                existing_result["payment_id"]
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Creating payment",
+                extra={
+                    "reference": request.reference,
+                    "amount": str(request.amount),
+                    "currency": request.currency,
+                    "idempotency_key": request.idempotency_key,
+                },
             )
-            if existing_payment:
-                return PaymentResponse.from_entity(existing_payment), False
-
-        # Step 2: Acquire lock to prevent race conditions
-        lock_acquired = await self._idempotency_service.acquire_lock(
-            request.idempotency_key
-        )
 
-        if not lock_acquired:
-            # Another request is processing, wait and check again
-            self._logger.warning(
-                "Could not acquire lock, checking for existing result",
-                extra={"idempotency_key": request.idempotency_key},
-            )
-            # Re-check after failed lock (another request might have completed)
-            existing_result = await self._idempotency_service.get_existing_result(
-                request.idempotency_key
-            )
-            if existing_result:
-                existing_payment = await self._payment_repository.find_by_id(
-                    existing_result["payment_id"]
-                )
-                if existing_payment:
-                    return PaymentResponse.from_entity(existing_payment), False
+        # Steps 1-2: Claim the idempotency key or reuse an existing payment
+        match await self._acquire_or_return_existing(request.idempotency_key):
+            case ("existing", existing_payment, _):
+                return PaymentResponse.from_entity(existing_payment), False
+            case ("new", None, lock_token):
+                pass
 
         try:
             # Step 3: Create payment entity (validates business rules)
@@ -110,62 +87,141 @@ class CreatePaymentUseCase:
                 currency=request.currency,
             )
 
-            self._logger.info(
-                "Payment entity created",
-                extra={
-                    "payment_id": payment.payment_id,
-                    "status": payment.status.value,
-                },
-            )
-
-            # Step 4: Persist in PENDING status
-            await self._payment_repository.save(payment)
-
-            self._logger.info(
-                "Payment persisted in PENDING status",
-                extra={"payment_id": payment.payment_id},
-            )
+            if logger.isEnabledFor(INFO):
+                logger.info(
+                    "Payment entity created",
+                    extra={
+                        "payment_id": payment.payment_id,
+                        "status": payment.status,
+                    },
+                )
 
-            # Step 5: Process payment (simulated)
+            # Step 4: Process payment (simulated)
             processing_result = await self._payment_processor.process(
                 payment_id=payment.payment_id,
-                amount=payment.amount,
+                amount_minor=payment.amount_minor,
             )
 
-            self._logger.info(
-                "Payment processing completed",
-                extra={
-                    "payment_id": payment.payment_id,
-                    "success": processing_result.success,
-                    "message": processing_result.message,
-                },
-            )
+            if logger.isEnabledFor(INFO):
+                logger.info(
+                    "Payment processing completed",
+                    extra={
+                        "payment_id": payment.payment_id,
+                        "success": processing_result.success,
+                        "message": processing_result.message,
+                    },
+                )
 
-            # Step 6: Update status based on processing result
+            # Step 5: Apply processing result
             if processing_result.success:
                 payment.mark_as_success()
             else:
                 payment.mark_as_failed()
 
-            await self._payment_repository.update(payment)
+            # Step 6: Persist with the final status in a single write
+            await self._payment_repository.save(payment)
 
-            self._logger.info(
-                "Payment status updated",
-                extra={
-                    "payment_id": payment.payment_id,
-                    "status": payment.status.value,
-                },
-            )
+            if logger.isEnabledFor(INFO):
+                logger.info(
+                    "Payment persisted",
+                    extra={
+                        "payment_id": payment.payment_id,
+                        "status": payment.status,
+                    },
+                )
 
-            # Step 7: Save idempotency key
-            await self._idempotency_service.save_result(
-                idempotency_key=request.idempotency_key,
-                result={"payment_id": payment.payment_id},
-            )
+            # Step 7: Save idempotency key (and release the lock with it)
+            result = {"payment_id": payment.payment_id}
+            if lock_token is not None:
+                await self._idempotency_service.save_result_and_release(
+                    idempotency_key=request.idempotency_key,
+                    result=result,
+                    lock_token=lock_token,
+                )
+                lock_token = None
+            else:
+                await self._idempotency_service.save_result(
+                    idempotency_key=request.idempotency_key,
+                    result=result,
+                )
 
             return PaymentResponse.from_entity(payment), True
 
         finally:
-            # Always release lock
-            if lock_acquired:
-                await self._idempotency_service.release_lock(request.idempotency_key)
\ No newline at end of file
+            # Release the lock if it was not released with the result
+            if lock_token is not None:
+                await self._idempotency_service.release_lock(
+                    request.idempotency_key, lock_token
+                )
+
+    async def _acquire_or_return_existing(
+        self,
+        idempotency_key: str,
+    ) -> tuple[Literal["new", "existing"], Payment | None, str | None]:
+        """
+        Claim an idempotency key or find the payment already created for it.
+
+        Args:
+            idempotency_key: The idempotency key of the request
+
+        Returns:
+            Tuple of (outcome, existing payment, lock token) where outcome
+            is "existing" when a payment was found and "new" when one must
+            be created; the lock token is None when the lock is not held
+        """
+        # Check idempotency and acquire lock in a single operation
+        claim = await self._idempotency_service.try_claim(idempotency_key)
+        existing_result = claim.existing_result
+        lock_token = claim.lock_token
+
+        if existing_result:
+            if logger.isEnabledFor(INFO):
+                logger.info(
+                    "Idempotency key found, returning existing payment",
+                    extra={"payment_id": existing_result.get("payment_id")},
+                )
+        elif lock_token is None:
+            # Another request is processing, wait for its result
+            logger.warning(
+                "Could not acquire lock, waiting for existing result",
+                extra={"idempotency_key": idempotency_key},
+            )
+            existing_result = await self._wait_for_existing_result(idempotency_key)
+
+        if existing_result:
+            existing_payment = await self._payment_repository.find_by_id(
+                existing_result["payment_id"]
+            )
+            if existing_payment:
+                return "existing", existing_payment, None
+
+            if claim.existing_result:
+                # Stored result points to a missing payment, recreate it under lock
+                lock_token = await self._idempotency_service.acquire_lock(
+                    idempotency_key
+                )
+
+        return "new", None, lock_token
+
+    async def _wait_for_existing_result(
+        self,
+        idempotency_key: str,
+    ) -> dict[str, Any] | None:
+        """
+        Poll for the result of a concurrent request with the same key.
+
+        Args:
+            idempotency_key: The idempotency key held by another request
+
+        Returns:
+            The stored result once available, None if it never appeared
+        """
+        for delay in self.CLAIM_POLL_DELAYS:
+            await asyncio.sleep(delay)
+            existing_result = await self._idempotency_service.get_existing_result(
+                idempotency_key
+            )
+            if existing_result:
+                return existing_result
+
+        return None
@@ -1,10 +1,14 @@
 """Get payment use case."""
 
+from logging import INFO
+
 from src.modules.payments.domain.repository import PaymentRepository
 from src.modules.payments.domain.errors import PaymentNotFoundError
 from src.modules.payments.application.dtos import GetPaymentRequest, PaymentResponse
 from src.shared.utils.logger import Logger
 
+logger = Logger("USE_CASE:GET_PAYMENT")
+
 
 class GetPaymentUseCase:
     """
@@ -21,7 +25,6 @@ class GetPaymentUseCase:
             payment_repository: Repository for payment persistence
         """
         self._payment_repository = payment_repository
-        self._logger = Logger("USE_CASE:GET_PAYMENT")
 
     async def execute(self, request: GetPaymentRequest) -> PaymentResponse:
         """
@@ -36,26 +39,28 @@ class GetPaymentUseCase:
         Raises:
             PaymentNotFoundError: If payment does not exist
         """
-        self._logger.info(
-            "Getting payment",
-            extra={"payment_id": request.payment_id},
-        )
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Getting payment",
+                extra={"payment_id": request.payment_id},
+            )
 
         payment = await self._payment_repository.find_by_id(request.payment_id)
 
         if not payment:
-            self._logger.warning(
+            logger.warning(
                 "Payment not found",
                 extra={"payment_id": request.payment_id},
             )
             raise PaymentNotFoundError(request.payment_id)
 
-        self._logger.info(
-            "Payment found",
-            extra={
-                "payment_id": payment.payment_id,
-                "status": payment.status.value,
-            },
-        )
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Payment found",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "status": payment.status,
+                },
+            )
 
         return PaymentResponse.from_entity(payment)
\ No newline at end of file
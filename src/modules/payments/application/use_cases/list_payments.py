@@ -1,8 +1,9 @@
 """List payments use case."""
 
+import asyncio
+from logging import INFO
+
 from src.modules.payments.domain.repository import PaymentRepository
-from src.modules.payments.domain.payment_status import PaymentStatus
-from src.modules.payments.domain.errors import PaymentValidationError
 from src.modules.payments.application.dtos import (
     ListPaymentsRequest,
     ListPaymentsResponse,
@@ -10,12 +11,14 @@ from src.modules.payments.application.dtos import (
 )
 from src.shared.utils.logger import Logger
 
+logger = Logger("USE_CASE:LIST_PAYMENTS")
+
 
 class ListPaymentsUseCase:
     """
     Use case for listing payments with optional filtering.
 
-    Supports pagination and filtering by status.
+    Supports cursor pagination and filtering by status.
     """
 
     def __init__(self, payment_repository: PaymentRepository) -> None:
@@ -26,7 +29,6 @@ class ListPaymentsUseCase:
             payment_repository: Repository for payment persistence
         """
         self._payment_repository = payment_repository
-        self._logger = Logger("USE_CASE:LIST_PAYMENTS")
 
     async def execute(self, request: ListPaymentsRequest) -> ListPaymentsResponse:
         """
@@ -37,55 +39,48 @@ class ListPaymentsUseCase:
 
         Returns:
             ListPaymentsResponse with paginated results
-
-        Raises:
-            PaymentValidationError: If status filter is invalid
         """
-        self._logger.info(
-            "Listing payments",
-            extra={
-                "status": request.status,
-                "limit": request.limit,
-                "offset": request.offset,
-            },
-        )
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Listing payments",
+                extra={
+                    "status": request.status,
+                    "limit": request.limit,
+                    "cursor": request.cursor,
+                },
+            )
 
-        # Validate status filter if provided
-        if request.status:
-            valid_statuses = [s.value for s in PaymentStatus]
-            if request.status not in valid_statuses:
-                self._logger.warning(
-                    "Invalid status filter",
-                    extra={
-                        "status": request.status,
-                        "valid_statuses": valid_statuses,
-                    },
-                )
-                raise PaymentValidationError(
-                    message=f"Invalid status '{request.status}'. Valid values: {', '.join(valid_statuses)}",
-                    field="status",
-                )
-
-        # Get payments and total count
-        payments = await self._payment_repository.find_all(
+        # Get one page of payments
+        page = self._payment_repository.find_all(
             status=request.status,
+            cursor=request.cursor,
             limit=request.limit,
-            offset=request.offset,
         )
 
-        total = await self._payment_repository.count(status=request.status)
+        # Counting is a full scan, so it only runs when explicitly requested,
+        # concurrently with the page query
+        total = None
+        if request.include_total:
+            (payments, next_cursor), total = await asyncio.gather(
+                page,
+                self._payment_repository.count(status=request.status),
+            )
+        else:
+            payments, next_cursor = await page
 
-        self._logger.info(
-            "Payments retrieved",
-            extra={
-                "count": len(payments),
-                "total": total,
-            },
-        )
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Payments retrieved",
+                extra={
+                    "count": len(payments),
+                    "has_more": next_cursor is not None,
+                    "total": total,
+                },
+            )
 
         return ListPaymentsResponse(
-            payments=[PaymentResponse.from_entity(p) for p in payments],
-            total=total,
+            payments=PaymentResponse.from_entities(payments),
+            next_cursor=next_cursor,
             limit=request.limit,
-            offset=request.offset,
+            total=total,
         )
\ No newline at end of file
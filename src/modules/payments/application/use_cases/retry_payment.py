@@ -1,5 +1,11 @@
 """Retry payment use case."""
 
+from datetime import datetime, timezone
+from logging import INFO
+from typing import NoReturn
+
+from src.modules.payments.domain.payment import Payment
+from src.modules.payments.domain.retry_eligibility import RetryEligibility
 from src.modules.payments.domain.repository import PaymentRepository
 from src.modules.payments.domain.errors import (
     PaymentNotFoundError,
@@ -10,17 +16,17 @@ from src.modules.payments.application.ports.payment_processor import PaymentProc
 from src.modules.payments.application.dtos import RetryPaymentRequest, PaymentResponse
 from src.shared.utils.logger import Logger
 
+logger = Logger("USE_CASE:RETRY_PAYMENT")
+
 
 class RetryPaymentUseCase:
     """
     Use case for retrying a failed payment.
 
     This use case orchestrates:
-    1. Payment retrieval and validation
-    2. Retry eligibility check (status and retry count)
-    3. Retry counter increment
-    4. Payment re-processing (with retry probability)
-    5. Status update based on result
+    1. Atomic retry eligibility check and retry counter increment
+    2. Payment re-processing (with retry probability)
+    3. Status update based on result, unless a concurrent retry settled it
     """
 
     def __init__(
@@ -37,7 +43,6 @@ class RetryPaymentUseCase:
         """
         self._payment_repository = payment_repository
         self._payment_processor = payment_processor
-        self._logger = Logger("USE_CASE:RETRY_PAYMENT")
 
     async def execute(self, request: RetryPaymentRequest) -> PaymentResponse:
         """
@@ -54,95 +59,132 @@ class RetryPaymentUseCase:
             CannotRetryPaymentError: If payment is not in FAILED status
             MaxRetriesExceededError: If max retries already reached
         """
-        self._logger.info(
-            "Retrying payment",
-            extra={"payment_id": request.payment_id},
-        )
-
-        # Step 1: Retrieve payment
-        payment = await self._payment_repository.find_by_id(request.payment_id)
-
-        if not payment:
-            self._logger.warning(
-                "Payment not found",
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Retrying payment",
                 extra={"payment_id": request.payment_id},
             )
-            raise PaymentNotFoundError(request.payment_id)
 
-        self._logger.info(
-            "Payment found",
-            extra={
-                "payment_id": payment.payment_id,
-                "status": payment.status.value,
-                "retries": payment.retries,
-            },
-        )
+        # One timestamp for every change made by this retry
+        now = datetime.now(timezone.utc)
 
-        # Step 2: Check if can retry (this raises appropriate errors)
-        if not payment.can_retry():
-            if not payment.status.can_retry():
-                self._logger.warning(
-                    "Cannot retry - invalid status",
-                    extra={
-                        "payment_id": payment.payment_id,
-                        "status": payment.status.value,
-                    },
-                )
-                raise CannotRetryPaymentError(
-                    payment_id=payment.payment_id,
-                    current_status=payment.status.value,
-                )
-            else:
-                self._logger.warning(
-                    "Cannot retry - max retries exceeded",
-                    extra={
-                        "payment_id": payment.payment_id,
-                        "retries": payment.retries,
-                    },
-                )
-                raise MaxRetriesExceededError(
-                    payment_id=payment.payment_id,
-                    max_retries=payment.MAX_RETRIES,
-                )
-
-        # Step 3: Increment retry counter
-        payment.increment_retries()
-
-        self._logger.info(
-            "Retry counter incremented",
-            extra={
-                "payment_id": payment.payment_id,
-                "retries": payment.retries,
-            },
+        # Step 1: Check eligibility and increment the retry counter
+        # in a single atomic update
+        payment = await self._payment_repository.try_increment_retry(
+            request.payment_id,
+            max_retries=Payment.MAX_RETRIES,
+            now=now,
         )
 
-        # Step 4: Process retry (with different probability than initial)
+        if not payment:
+            # Only the failure path pays for a second read, to explain why
+            await self._raise_not_retryable(request.payment_id)
+
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Retry counter incremented",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "retries": payment.retries,
+                },
+            )
+
+        # Step 2: Process retry (with different probability than initial)
         processing_result = await self._payment_processor.process_retry(
             payment_id=payment.payment_id,
-            amount=payment.amount,
+            amount_minor=payment.amount_minor,
         )
 
-        self._logger.info(
-            "Retry processing completed",
-            extra={
-                "payment_id": payment.payment_id,
-                "success": processing_result.success,
-                "message": processing_result.message,
-            },
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Retry processing completed",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "success": processing_result.success,
+                    "message": processing_result.message,
+                },
+            )
+
+        # Step 3: Update status based on result; the retry counter is
+        # already persisted, so only the status needs writing
+        payment.process_retry_result(success=processing_result.success, now=now)
+
+        updated = await self._payment_repository.update_status(
+            payment.payment_id,
+            payment.status,
+            now,
+            expected_retries=payment.retries,
         )
 
-        # Step 5: Update status based on result
-        payment.process_retry_result(success=processing_result.success)
+        if not updated:
+            # A concurrent retry settled the payment first; report its outcome
+            logger.warning(
+                "Retry outcome superseded by a concurrent retry",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "status": payment.status,
+                    "retries": payment.retries,
+                },
+            )
+            current = await self._payment_repository.find_by_id(payment.payment_id)
+            if not current:
+                raise PaymentNotFoundError(payment.payment_id)
+            return PaymentResponse.from_entity(current)
+
+        if logger.isEnabledFor(INFO):
+            logger.info(
+                "Payment status updated after retry",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "status": payment.status,
+                    "retries": payment.retries,
+                },
+            )
+
+        return PaymentResponse.from_entity(payment)
 
-        await self._payment_repository.update(payment)
+    async def _raise_not_retryable(self, payment_id: str) -> NoReturn:
+        """
+        Raise the error explaining why a payment could not be retried.
 
-        self._logger.info(
-            "Payment status updated after retry",
+        Args:
+            payment_id: The payment that failed the retry check
+
+        Raises:
+            PaymentNotFoundError: If payment does not exist
+            CannotRetryPaymentError: If payment is not in FAILED status
+            MaxRetriesExceededError: If max retries already reached
+        """
+        payment = await self._payment_repository.find_by_id(payment_id)
+
+        if not payment:
+            logger.warning(
+                "Payment not found",
+                extra={"payment_id": payment_id},
+            )
+            raise PaymentNotFoundError(payment_id)
+
+        if payment.retry_eligibility() == RetryEligibility.MAX_RETRIES:
+            logger.warning(
+                "Cannot retry - max retries exceeded",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "retries": payment.retries,
+                },
+            )
+            raise MaxRetriesExceededError(
+                payment_id=payment.payment_id,
+                max_retries=payment.MAX_RETRIES,
+            )
+
+        logger.warning(
+            "Cannot retry - invalid status",
             extra={
                 "payment_id": payment.payment_id,
-                "status": payment.status.value,
-                "retries": payment.retries,
+                "status": payment.status,
             },
         )
-
-        return PaymentResponse.from_entity(payment)
\ No newline at end of file
+        raise CannotRetryPaymentError(
+            payment_id=payment.payment_id,
+            current_status=payment.status,
+        )
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Payments domain layer - entities, value objects, and business rules."""
 
 from src.modules.payments.domain.payment_status import PaymentStatus
+from src.modules.payments.domain.retry_eligibility import RetryEligibility
 from src.modules.payments.domain.errors import (
     PaymentError,
     PaymentNotFoundError,
@@ -13,6 +14,7 @@ from src.modules.payments.domain.repository import PaymentRepository
 
 __all__ = [
     "PaymentStatus",
+    "RetryEligibility",
     "PaymentError",
     "PaymentNotFoundError",
     "PaymentValidationError",
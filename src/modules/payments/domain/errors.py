@@ -2,6 +2,8 @@
 
 from typing import Any
 
+import orjson
+
 
 class PaymentError(Exception):
     """Base class for payment domain errors."""
@@ -27,26 +29,36 @@ class PaymentError(Exception):
         self.code = code
         self.status_code = status_code
         self.details = details or {}
+        self._dict: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert error to dictionary for API responses."""
-        result = {
-            "success": False,
-            "error": {
-                "code": self.code,
-                "message": self.message,
-            },
-        }
+        """
+        Convert error to dictionary for API responses.
+
+        The dictionary is built on first call and reused afterwards;
+        callers must treat it as read-only.
+        """
+        if self._dict is None:
+            error = {"code": self.code, "message": self.message}
+            if self.details:
+                error["details"] = self.details
+            self._dict = {"success": False, "error": error}
 
-        if self.details:
-            result["error"]["details"] = self.details
+        return self._dict
 
-        return result
+    def to_json(self) -> bytes:
+        """Serialize the API response payload to JSON bytes."""
+        return orjson.dumps(self.to_dict())
 
 
 class PaymentNotFoundError(PaymentError):
     """Raised when a payment is not found."""
 
+    # Constant parts of the serialized payload; only the id varies per error
+    _JSON_PREFIX = b'{"success":false,"error":{"code":"PAYMENT_NOT_FOUND","message":'
+    _JSON_DETAILS = b',"details":{"payment_id":'
+    _JSON_SUFFIX = b"}}}"
+
     def __init__(self, payment_id: str) -> None:
         """
         Initialize payment not found error.
@@ -61,6 +73,16 @@ class PaymentNotFoundError(PaymentError):
             details={"payment_id": payment_id},
         )
 
+    def to_json(self) -> bytes:
+        """Serialize the payload by patching the id into a prebuilt template."""
+        return b"".join((
+            self._JSON_PREFIX,
+            orjson.dumps(self.message),
+            self._JSON_DETAILS,
+            orjson.dumps(self.details["payment_id"]),
+            self._JSON_SUFFIX,
+        ))
+
 
 class PaymentValidationError(PaymentError):
     """Raised when payment data validation fails."""
@@ -124,4 +146,4 @@ class MaxRetriesExceededError(PaymentError):
                 "payment_id": payment_id,
                 "max_retries": max_retries,
             },
-        )
\ No newline at end of file
+        )
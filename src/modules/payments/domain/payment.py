@@ -1,11 +1,12 @@
 """Payment entity - the core domain object."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Self
+from typing import Iterable, Self
 from uuid import uuid4
 
 from src.modules.payments.domain.payment_status import PaymentStatus
+from src.modules.payments.domain.retry_eligibility import RetryEligibility
 from src.modules.payments.domain.errors import (
     PaymentValidationError,
     CannotRetryPaymentError,
@@ -23,6 +24,21 @@ class Payment:
 
     MAX_RETRIES = 3
 
+    # Amounts are kept as an integer number of minor units (e.g. cents)
+    AMOUNT_EXPONENT = 2
+
+    # No per-instance __dict__: list endpoints hydrate many payments at once
+    __slots__ = (
+        "_payment_id",
+        "_reference",
+        "_amount_minor",
+        "_currency",
+        "_status",
+        "_retries",
+        "_created_at",
+        "_updated_at",
+    )
+
     def __init__(
         self,
         payment_id: str,
@@ -37,12 +53,13 @@ class Payment:
         """
         Initialize a Payment instance.
 
-        Use the create() factory method for new payments.
-        This constructor is for reconstituting from persistence.
+        Use the create() factory method for new payments. Adapters loading
+        persisted payments should use hydrate() or restore_batch(), which
+        skip validation and normalization; never create().
         """
         self._payment_id = payment_id
         self._reference = reference
-        self._amount = amount
+        self._amount_minor = int(amount.scaleb(self.AMOUNT_EXPONENT).to_integral_value())
         self._currency = currency
         self._status = status
         self._retries = retries
@@ -78,7 +95,14 @@ class Payment:
             )
 
         # Validate amount
-        if amount <= Decimal("0"):
+        scaled = amount.scaleb(cls.AMOUNT_EXPONENT)
+        if scaled != scaled.to_integral_value():
+            raise PaymentValidationError(
+                message=f"Amount cannot have more than {cls.AMOUNT_EXPONENT} decimal places",
+                field="amount",
+            )
+
+        if scaled <= 0:
             raise PaymentValidationError(
                 message="Amount must be greater than zero",
                 field="amount",
@@ -91,7 +115,7 @@ class Payment:
                 field="currency",
             )
 
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
 
         return cls(
             payment_id=str(uuid4()),
@@ -104,6 +128,92 @@ class Payment:
             updated_at=now,
         )
 
+    @classmethod
+    def hydrate(
+        cls,
+        row: tuple[str, str, int, str, PaymentStatus, int, datetime, datetime],
+    ) -> Self:
+        """
+        Rebuild a single persisted payment.
+
+        Persisted data is trusted and already normalized, so validation,
+        id generation and the amount conversion are all skipped. Callers
+        pass amount_minor as an int and status as a PaymentStatus.
+
+        Args:
+            row: Tuple of (payment_id, reference, amount_minor, currency,
+                status, retries, created_at, updated_at)
+
+        Returns:
+            The Payment instance
+        """
+        (
+            payment_id,
+            reference,
+            amount_minor,
+            currency,
+            status,
+            retries,
+            created_at,
+            updated_at,
+        ) = row
+
+        payment = cls.__new__(cls)
+        payment._payment_id = payment_id
+        payment._reference = reference
+        payment._amount_minor = amount_minor
+        payment._currency = currency
+        payment._status = status
+        payment._retries = retries
+        payment._created_at = created_at
+        payment._updated_at = updated_at
+        return payment
+
+    @classmethod
+    def restore_batch(
+        cls,
+        rows: Iterable[tuple[str, str, int, str, PaymentStatus, int, datetime, datetime]],
+    ) -> list[Self]:
+        """
+        Rebuild many persisted payments at once.
+
+        Same contract as hydrate(), with the per-row lookups hoisted out
+        of the loop.
+
+        Args:
+            rows: Tuples of (payment_id, reference, amount_minor, currency,
+                status, retries, created_at, updated_at)
+
+        Returns:
+            List of Payment instances, in the same order
+        """
+        new = cls.__new__
+        payments = []
+        append = payments.append
+
+        for (
+            payment_id,
+            reference,
+            amount_minor,
+            currency,
+            status,
+            retries,
+            created_at,
+            updated_at,
+        ) in rows:
+            payment = new(cls)
+            payment._payment_id = payment_id
+            payment._reference = reference
+            payment._amount_minor = amount_minor
+            payment._currency = currency
+            payment._status = status
+            payment._retries = retries
+            payment._created_at = created_at
+            payment._updated_at = updated_at
+            append(payment)
+
+        return payments
+
     # ==================== Properties ====================
 
     @property
@@ -118,8 +228,13 @@ class Payment:
 
     @property
     def amount(self) -> Decimal:
-        """Get payment amount."""
-        return self._amount
+        """Get payment amount (rebuilt from minor units on access)."""
+        return Decimal(self._amount_minor).scaleb(-self.AMOUNT_EXPONENT)
+
+    @property
+    def amount_minor(self) -> int:
+        """Get payment amount in minor units (e.g. cents)."""
+        return self._amount_minor
 
     @property
     def currency(self) -> str:
@@ -148,6 +263,20 @@ class Payment:
 
     # ==================== Behavior ====================
 
+    def retry_eligibility(self) -> RetryEligibility:
+        """
+        Check whether this payment can be retried, and why not.
+
+        Returns:
+            RetryEligibility.OK if payment is FAILED and has retries
+            remaining, otherwise the reason it cannot be retried
+        """
+        if not self._status.can_retry():
+            return RetryEligibility.WRONG_STATUS
+        if self._retries >= self.MAX_RETRIES:
+            return RetryEligibility.MAX_RETRIES
+        return RetryEligibility.OK
+
     def can_retry(self) -> bool:
         """
         Check if this payment can be retried.
@@ -155,55 +284,73 @@ class Payment:
         Returns:
             True if payment is FAILED and has retries remaining
         """
-        return (
-            self._status.can_retry() and
-            self._retries < self.MAX_RETRIES
-        )
+        return self.retry_eligibility() == RetryEligibility.OK
+
+    def mark_as_success(self, now: datetime | None = None) -> None:
+        """
+        Mark payment as successfully processed.
 
-    def mark_as_success(self) -> None:
-        """Mark payment as successfully processed."""
+        Args:
+            now: Timestamp of the change (defaults to the current UTC time)
+        """
         self._status = PaymentStatus.SUCCESS
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
-    def mark_as_failed(self) -> None:
-        """Mark payment as failed."""
+    def mark_as_failed(self, now: datetime | None = None) -> None:
+        """
+        Mark payment as failed.
+
+        Args:
+            now: Timestamp of the change (defaults to the current UTC time)
+        """
         self._status = PaymentStatus.FAILED
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
-    def mark_as_exhausted(self) -> None:
-        """Mark payment as exhausted (no more retries allowed)."""
+    def mark_as_exhausted(self, now: datetime | None = None) -> None:
+        """
+        Mark payment as exhausted (no more retries allowed).
+
+        Args:
+            now: Timestamp of the change (defaults to the current UTC time)
+        """
         self._status = PaymentStatus.EXHAUSTED
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
-    def increment_retries(self) -> None:
+    def increment_retries(self, now: datetime | None = None) -> None:
         """
         Increment the retry counter.
 
+        Args:
+            now: Timestamp of the change (defaults to the current UTC time)
+
         Raises:
             CannotRetryPaymentError: If payment is not in FAILED status
             MaxRetriesExceededError: If max retries already reached
         """
-        if not self._status.can_retry():
+        eligibility = self.retry_eligibility()
+
+        if eligibility == RetryEligibility.WRONG_STATUS:
             raise CannotRetryPaymentError(
                 payment_id=self._payment_id,
-                current_status=self._status.value,
+                current_status=self._status,
             )
 
-        if self._retries >= self.MAX_RETRIES:
+        if eligibility == RetryEligibility.MAX_RETRIES:
             raise MaxRetriesExceededError(
                 payment_id=self._payment_id,
                 max_retries=self.MAX_RETRIES,
             )
 
         self._retries += 1
-        self._updated_at = datetime.utcnow()
+        self._updated_at = now or datetime.now(timezone.utc)
 
-    def process_retry_result(self, success: bool) -> None:
+    def process_retry_result(self, success: bool, now: datetime | None = None) -> None:
         """
         Process the result of a retry attempt.
 
         Args:
             success: Whether the retry was successful
+            now: Timestamp of the change (defaults to the current UTC time)
 
         This method handles the state transition after a retry:
         - If success: transition to SUCCESS
@@ -211,11 +358,11 @@ class Payment:
         - If failed and retries = max: transition to EXHAUSTED
         """
         if success:
-            self.mark_as_success()
+            self.mark_as_success(now)
         elif self._retries >= self.MAX_RETRIES:
-            self.mark_as_exhausted()
+            self.mark_as_exhausted(now)
         else:
-            self.mark_as_failed()
+            self.mark_as_failed(now)
 
     # ==================== Serialization ====================
 
@@ -224,9 +371,9 @@ class Payment:
         return {
             "payment_id": self._payment_id,
             "reference": self._reference,
-            "amount": float(self._amount),
+            "amount_minor": self._amount_minor,
             "currency": self._currency,
-            "status": self._status.value,
+            "status": self._status,
             "retries": self._retries,
             "created_at": self._created_at.isoformat(),
             "updated_at": self._updated_at.isoformat(),
@@ -236,13 +383,19 @@ class Payment:
         """String representation for debugging."""
         return (
             f"Payment(id={self._payment_id}, "
-            f"amount={self._amount} {self._currency}, "
-            f"status={self._status.value}, "
+            f"amount={self.amount} {self._currency}, "
+            f"status={self._status}, "
             f"retries={self._retries})"
         )
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on payment ID."""
+        if self is other:
+            return True
         if not isinstance(other, Payment):
             return False
-        return self._payment_id == other._payment_id
\ No newline at end of file
+        return self._payment_id == other._payment_id
+
+    def __hash__(self) -> int:
+        """Hash by payment ID, consistent with __eq__."""
+        return hash(self._payment_id)
\ No newline at end of file
@@ -1,9 +1,9 @@
 """Payment status enumeration."""
 
-from enum import Enum
+from enum import StrEnum
 
 
-class PaymentStatus(str, Enum):
+class PaymentStatus(StrEnum):
     """
     Possible states for a payment.
 
@@ -16,6 +16,9 @@ class PaymentStatus(str, Enum):
 
     Final states: SUCCESS, EXHAUSTED
     Non-final states: PENDING, FAILED
+
+    Members are plain strings (str() and formatting give the value), so
+    they can be logged, stored and serialized without going through .value.
     """
 
     PENDING = "PENDING"
@@ -29,4 +32,4 @@ class PaymentStatus(str, Enum):
 
     def can_retry(self) -> bool:
         """Check if payment in this status can be retried."""
-        return self == PaymentStatus.FAILED
\ No newline at end of file
+        return self == PaymentStatus.FAILED
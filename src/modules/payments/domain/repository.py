@@ -1,22 +1,25 @@
 """Payment repository interface (port)."""
 
-from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Protocol, runtime_checkable
 
 from src.modules.payments.domain.payment import Payment
+from src.modules.payments.domain.payment_status import PaymentStatus
 
 
-class PaymentRepository(ABC):
+@runtime_checkable
+class PaymentRepository(Protocol):
     """
-    Abstract repository for Payment persistence.
+    Repository for Payment persistence.
 
     This is a PORT in hexagonal architecture terms.
     Concrete implementations (adapters) will be in the infrastructure layer.
+    Adapters satisfy it structurally and do not need to inherit from it.
     """
 
-    @abstractmethod
     async def save(self, payment: Payment) -> None:
         """
-        Persist a new payment.
+        Persist a payment, updating it if it already exists.
 
         Args:
             payment: The payment entity to save
@@ -24,9 +27,20 @@ class PaymentRepository(ABC):
         Raises:
             RepositoryError: If persistence fails
         """
-        pass
+        ...
+
+    async def save_many(self, payments: list[Payment]) -> None:
+        """
+        Persist many payments at once, with the same semantics as save().
+
+        Args:
+            payments: The payment entities to save
+
+        Raises:
+            RepositoryError: If persistence fails
+        """
+        ...
 
-    @abstractmethod
     async def find_by_id(self, payment_id: str) -> Payment | None:
         """
         Find a payment by its ID.
@@ -37,9 +51,8 @@ class PaymentRepository(ABC):
         Returns:
             The payment if found, None otherwise
         """
-        pass
+        ...
 
-    @abstractmethod
     async def update(self, payment: Payment) -> None:
         """
         Update an existing payment.
@@ -50,37 +63,103 @@ class PaymentRepository(ABC):
         Raises:
             RepositoryError: If update fails
         """
-        pass
+        ...
+
+    async def update_status(
+        self,
+        payment_id: str,
+        status: PaymentStatus,
+        now: datetime,
+        expected_retries: int,
+    ) -> bool:
+        """
+        Record the outcome of a retry, unless a concurrent retry settled it.
+
+        The status is only written while the payment is still FAILED. A
+        SUCCESS is always recorded then; any other status only if the
+        retry counter still equals expected_retries, so the outcome of an
+        older attempt can't overwrite a newer one.
+
+        Args:
+            payment_id: The unique payment identifier
+            status: The new status
+            now: Timestamp of the change
+            expected_retries: Retry counter set when this retry started
+
+        Returns:
+            True if the status was written, False if the guard didn't match
+
+        Raises:
+            RepositoryError: If update fails
+        """
+        ...
+
+    async def try_increment_retry(
+        self,
+        payment_id: str,
+        max_retries: int,
+        now: datetime | None = None,
+    ) -> Payment | None:
+        """
+        Atomically increment the retry counter of a retryable payment.
+
+        The increment only applies if the payment is FAILED and has
+        fewer than max_retries retries, checked in the same operation.
+
+        Args:
+            payment_id: The unique payment identifier
+            max_retries: Maximum number of retries allowed
+            now: Timestamp of the change (defaults to the current UTC time)
+
+        Returns:
+            The updated payment, or None if it does not exist or
+            cannot be retried
+        """
+        ...
 
-    @abstractmethod
     async def find_all(
         self,
         status: str | None = None,
+        cursor: str | None = None,
         limit: int = 100,
-        offset: int = 0,
-    ) -> list[Payment]:
+    ) -> tuple[list[Payment], str | None]:
         """
-        Find all payments with optional filtering.
+        Find payments, newest first, with optional filtering.
+
+        Uses keyset pagination: the cursor marks the last payment of the
+        previous page, so deep pages cost the same as the first one.
 
         Args:
             status: Filter by payment status (optional)
+            cursor: Opaque cursor returned by a previous call (optional)
             limit: Maximum number of results
-            offset: Number of results to skip
 
         Returns:
-            List of payments matching the criteria
+            Tuple of (payments, next cursor or None if this is the last page)
+
+        Raises:
+            PaymentValidationError: If the cursor is malformed
         """
-        pass
+        ...
 
-    @abstractmethod
-    async def count(self, status: str | None = None) -> int:
+    async def count(self, status: str | None = None, exact: bool = False) -> int:
         """
         Count payments with optional filtering.
 
         Args:
             status: Filter by payment status (optional)
+            exact: Require an up-to-date count, bypassing any caching
 
         Returns:
             Number of payments matching the criteria
         """
-        pass
\ No newline at end of file
+        ...
+
+    async def count_by_status(self) -> dict[PaymentStatus, int]:
+        """
+        Count payments of every status at once.
+
+        Returns:
+            Number of payments per status, including statuses with none
+        """
+        ...
@@ -0,0 +1,15 @@
+"""Retry eligibility enumeration."""
+
+from enum import IntEnum
+
+
+class RetryEligibility(IntEnum):
+    """
+    Outcome of checking whether a payment can be retried.
+
+    OK is falsy, so any other value is the reason a retry is refused.
+    """
+
+    OK = 0
+    WRONG_STATUS = 1
+    MAX_RETRIES = 2
@@ -1,7 +1,9 @@
 """FastAPI routes for payments module."""
 
+from logging import INFO
+
 from fastapi import APIRouter, Header, Query, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from src.modules.payments.infrastructure.http.schemas import (
     CreatePaymentRequestSchema,
@@ -9,6 +11,7 @@ from src.modules.payments.infrastructure.http.schemas import (
     ListPaymentsResponseSchema,
     ErrorResponseSchema,
 )
+from src.modules.payments.domain.payment_status import PaymentStatus
 from src.modules.payments.application.dtos import (
     CreatePaymentRequest,
     GetPaymentRequest,
@@ -26,25 +29,66 @@ from src.shared.utils.logger import Logger
 router = APIRouter(prefix="/payments", tags=["Payments"])
 logger = Logger("HTTP:PAYMENTS")
 
+# Create status code indexed by is_new: existing payment -> 200, new -> 201
+_CREATE_STATUS = (status.HTTP_200_OK, status.HTTP_201_CREATED)
+
+# OpenAPI response documentation, built once and shared between routes
+_NOT_FOUND_RESPONSE = {
+    "model": ErrorResponseSchema,
+    "description": "Payment not found",
+}
+
+_CREATE_RESPONSES = {
+    200: {
+        "model": PaymentResponseSchema,
+        "description": "Payment previously created (idempotency)",
+    },
+    201: {
+        "model": PaymentResponseSchema,
+        "description": "Payment created successfully",
+    },
+    400: {
+        "model": ErrorResponseSchema,
+        "description": "Validation error",
+    },
+}
+
+_LIST_RESPONSES = {
+    200: {
+        "model": ListPaymentsResponseSchema,
+        "description": "Page of payments",
+    },
+    400: {
+        "model": ErrorResponseSchema,
+        "description": "Invalid query parameters",
+    },
+}
+
+_GET_RESPONSES = {
+    200: {
+        "model": PaymentResponseSchema,
+        "description": "Payment found",
+    },
+    404: _NOT_FOUND_RESPONSE,
+}
+
+_RETRY_RESPONSES = {
+    200: {
+        "model": PaymentResponseSchema,
+        "description": "Retry processed",
+    },
+    404: _NOT_FOUND_RESPONSE,
+    409: {
+        "model": ErrorResponseSchema,
+        "description": "Payment cannot be retried",
+    },
+}
+
 
 @router.post(
     "",
-    response_model=PaymentResponseSchema,
     status_code=status.HTTP_201_CREATED,
-    responses={
-        200: {
-            "model": PaymentResponseSchema,
-            "description": "Payment previously created (idempotency)",
-        },
-        201: {
-            "model": PaymentResponseSchema,
-            "description": "Payment created successfully",
-        },
-        400: {
-            "model": ErrorResponseSchema,
-            "description": "Validation error",
-        },
-    },
+    responses=_CREATE_RESPONSES,
     summary="Create a new payment",
     description="""
     Create a new payment with the provided details.
@@ -64,19 +108,23 @@ async def create_payment(
     idempotency_key: str = Header(
         ...,
         alias="Idempotency-Key",
-        description="Unique key to ensure idempotent requests",
+        min_length=8,
+        max_length=128,
+        pattern=r"^[A-Za-z0-9_\-]+$",
+        description="Unique key to ensure idempotent requests (8-128 chars: letters, digits, '-', '_')",
         examples=["unique-key-123"],
     ),
 ):
     """Create a new payment."""
-    logger.info(
-        "Received create payment request",
-        extra={
-            "reference": body.reference,
-            "amount": float(body.amount),
-            "currency": body.currency,
-        },
-    )
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "Received create payment request",
+            extra={
+                "reference": body.reference,
+                "amount": str(body.amount),
+                "currency": body.currency,
+            },
+        )
 
     request = CreatePaymentRequest(
         reference=body.reference,
@@ -87,34 +135,27 @@ async def create_payment(
 
     response, is_new = await use_case.execute(request)
 
-    logger.info(
-        "Payment creation completed",
-        extra={
-            "payment_id": response.payment_id,
-            "status": response.status,
-            "is_new": is_new,
-        },
-    )
-
-    if is_new:
-        return response.to_dict()
-    else:
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content=response.to_dict(),
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "Payment creation completed",
+            extra={
+                "payment_id": response.payment_id,
+                "status": response.status,
+                "is_new": is_new,
+            },
         )
 
+    return Response(
+        content=response.to_json(),
+        status_code=_CREATE_STATUS[is_new],
+        media_type="application/json",
+    )
+
 
 @router.get(
     "",
-    response_model=ListPaymentsResponseSchema,
     status_code=status.HTTP_200_OK,
-    responses={
-        400: {
-            "model": ErrorResponseSchema,
-            "description": "Invalid status filter",
-        },
-    },
+    responses=_LIST_RESPONSES,
     summary="List all payments",
     description="""
     Retrieve a paginated list of payments with optional filtering.
@@ -124,12 +165,13 @@ async def create_payment(
 
     **Pagination:**
     - `limit`: Maximum number of results (default: 100)
-    - `offset`: Number of results to skip (default: 0)
+    - `cursor`: Value of `next_cursor` from the previous page
+    - `include_total`: Also count all matching payments (default: false)
     """,
 )
 async def list_payments(
     use_case: ListPaymentsUseCaseDep,
-    status: str | None = Query(
+    status: PaymentStatus | None = Query(
         default=None,
         description="Filter by payment status",
         examples=["FAILED"],
@@ -140,51 +182,51 @@ async def list_payments(
         le=1000,
         description="Maximum results per page",
     ),
-    offset: int = Query(
-        default=0,
-        ge=0,
-        description="Number of results to skip",
+    cursor: str | None = Query(
+        default=None,
+        description="Cursor returned as next_cursor by the previous page",
+    ),
+    include_total: bool = Query(
+        default=False,
+        description="Include the total number of matching payments",
     ),
 ):
     """List all payments with optional filtering."""
-    logger.info(
-        "Received list payments request",
-        extra={
-            "status": status,
-            "limit": limit,
-            "offset": offset,
-        },
-    )
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "Received list payments request",
+            extra={
+                "status": status,
+                "limit": limit,
+                "cursor": cursor,
+            },
+        )
 
     request = ListPaymentsRequest(
         status=status,
         limit=limit,
-        offset=offset,
+        cursor=cursor,
+        include_total=include_total,
     )
 
     response = await use_case.execute(request)
 
-    logger.info(
-        "List payments completed",
-        extra={
-            "count": len(response.payments),
-            "total": response.total,
-        },
-    )
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "List payments completed",
+            extra={
+                "count": len(response.payments),
+                "has_more": response.next_cursor is not None,
+            },
+        )
 
-    return response.to_dict()
+    return Response(content=response.to_json(), media_type="application/json")
 
 
 @router.get(
     "/{payment_id}",
-    response_model=PaymentResponseSchema,
     status_code=status.HTTP_200_OK,
-    responses={
-        404: {
-            "model": ErrorResponseSchema,
-            "description": "Payment not found",
-        },
-    },
+    responses=_GET_RESPONSES,
     summary="Get payment by ID",
     description="Retrieve a specific payment by its unique identifier.",
 )
@@ -193,39 +235,31 @@ async def get_payment(
     use_case: GetPaymentUseCaseDep,
 ):
     """Get a payment by ID."""
-    logger.info(
-        "Received get payment request",
-        extra={"payment_id": payment_id},
-    )
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "Received get payment request",
+            extra={"payment_id": payment_id},
+        )
 
     request = GetPaymentRequest(payment_id=payment_id)
     response = await use_case.execute(request)
 
-    logger.info(
-        "Get payment completed",
-        extra={
-            "payment_id": response.payment_id,
-            "status": response.status,
-        },
-    )
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "Get payment completed",
+            extra={
+                "payment_id": response.payment_id,
+                "status": response.status,
+            },
+        )
 
-    return response.to_dict()
+    return Response(content=response.to_json(), media_type="application/json")
 
 
 @router.post(
     "/{payment_id}/retry",
-    response_model=PaymentResponseSchema,
     status_code=status.HTTP_200_OK,
-    responses={
-        404: {
-            "model": ErrorResponseSchema,
-            "description": "Payment not found",
-        },
-        409: {
-            "model": ErrorResponseSchema,
-            "description": "Payment cannot be retried",
-        },
-    },
+    responses=_RETRY_RESPONSES,
     summary="Retry a failed payment",
     description="""
     Retry a payment that previously failed.
@@ -242,21 +276,23 @@ async def retry_payment(
     use_case: RetryPaymentUseCaseDep,
 ):
     """Retry a failed payment."""
-    logger.info(
-        "Received retry payment request",
-        extra={"payment_id": payment_id},
-    )
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "Received retry payment request",
+            extra={"payment_id": payment_id},
+        )
 
     request = RetryPaymentRequest(payment_id=payment_id)
     response = await use_case.execute(request)
 
-    logger.info(
-        "Retry payment completed",
-        extra={
-            "payment_id": response.payment_id,
-            "status": response.status,
-            "retries": response.retries,
-        },
-    )
+    if logger.isEnabledFor(INFO):
+        logger.info(
+            "Retry payment completed",
+            extra={
+                "payment_id": response.payment_id,
+                "status": response.status,
+                "retries": response.retries,
+            },
+        )
 
-    return response.to_dict()
\ No newline at end of file
+    return Response(content=response.to_json(), media_type="application/json")
\ No newline at end of file
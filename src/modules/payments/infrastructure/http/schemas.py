@@ -1,7 +1,32 @@
 """Pydantic schemas for HTTP request/response validation."""
 
+from datetime import datetime
 from decimal import Decimal
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+# Upper-cased currency codes, so repeated codes reuse one string
+_UPPER_CACHE: dict[str, str] = {}
+_UPPER_CACHE_MAX_SIZE = 4096
+
+
+def _upper(value: str) -> str:
+    """
+    Upper-case a currency code, reusing previously seen results.
+
+    Args:
+        value: Currency code as received (already validated as a string)
+
+    Returns:
+        The upper-cased currency code
+    """
+    result = _UPPER_CACHE.get(value)
+    if result is None:
+        if len(_UPPER_CACHE) >= _UPPER_CACHE_MAX_SIZE:
+            _UPPER_CACHE.clear()
+        result = _UPPER_CACHE.setdefault(value, value.upper())
+    return result
 
 
 class CreatePaymentRequestSchema(BaseModel):
@@ -17,33 +42,28 @@ class CreatePaymentRequestSchema(BaseModel):
     amount: Decimal = Field(
         ...,
         gt=0,
-        description="Payment amount (must be greater than 0)",
+        max_digits=18,
+        decimal_places=2,
+        description="Payment amount (must be greater than 0, at most 2 decimals)",
         examples=[1500.00],
     )
-    currency: str = Field(
+    currency: Annotated[str, AfterValidator(_upper)] = Field(
         ...,
         min_length=3,
         max_length=3,
-        description="Currency code (exactly 3 characters)",
+        description="Currency code (exactly 3 characters, upper-cased)",
         examples=["MXN"],
     )
 
-    @field_validator("currency")
-    @classmethod
-    def currency_to_upper(cls, v: str) -> str:
-        """Convert currency to uppercase."""
-        return v.upper()
-
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "reference": "FAC-12345",
                 "amount": 1500.00,
                 "currency": "MXN",
             }
-        }
+        },
+    )
 
 
 class PaymentResponseSchema(BaseModel):
@@ -57,9 +77,9 @@ class PaymentResponseSchema(BaseModel):
         ...,
         description="External reference for the bill/contract",
     )
-    amount: float = Field(
+    amount: str = Field(
         ...,
-        description="Payment amount",
+        description="Payment amount as a decimal string (exact, no float rounding)",
     )
     currency: str = Field(
         ...,
@@ -73,30 +93,29 @@ class PaymentResponseSchema(BaseModel):
         ...,
         description="Number of retry attempts",
     )
-    created_at: str = Field(
+    created_at: datetime = Field(
         ...,
         description="Creation timestamp (ISO 8601)",
     )
-    updated_at: str = Field(
+    updated_at: datetime = Field(
         ...,
         description="Last update timestamp (ISO 8601)",
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "payment_id": "550e8400-e29b-41d4-a716-446655440000",
                 "reference": "FAC-12345",
-                "amount": 1500.00,
+                "amount": "1500.00",
                 "currency": "MXN",
                 "status": "FAILED",
                 "retries": 1,
-                "created_at": "2024-01-15T10:30:00",
-                "updated_at": "2024-01-15T10:30:05",
+                "created_at": "2024-01-15T10:30:00+00:00",
+                "updated_at": "2024-01-15T10:30:05+00:00",
             }
-        }
+        },
+    )
 
 
 class ListPaymentsResponseSchema(BaseModel):
@@ -106,17 +125,17 @@ class ListPaymentsResponseSchema(BaseModel):
         ...,
         description="List of payments",
     )
-    total: int = Field(
+    next_cursor: str | None = Field(
         ...,
-        description="Total number of payments matching criteria",
+        description="Cursor for the next page (null on the last page)",
     )
     limit: int = Field(
         ...,
         description="Maximum results per page",
     )
-    offset: int = Field(
-        ...,
-        description="Number of results skipped",
+    total: int | None = Field(
+        default=None,
+        description="Total number of payments matching criteria (only with include_total)",
     )
 
 
@@ -131,11 +150,13 @@ class ErrorDetailSchema(BaseModel):
         ...,
         description="Human-readable error message",
     )
-    details: dict | None = Field(
+    details: dict[str, Any] | None = Field(
         default=None,
         description="Additional error details",
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class ErrorResponseSchema(BaseModel):
     """Schema for error response."""
@@ -149,10 +170,10 @@ class ErrorResponseSchema(BaseModel):
         description="Error information",
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "success": False,
                 "error": {
@@ -161,7 +182,8 @@ class ErrorResponseSchema(BaseModel):
                     "details": {"field": "amount"},
                 },
             }
-        }
+        },
+    )
 
 
 class HealthServiceSchema(BaseModel):
@@ -176,6 +198,8 @@ class HealthServiceSchema(BaseModel):
         description="Error message if unhealthy",
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class HealthResponseSchema(BaseModel):
     """Schema for health check response."""
@@ -193,10 +217,8 @@ class HealthResponseSchema(BaseModel):
         description="Individual service health statuses",
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "timestamp": "2024-01-15T10:30:00",
@@ -205,4 +227,5 @@ class HealthResponseSchema(BaseModel):
                     "redis": {"status": "healthy"},
                 },
             }
-        }
\ No newline at end of file
+        },
+    )
@@ -3,5 +3,11 @@
 from src.modules.payments.infrastructure.persistence.sqlite_payment_repository import (
     SQLitePaymentRepository,
 )
+from src.modules.payments.infrastructure.persistence.cached_payment_repository import (
+    CachedPaymentRepository,
+)
 
-__all__ = ["SQLitePaymentRepository"]
\ No newline at end of file
+__all__ = [
+    "SQLitePaymentRepository",
+    "CachedPaymentRepository",
+]
\ No newline at end of file
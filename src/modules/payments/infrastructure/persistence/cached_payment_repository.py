@@ -0,0 +1,236 @@
+"""In-process caching decorator for PaymentRepository."""
+
+import copy
+from datetime import datetime
+from logging import DEBUG
+
+from cachetools import TTLCache
+
+from src.modules.payments.domain.payment import Payment
+from src.modules.payments.domain.payment_status import PaymentStatus
+from src.modules.payments.domain.repository import PaymentRepository
+from src.shared.utils.logger import Logger
+
+
+class CachedPaymentRepository:
+    """
+    Caching decorator around another PaymentRepository.
+
+    Payments in a final status (SUCCESS, EXHAUSTED) never change, so
+    find_by_id keeps them in an in-process TTL cache. Non-final payments
+    are kept for about a second, which collapses bursts of reads of the
+    same payment. Every write evicts the payment it touches, both before
+    and after the write, and a read that overlaps a write is not cached.
+    Callers always receive their own copy of a cached payment.
+
+    Counts are cached per status for a few seconds and dropped on every
+    write, so repeated listings with totals don't rescan the table. A
+    miss refills the counts of every status from one grouped query.
+    """
+
+    # Key used for count() without a status filter
+    _ALL_STATUSES = "__all__"
+
+    def __init__(
+        self,
+        repository: PaymentRepository,
+        maxsize: int = 10_000,
+        ttl_seconds: int = 60,
+        recent_ttl_seconds: float = 1.0,
+        count_ttl_seconds: int = 5,
+    ) -> None:
+        """
+        Initialize the caching repository.
+
+        Args:
+            repository: The repository to delegate to
+            maxsize: Maximum number of cached payments
+            ttl_seconds: Time-to-live of cached final payments in seconds
+            recent_ttl_seconds: Time-to-live of cached non-final payments
+                in seconds
+            count_ttl_seconds: Time-to-live of cached counts in seconds
+        """
+        self._repository = repository
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._recent: TTLCache = TTLCache(maxsize=maxsize, ttl=recent_ttl_seconds)
+        self._count_cache: TTLCache = TTLCache(maxsize=8, ttl=count_ttl_seconds)
+        # Bumped on every eviction; reads that saw it change don't cache
+        self._generation = 0
+        self._logger = Logger("REPOSITORY:PAYMENT_CACHE")
+
+    def _evict(self, payment_id: str) -> None:
+        """Drop a payment and all cached counts around a write."""
+        self._generation += 1
+        self._cache.pop(payment_id, None)
+        self._recent.pop(payment_id, None)
+        self._count_cache.clear()
+
+    async def save(self, payment: Payment) -> None:
+        """
+        Persist a payment, updating it if it already exists.
+
+        Args:
+            payment: The payment entity to save
+        """
+        self._evict(payment.payment_id)
+        await self._repository.save(payment)
+        self._evict(payment.payment_id)
+
+    async def save_many(self, payments: list[Payment]) -> None:
+        """
+        Persist many payments in one batch.
+
+        Args:
+            payments: The payment entities to save
+        """
+        for payment in payments:
+            self._evict(payment.payment_id)
+        await self._repository.save_many(payments)
+        for payment in payments:
+            self._evict(payment.payment_id)
+
+    async def find_by_id(self, payment_id: str) -> Payment | None:
+        """
+        Find a payment by its ID, serving it from cache when possible.
+
+        Args:
+            payment_id: The unique payment identifier
+
+        Returns:
+            The payment if found, None otherwise
+        """
+        payment = self._cache.get(payment_id) or self._recent.get(payment_id)
+        if payment is not None:
+            if self._logger.isEnabledFor(DEBUG):
+                self._logger.debug("Cache hit", extra={"payment_id": payment_id})
+            return copy.copy(payment)
+
+        generation = self._generation
+        payment = await self._repository.find_by_id(payment_id)
+
+        # A write during the read may have made this row stale
+        if payment is not None and generation == self._generation:
+            cached = copy.copy(payment)
+            if payment.status.is_final():
+                self._cache[payment_id] = cached
+            else:
+                self._recent[payment_id] = cached
+
+        return payment
+
+    async def update(self, payment: Payment) -> None:
+        """
+        Update an existing payment.
+
+        Args:
+            payment: The payment entity with updated values
+        """
+        self._evict(payment.payment_id)
+        await self._repository.update(payment)
+        self._evict(payment.payment_id)
+
+    async def update_status(
+        self,
+        payment_id: str,
+        status: PaymentStatus,
+        now: datetime,
+        expected_retries: int,
+    ) -> bool:
+        """
+        Record the outcome of a retry, unless a concurrent retry settled it.
+
+        Args:
+            payment_id: The unique payment identifier
+            status: The new status
+            now: Timestamp of the change
+            expected_retries: Retry counter set when this retry started
+
+        Returns:
+            True if the status was written, False if the guard didn't match
+        """
+        self._evict(payment_id)
+        updated = await self._repository.update_status(
+            payment_id, status, now, expected_retries
+        )
+        self._evict(payment_id)
+        return updated
+
+    async def try_increment_retry(
+        self,
+        payment_id: str,
+        max_retries: int,
+        now: datetime | None = None,
+    ) -> Payment | None:
+        """
+        Atomically increment the retry counter of a retryable payment.
+
+        Args:
+            payment_id: The unique payment identifier
+            max_retries: Maximum number of retries allowed
+            now: Timestamp of the change (defaults to the current UTC time)
+
+        Returns:
+            The updated payment, or None if it does not exist or
+            cannot be retried
+        """
+        self._evict(payment_id)
+        payment = await self._repository.try_increment_retry(payment_id, max_retries, now)
+        self._evict(payment_id)
+        return payment
+
+    async def find_all(
+        self,
+        status: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[Payment], str | None]:
+        """
+        Find payments, newest first, with optional filtering.
+
+        Args:
+            status: Filter by payment status (optional)
+            cursor: Opaque cursor returned by a previous call (optional)
+            limit: Maximum number of results
+
+        Returns:
+            Tuple of (payments, next cursor or None if this is the last page)
+        """
+        return await self._repository.find_all(status=status, cursor=cursor, limit=limit)
+
+    async def count(self, status: str | None = None, exact: bool = False) -> int:
+        """
+        Count payments with optional filtering.
+
+        Args:
+            status: Filter by payment status (optional)
+            exact: Bypass the short-lived count cache
+
+        Returns:
+            Number of payments matching the criteria
+        """
+        if exact:
+            return await self._repository.count(status=status, exact=True)
+
+        key = status or self._ALL_STATUSES
+        total = self._count_cache.get(key)
+        if total is None:
+            counts = await self.count_by_status()
+            total = counts.get(key, 0) if status else sum(counts.values())
+
+        return total
+
+    async def count_by_status(self) -> dict[PaymentStatus, int]:
+        """
+        Count payments of every status, refreshing the count cache.
+
+        Returns:
+            Number of payments per status, including statuses with none
+        """
+        generation = self._generation
+        counts = await self._repository.count_by_status()
+
+        if generation == self._generation:
+            self._count_cache.update(counts)
+            self._count_cache[self._ALL_STATUSES] = sum(counts.values())
+
+        return counts
@@ -1,21 +1,53 @@
 """SQLite implementation of PaymentRepository."""
 
-from datetime import datetime
-from decimal import Decimal
+import asyncio
+import base64
+from datetime import datetime, timedelta, timezone
+from logging import DEBUG
 
 from src.modules.payments.domain.payment import Payment
 from src.modules.payments.domain.payment_status import PaymentStatus
-from src.modules.payments.domain.repository import PaymentRepository
+from src.modules.payments.domain.errors import PaymentValidationError
 from src.shared.infrastructure.database.sqlite import SQLiteConnection
 from src.shared.utils.logger import Logger
 
 
-class SQLitePaymentRepository(PaymentRepository):
+# Explicit column order, so rows can be unpacked positionally
+_COLUMNS = "payment_id, reference, amount_minor, currency, status, retries, created_at, updated_at"
+
+# Timestamps are stored as INTEGER microseconds since the Unix epoch (UTC)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Most ids per coalesced lookup query, well below SQLite's bound-variable limit
+_LOOKUP_BATCH = 500
+
+# Stored status text -> PaymentStatus member, without going through Enum lookup
+_STATUS_BY_VALUE = {status.value: status for status in PaymentStatus}
+
+# Insert a payment, or update its mutable fields if it already exists
+_UPSERT_SQL = """
+    INSERT INTO payments (
+        payment_id, reference, amount_minor, currency,
+        status, retries, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(payment_id) DO UPDATE SET
+        status = excluded.status,
+        retries = excluded.retries,
+        updated_at = excluded.updated_at
+"""
+
+
+class SQLitePaymentRepository:
     """
     SQLite implementation of the PaymentRepository interface.
 
     This is an ADAPTER in hexagonal architecture terms.
     It implements the PORT defined in the domain layer.
+
+    Concurrent find_by_id calls made in the same event loop iteration
+    are answered by a single query, so a burst of lookups costs one
+    trip to the database thread instead of one per payment.
     """
 
     def __init__(self, connection: SQLiteConnection) -> None:
@@ -27,43 +59,51 @@ class SQLitePaymentRepository(PaymentRepository):
         """
         self._connection = connection
         self._logger = Logger("REPOSITORY:PAYMENT")
+        self._pending_lookups: list[tuple[str, asyncio.Future]] = []
+        # Strong references, so running lookup tasks aren't garbage-collected
+        self._lookup_tasks: set[asyncio.Task] = set()
 
     async def save(self, payment: Payment) -> None:
         """
-        Persist a new payment.
+        Persist a payment, updating its mutable fields if it already exists.
 
         Args:
             payment: The payment entity to save
         """
-        self._logger.debug(
-            "Saving payment",
-            extra={"payment_id": payment.payment_id},
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Saving payment",
+                extra={"payment_id": payment.payment_id},
+            )
 
-        await self._connection.execute(
-            """
-            INSERT INTO payments (
-                payment_id, reference, amount, currency,
-                status, retries, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                payment.payment_id,
-                payment.reference,
-                str(payment.amount),
-                payment.currency,
-                payment.status.value,
-                payment.retries,
-                payment.created_at.isoformat(),
-                payment.updated_at.isoformat(),
-            ),
-        )
+        await self._connection.execute_write(_UPSERT_SQL, self._to_params(payment))
+
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Payment saved",
+                extra={"payment_id": payment.payment_id},
+            )
+
+    async def save_many(self, payments: list[Payment]) -> None:
+        """
+        Persist many payments in a single transaction.
 
-        await self._connection.commit()
+        Args:
+            payments: The payment entities to save
+        """
+        if not payments:
+            return
+
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Saving payments",
+                extra={"count": len(payments)},
+            )
 
-        self._logger.debug(
-            "Payment saved",
-            extra={"payment_id": payment.payment_id},
+        to_params = self._to_params
+        await self._connection.execute_write_many(
+            _UPSERT_SQL,
+            [to_params(payment) for payment in payments],
         )
 
     async def find_by_id(self, payment_id: str) -> Payment | None:
@@ -76,35 +116,99 @@ class SQLitePaymentRepository(PaymentRepository):
         Returns:
             The payment if found, None otherwise
         """
-        self._logger.debug(
-            "Finding payment by ID",
-            extra={"payment_id": payment_id},
-        )
-
-        row = await self._connection.fetch_one(
-            "SELECT * FROM payments WHERE payment_id = ?",
-            (payment_id,),
-        )
-
-        if row is None:
+        if self._logger.isEnabledFor(DEBUG):
             self._logger.debug(
-                "Payment not found",
+                "Finding payment by ID",
                 extra={"payment_id": payment_id},
             )
+
+        row = await self._lookup(payment_id)
+
+        if row is None:
+            if self._logger.isEnabledFor(DEBUG):
+                self._logger.debug(
+                    "Payment not found",
+                    extra={"payment_id": payment_id},
+                )
             return None
 
         payment = self._row_to_entity(row)
 
-        self._logger.debug(
-            "Payment found",
-            extra={
-                "payment_id": payment.payment_id,
-                "status": payment.status.value,
-            },
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Payment found",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "status": payment.status,
+                },
+            )
 
         return payment
 
+    def _lookup(self, payment_id: str) -> asyncio.Future:
+        """
+        Queue a row lookup to run with the others queued this iteration.
+
+        Args:
+            payment_id: The unique payment identifier
+
+        Returns:
+            Future resolving to the row, or None if the payment doesn't exist
+        """
+        loop = asyncio.get_running_loop()
+        if not self._pending_lookups:
+            task = loop.create_task(self._run_lookups())
+            self._lookup_tasks.add(task)
+            task.add_done_callback(self._lookup_tasks.discard)
+
+        future = loop.create_future()
+        self._pending_lookups.append((payment_id, future))
+        return future
+
+    async def _run_lookups(self) -> None:
+        """Fetch every queued payment in as few queries as possible and resolve the lookups."""
+        pending, self._pending_lookups = self._pending_lookups, []
+        payment_ids = tuple(dict.fromkeys(payment_id for payment_id, _ in pending))
+
+        try:
+            rows_by_id = {}
+            for start in range(0, len(payment_ids), _LOOKUP_BATCH):
+                batch = payment_ids[start:start + _LOOKUP_BATCH]
+                rows = await self._connection.fetch_all(
+                    self._lookup_query(len(batch)), batch, read_only=True
+                )
+                rows_by_id.update((row[0], row) for row in rows)
+
+            for payment_id, future in pending:
+                if not future.done():
+                    future.set_result(rows_by_id.get(payment_id))
+        except Exception as exc:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            # Cancelled or interrupted: never leave a waiter pending forever
+            for _, future in pending:
+                if not future.done():
+                    future.cancel()
+
+    @staticmethod
+    def _lookup_query(count: int) -> str:
+        """
+        Build the SELECT for a batch of payment ids.
+
+        Args:
+            count: Number of ids in the batch
+
+        Returns:
+            Query taking the ids as positional parameters
+        """
+        if count == 1:
+            return f"SELECT {_COLUMNS} FROM payments WHERE payment_id = ? LIMIT 1"
+
+        placeholders = ", ".join("?" * count)
+        return f"SELECT {_COLUMNS} FROM payments WHERE payment_id IN ({placeholders})"
+
     async def update(self, payment: Payment) -> None:
         """
         Update an existing payment.
@@ -112,19 +216,20 @@ class SQLitePaymentRepository(PaymentRepository):
         Args:
             payment: The payment entity with updated values
         """
-        self._logger.debug(
-            "Updating payment",
-            extra={
-                "payment_id": payment.payment_id,
-                "status": payment.status.value,
-            },
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Updating payment",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "status": payment.status,
+                },
+            )
 
-        await self._connection.execute(
+        await self._connection.execute_write(
             """
             UPDATE payments
             SET reference = ?,
-                amount = ?,
+                amount_minor = ?,
                 currency = ?,
                 status = ?,
                 retries = ?,
@@ -133,85 +238,227 @@ class SQLitePaymentRepository(PaymentRepository):
             """,
             (
                 payment.reference,
-                str(payment.amount),
+                payment.amount_minor,
                 payment.currency,
-                payment.status.value,
+                payment.status,
                 payment.retries,
-                payment.updated_at.isoformat(),
+                self._to_epoch(payment.updated_at),
                 payment.payment_id,
             ),
         )
 
-        await self._connection.commit()
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Payment updated",
+                extra={"payment_id": payment.payment_id},
+            )
+
+    async def update_status(
+        self,
+        payment_id: str,
+        status: PaymentStatus,
+        now: datetime,
+        expected_retries: int,
+    ) -> bool:
+        """
+        Record the outcome of a retry, unless a concurrent retry settled it.
+
+        Args:
+            payment_id: The unique payment identifier
+            status: The new status
+            now: Timestamp of the change
+            expected_retries: Retry counter set when this retry started
+
+        Returns:
+            True if the status was written, False if the guard didn't match
+        """
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Updating payment status",
+                extra={
+                    "payment_id": payment_id,
+                    "status": status,
+                    "expected_retries": expected_retries,
+                },
+            )
+
+        params = [status, self._to_epoch(now), payment_id, PaymentStatus.FAILED]
+
+        # A success must land even if a later attempt has started; a
+        # failure only belongs to the latest attempt
+        if status == PaymentStatus.SUCCESS:
+            retries_guard = ""
+        else:
+            retries_guard = "AND retries = ?"
+            params.append(expected_retries)
+
+        rows = await self._connection.execute_write(
+            f"""
+            UPDATE payments
+            SET status = ?,
+                updated_at = ?
+            WHERE payment_id = ?
+              AND status = ?
+              {retries_guard}
+            RETURNING payment_id
+            """,
+            tuple(params),
+        )
+
+        if not rows and self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Payment status already settled",
+                extra={"payment_id": payment_id},
+            )
+
+        return bool(rows)
+
+    async def try_increment_retry(
+        self,
+        payment_id: str,
+        max_retries: int,
+        now: datetime | None = None,
+    ) -> Payment | None:
+        """
+        Atomically increment the retry counter of a retryable payment.
+
+        Args:
+            payment_id: The unique payment identifier
+            max_retries: Maximum number of retries allowed
+            now: Timestamp of the change (defaults to the current UTC time)
+
+        Returns:
+            The updated payment, or None if it does not exist or
+            cannot be retried
+        """
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Incrementing payment retries",
+                extra={"payment_id": payment_id},
+            )
 
-        self._logger.debug(
-            "Payment updated",
-            extra={"payment_id": payment.payment_id},
+        rows = await self._connection.execute_write(
+            f"""
+            UPDATE payments
+            SET retries = retries + 1,
+                updated_at = ?
+            WHERE payment_id = ?
+              AND status = ?
+              AND retries < ?
+            RETURNING {_COLUMNS}
+            """,
+            (
+                self._to_epoch(now or datetime.now(timezone.utc)),
+                payment_id,
+                PaymentStatus.FAILED,
+                max_retries,
+            ),
         )
 
+        if not rows:
+            if self._logger.isEnabledFor(DEBUG):
+                self._logger.debug(
+                    "Payment not eligible for retry",
+                    extra={"payment_id": payment_id},
+                )
+            return None
+
+        payment = self._row_to_entity(rows[0])
+
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Payment retries incremented",
+                extra={
+                    "payment_id": payment.payment_id,
+                    "retries": payment.retries,
+                },
+            )
+
+        return payment
+
     async def find_all(
         self,
         status: str | None = None,
+        cursor: str | None = None,
         limit: int = 100,
-        offset: int = 0,
-    ) -> list[Payment]:
+    ) -> tuple[list[Payment], str | None]:
         """
-        Find all payments with optional filtering.
+        Find payments, newest first, with optional filtering.
 
         Args:
             status: Filter by payment status (optional)
+            cursor: Opaque cursor returned by a previous call (optional)
             limit: Maximum number of results
-            offset: Number of results to skip
 
         Returns:
-            List of payments matching the criteria
+            Tuple of (payments, next cursor or None if this is the last page)
+
+        Raises:
+            PaymentValidationError: If the cursor is malformed
         """
-        self._logger.debug(
-            "Finding all payments",
-            extra={"status": status, "limit": limit, "offset": offset},
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Finding all payments",
+                extra={"status": status, "cursor": cursor, "limit": limit},
+            )
+
+        conditions = []
+        params: list = []
 
         if status:
-            query = """
-                SELECT * FROM payments
-                WHERE status = ?
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
-            """
-            params = (status, limit, offset)
-        else:
-            query = """
-                SELECT * FROM payments
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
-            """
-            params = (limit, offset)
+            conditions.append("status = ?")
+            params.append(status)
 
-        rows = await self._connection.fetch_all(query, params)
+        if cursor:
+            conditions.append("(created_at, payment_id) < (?, ?)")
+            params.extend(self._decode_cursor(cursor))
 
-        payments = [self._row_to_entity(row) for row in rows]
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-        self._logger.debug(
-            "Payments found",
-            extra={"count": len(payments)},
-        )
+        # Fetch one extra row to know whether another page exists
+        query = f"""
+            SELECT {_COLUMNS} FROM payments
+            {where}
+            ORDER BY created_at DESC, payment_id DESC
+            LIMIT ?
+        """
+        params.append(limit + 1)
+
+        rows = await self._connection.fetch_all(query, tuple(params), read_only=True)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = self._encode_cursor(last[6], last[0])
+
+        row_values = self._row_values
+        payments = Payment.restore_batch(row_values(row) for row in rows)
+
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Payments found",
+                extra={"count": len(payments), "has_more": next_cursor is not None},
+            )
 
-        return payments
+        return payments, next_cursor
 
-    async def count(self, status: str | None = None) -> int:
+    async def count(self, status: str | None = None, exact: bool = False) -> int:
         """
         Count payments with optional filtering.
 
         Args:
             status: Filter by payment status (optional)
+            exact: Require an up-to-date count, bypassing any caching
 
         Returns:
             Number of payments matching the criteria
         """
-        self._logger.debug(
-            "Counting payments",
-            extra={"status": status},
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Counting payments",
+                extra={"status": status},
+            )
 
         if status:
             query = "SELECT COUNT(*) as count FROM payments WHERE status = ?"
@@ -220,34 +467,178 @@ class SQLitePaymentRepository(PaymentRepository):
             query = "SELECT COUNT(*) as count FROM payments"
             params = ()
 
-        row = await self._connection.fetch_one(query, params)
+        row = await self._connection.fetch_one(query, params, read_only=True)
 
         count = row["count"] if row else 0
 
-        self._logger.debug(
-            "Payments counted",
-            extra={"count": count},
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Payments counted",
+                extra={"count": count},
+            )
 
         return count
 
+    async def count_by_status(self) -> dict[PaymentStatus, int]:
+        """
+        Count payments of every status with a single grouped query.
+
+        Returns:
+            Number of payments per status, including statuses with none
+        """
+        rows = await self._connection.fetch_all(
+            "SELECT status, COUNT(*) FROM payments GROUP BY status",
+            read_only=True,
+        )
+
+        counts = dict.fromkeys(PaymentStatus, 0)
+        for status, total in rows:
+            counts[_STATUS_BY_VALUE[status]] = total
+
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug("Payments counted by status", extra=counts)
+
+        return counts
+
+    @staticmethod
+    def _encode_cursor(created_at: int, payment_id: str) -> str:
+        """
+        Build an opaque pagination cursor from a row's sort key.
+
+        Args:
+            created_at: Stored creation timestamp of the row
+            payment_id: Payment ID of the row
+
+        Returns:
+            URL-safe cursor string
+        """
+        raw = f"{created_at}|{payment_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[int, str]:
+        """
+        Extract the sort key from a pagination cursor.
+
+        Args:
+            cursor: Cursor built by _encode_cursor
+
+        Returns:
+            Tuple of (created_at, payment_id)
+
+        Raises:
+            PaymentValidationError: If the cursor is malformed
+        """
+        try:
+            created_at, payment_id = (
+                base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            )
+            created_at = int(created_at)
+        except ValueError:
+            raise PaymentValidationError(
+                message="Invalid pagination cursor",
+                field="cursor",
+            )
+        return created_at, payment_id
+
+    @classmethod
+    def _to_params(cls, payment: Payment) -> tuple:
+        """
+        Convert a Payment entity to upsert parameters.
+
+        Args:
+            payment: The payment entity
+
+        Returns:
+            Parameters in _UPSERT_SQL column order
+        """
+        to_epoch = cls._to_epoch
+        return (
+            payment.payment_id,
+            payment.reference,
+            payment.amount_minor,
+            payment.currency,
+            payment.status,
+            payment.retries,
+            to_epoch(payment.created_at),
+            to_epoch(payment.updated_at),
+        )
+
     def _row_to_entity(self, row) -> Payment:
         """
         Convert database row to Payment entity.
 
         Args:
-            row: Database row (dict-like)
+            row: Database row selected with _COLUMNS
 
         Returns:
             Payment entity
         """
-        return Payment(
-            payment_id=row["payment_id"],
-            reference=row["reference"],
-            amount=Decimal(row["amount"]),
-            currency=row["currency"],
-            status=PaymentStatus(row["status"]),
-            retries=row["retries"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-        )
\ No newline at end of file
+        return Payment.hydrate(self._row_values(row))
+
+    @classmethod
+    def _row_values(
+        cls,
+        row,
+    ) -> tuple[str, str, int, str, PaymentStatus, int, datetime, datetime]:
+        """
+        Convert a database row to the field tuple Payment.hydrate expects.
+
+        Args:
+            row: Database row selected with _COLUMNS
+
+        Returns:
+            Tuple of (payment_id, reference, amount_minor, currency,
+            status, retries, created_at, updated_at)
+        """
+        (
+            payment_id,
+            reference,
+            amount_minor,
+            currency,
+            status,
+            retries,
+            created_at,
+            updated_at,
+        ) = row
+        from_epoch = cls._from_epoch
+        return (
+            payment_id,
+            reference,
+            amount_minor,
+            currency,
+            _STATUS_BY_VALUE[status],
+            retries,
+            from_epoch(created_at),
+            from_epoch(updated_at),
+        )
+
+    @staticmethod
+    def _to_epoch(value: datetime) -> int:
+        """
+        Convert a datetime to its stored form.
+
+        Naive datetimes are taken to be UTC.
+
+        Args:
+            value: Datetime to store
+
+        Returns:
+            Microseconds since the Unix epoch
+        """
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - _EPOCH) // _ONE_MICROSECOND
+
+    @staticmethod
+    def _from_epoch(value: int) -> datetime:
+        """
+        Convert a stored timestamp to an aware UTC datetime.
+
+        Args:
+            value: Microseconds since the Unix epoch
+
+        Returns:
+            Timezone-aware datetime
+        """
+        return _EPOCH + timedelta(microseconds=value)
@@ -1,8 +1,12 @@
 """Redis-based idempotency service implementation."""
 
+from logging import DEBUG, INFO
 from typing import Any
 
-from src.modules.payments.application.ports.idempotency_service import IdempotencyService
+from src.modules.payments.application.ports.idempotency_service import (
+    ClaimResult,
+    IdempotencyService,
+)
 from src.shared.infrastructure.cache.redis_client import RedisClient
 from src.shared.utils.logger import Logger
 
@@ -39,28 +43,73 @@ class RedisIdempotencyService(IdempotencyService):
         Returns:
             The stored result if key exists, None otherwise
         """
-        self._logger.debug(
-            "Checking idempotency key",
-            extra={"idempotency_key": idempotency_key},
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Checking idempotency key",
+                extra={"idempotency_key": idempotency_key},
+            )
 
         result = await self._redis.get_idempotency_key(idempotency_key)
 
         if result:
-            self._logger.info(
-                "Idempotency key found",
+            if self._logger.isEnabledFor(INFO):
+                self._logger.info(
+                    "Idempotency key found",
+                    extra={
+                        "idempotency_key": idempotency_key,
+                        "payment_id": result.get("payment_id"),
+                    },
+                )
+        else:
+            if self._logger.isEnabledFor(DEBUG):
+                self._logger.debug(
+                    "Idempotency key not found",
+                    extra={"idempotency_key": idempotency_key},
+                )
+
+        return result
+
+    async def try_claim(self, idempotency_key: str, ttl_ms: int = 10000) -> ClaimResult:
+        """
+        Atomically check an idempotency key and lock it if unused.
+
+        Args:
+            idempotency_key: The idempotency key to claim
+            ttl_ms: Lock time-to-live in milliseconds
+
+        Returns:
+            ClaimResult with the stored result (if any) and the lock
+            token when the lock was acquired
+        """
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Claiming idempotency key",
                 extra={
                     "idempotency_key": idempotency_key,
-                    "payment_id": result.get("payment_id"),
+                    "ttl_ms": ttl_ms,
                 },
             )
-        else:
-            self._logger.debug(
-                "Idempotency key not found",
+
+        result, lock_token = await self._redis.claim_idempotency_key(
+            idempotency_key, ttl_ms
+        )
+
+        if result:
+            if self._logger.isEnabledFor(INFO):
+                self._logger.info(
+                    "Idempotency key found",
+                    extra={
+                        "idempotency_key": idempotency_key,
+                        "payment_id": result.get("payment_id"),
+                    },
+                )
+        elif lock_token is None:
+            self._logger.warning(
+                "Failed to acquire lock",
                 extra={"idempotency_key": idempotency_key},
             )
 
-        return result
+        return ClaimResult(existing_result=result, lock_token=lock_token)
 
     async def save_result(
         self,
@@ -74,22 +123,59 @@ class RedisIdempotencyService(IdempotencyService):
             idempotency_key: The idempotency key
             result: The result to store
         """
-        self._logger.debug(
-            "Saving idempotency result",
-            extra={
-                "idempotency_key": idempotency_key,
-                "payment_id": result.get("payment_id"),
-            },
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Saving idempotency result",
+                extra={
+                    "idempotency_key": idempotency_key,
+                    "payment_id": result.get("payment_id"),
+                },
+            )
 
         await self._redis.set_idempotency_key(idempotency_key, result)
 
-        self._logger.info(
-            "Idempotency result saved",
-            extra={"idempotency_key": idempotency_key},
+        if self._logger.isEnabledFor(INFO):
+            self._logger.info(
+                "Idempotency result saved",
+                extra={"idempotency_key": idempotency_key},
+            )
+
+    async def save_result_and_release(
+        self,
+        idempotency_key: str,
+        result: dict[str, Any],
+        lock_token: str,
+    ) -> None:
+        """
+        Save result for an idempotency key and release its lock.
+
+        Args:
+            idempotency_key: The idempotency key
+            result: The result to store
+            lock_token: Token returned when the lock was acquired
+        """
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Saving idempotency result and releasing lock",
+                extra={
+                    "idempotency_key": idempotency_key,
+                    "payment_id": result.get("payment_id"),
+                },
+            )
+
+        await self._redis.set_idempotency_key_and_release_lock(
+            idempotency_key, result, lock_token
         )
 
-    async def acquire_lock(self, idempotency_key: str, ttl_ms: int = 10000) -> bool:
+        if self._logger.isEnabledFor(INFO):
+            self._logger.info(
+                "Idempotency result saved",
+                extra={"idempotency_key": idempotency_key},
+            )
+
+    async def acquire_lock(
+        self, idempotency_key: str, ttl_ms: int = 10000
+    ) -> str | None:
         """
         Acquire a distributed lock for an idempotency key.
 
@@ -101,50 +187,55 @@ class RedisIdempotencyService(IdempotencyService):
             ttl_ms: Lock time-to-live in milliseconds
 
         Returns:
-            True if lock was acquired, False otherwise
+            The lock token if the lock was acquired, None otherwise
         """
         lock_name = f"idempotency:{idempotency_key}"
 
-        self._logger.debug(
-            "Acquiring lock",
-            extra={
-                "idempotency_key": idempotency_key,
-                "ttl_ms": ttl_ms,
-            },
-        )
-
-        acquired = await self._redis.acquire_lock(lock_name, ttl_ms)
-
-        if acquired:
+        if self._logger.isEnabledFor(DEBUG):
             self._logger.debug(
-                "Lock acquired",
-                extra={"idempotency_key": idempotency_key},
+                "Acquiring lock",
+                extra={
+                    "idempotency_key": idempotency_key,
+                    "ttl_ms": ttl_ms,
+                },
             )
+
+        lock_token = await self._redis.acquire_lock(lock_name, ttl_ms)
+
+        if lock_token is not None:
+            if self._logger.isEnabledFor(DEBUG):
+                self._logger.debug(
+                    "Lock acquired",
+                    extra={"idempotency_key": idempotency_key},
+                )
         else:
             self._logger.warning(
                 "Failed to acquire lock",
                 extra={"idempotency_key": idempotency_key},
             )
 
-        return acquired
+        return lock_token
 
-    async def release_lock(self, idempotency_key: str) -> None:
+    async def release_lock(self, idempotency_key: str, lock_token: str) -> None:
         """
         Release a distributed lock.
 
         Args:
             idempotency_key: The idempotency key to unlock
+            lock_token: Token returned when the lock was acquired
         """
         lock_name = f"idempotency:{idempotency_key}"
 
-        self._logger.debug(
-            "Releasing lock",
-            extra={"idempotency_key": idempotency_key},
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Releasing lock",
+                extra={"idempotency_key": idempotency_key},
+            )
 
-        await self._redis.release_lock(lock_name)
+        await self._redis.release_lock(lock_name, lock_token)
 
-        self._logger.debug(
-            "Lock released",
-            extra={"idempotency_key": idempotency_key},
-        )
\ No newline at end of file
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Lock released",
+                extra={"idempotency_key": idempotency_key},
+            )
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import random
 from decimal import Decimal
+from logging import INFO
 
 from src.modules.payments.application.ports.payment_processor import (
     PaymentProcessor,
@@ -25,14 +26,18 @@ class SimulatedPaymentProcessor(PaymentProcessor):
 
     # Threshold for initial processing success
     AMOUNT_THRESHOLD = Decimal("1000")
+    # Same threshold in minor units, compared against amount_minor
+    AMOUNT_THRESHOLD_MINOR = 100_000
 
     def __init__(self) -> None:
         """Initialize the simulated processor."""
         self._settings = get_settings()
         self._logger = Logger("SERVICE:PAYMENT_PROCESSOR")
         self._retry_success_probability = self._settings.retry_success_probability
+        # Own generator (seeded from os.urandom), not the shared module-level one
+        self._random = random.Random().random
 
-    async def process(self, payment_id: str, amount: Decimal) -> ProcessingResult:
+    async def process(self, payment_id: str, amount_minor: int) -> ProcessingResult:
         """
         Process a payment (initial attempt).
 
@@ -42,49 +47,55 @@ class SimulatedPaymentProcessor(PaymentProcessor):
 
         Args:
             payment_id: The payment identifier
-            amount: The payment amount
+            amount_minor: The payment amount in minor units (cents)
 
         Returns:
             ProcessingResult indicating success or failure
         """
-        self._logger.info(
-            "Processing payment",
-            extra={
-                "payment_id": payment_id,
-                "amount": float(amount),
-                "threshold": float(self.AMOUNT_THRESHOLD),
-            },
-        )
-
-        # Simulate processing delay (in real system, this would call external API)
-        # await asyncio.sleep(0.1)
-
-        if amount <= self.AMOUNT_THRESHOLD:
+        if self._logger.isEnabledFor(INFO):
             self._logger.info(
-                "Payment processed successfully",
+                "Processing payment",
                 extra={
                     "payment_id": payment_id,
-                    "reason": "Amount within threshold",
+                    "amount_minor": amount_minor,
+                    "threshold_minor": self.AMOUNT_THRESHOLD_MINOR,
                 },
             )
+
+        # Simulate processing delay (in real system, this would call external API)
+        # await asyncio.sleep(0.1)
+
+        if amount_minor <= self.AMOUNT_THRESHOLD_MINOR:
+            if self._logger.isEnabledFor(INFO):
+                self._logger.info(
+                    "Payment processed successfully",
+                    extra={
+                        "payment_id": payment_id,
+                        "reason": "Amount within threshold",
+                    },
+                )
             return ProcessingResult(
                 success=True,
                 message="Payment processed successfully",
             )
         else:
-            self._logger.info(
-                "Payment processing failed",
-                extra={
-                    "payment_id": payment_id,
-                    "reason": "Amount exceeds threshold",
-                },
-            )
+            if self._logger.isEnabledFor(INFO):
+                self._logger.info(
+                    "Payment processing failed",
+                    extra={
+                        "payment_id": payment_id,
+                        "reason": "Amount exceeds threshold",
+                    },
+                )
             return ProcessingResult(
                 success=False,
-                message=f"Payment failed: amount {amount} exceeds threshold {self.AMOUNT_THRESHOLD}",
+                message=(
+                    f"Payment failed: amount {Decimal(amount_minor).scaleb(-2)} "
+                    f"exceeds threshold {self.AMOUNT_THRESHOLD}"
+                ),
             )
 
-    async def process_retry(self, payment_id: str, amount: Decimal) -> ProcessingResult:
+    async def process_retry(self, payment_id: str, amount_minor: int) -> ProcessingResult:
         """
         Process a payment retry.
 
@@ -94,40 +105,50 @@ class SimulatedPaymentProcessor(PaymentProcessor):
 
         Args:
             payment_id: The payment identifier
-            amount: The payment amount
+            amount_minor: The payment amount in minor units (cents)
 
         Returns:
             ProcessingResult indicating success or failure
         """
-        self._logger.info(
-            "Processing payment retry",
-            extra={
-                "payment_id": payment_id,
-                "amount": float(amount),
-                "success_probability": self._retry_success_probability,
-            },
-        )
+        if self._logger.isEnabledFor(INFO):
+            self._logger.info(
+                "Processing payment retry",
+                extra={
+                    "payment_id": payment_id,
+                    "amount_minor": amount_minor,
+                    "success_probability": self._retry_success_probability,
+                },
+            )
 
         # Simulate processing delay
         # await asyncio.sleep(0.1)
 
-        # Random success based on configured probability
-        success = random.random() < self._retry_success_probability
+        # Random success based on configured probability; a probability
+        # of 0 or 1 needs no random draw
+        probability = self._retry_success_probability
+        if probability >= 1.0:
+            success = True
+        elif probability <= 0.0:
+            success = False
+        else:
+            success = self._random() < probability
 
         if success:
-            self._logger.info(
-                "Payment retry succeeded",
-                extra={"payment_id": payment_id},
-            )
+            if self._logger.isEnabledFor(INFO):
+                self._logger.info(
+                    "Payment retry succeeded",
+                    extra={"payment_id": payment_id},
+                )
             return ProcessingResult(
                 success=True,
                 message="Payment retry processed successfully",
             )
         else:
-            self._logger.info(
-                "Payment retry failed",
-                extra={"payment_id": payment_id},
-            )
+            if self._logger.isEnabledFor(INFO):
+                self._logger.info(
+                    "Payment retry failed",
+                    extra={"payment_id": payment_id},
+                )
             return ProcessingResult(
                 success=False,
                 message="Payment retry failed: simulated temporary failure",
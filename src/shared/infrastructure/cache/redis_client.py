@@ -1,13 +1,47 @@
 """Redis async client for caching and distributed locks."""
 
-import json
+from logging import DEBUG
 from typing import Any
+from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
 
 from src.config.settings import get_settings
 from src.shared.utils.logger import Logger
 
+# Returns {1, result} if the idempotency key holds a result, otherwise
+# tries SET NX PX on the lock key with token ARGV[2] and returns {0, 1|0}.
+CLAIM_IDEMPOTENCY_SCRIPT = """
+local result = redis.call('GET', KEYS[1])
+if result then
+    return {1, result}
+end
+if redis.call('SET', KEYS[2], ARGV[2], 'PX', ARGV[1], 'NX') then
+    return {0, 1}
+end
+return {0, 0}
+"""
+
+# Deletes the lock key KEYS[1] only if it still holds our token ARGV[1],
+# so an expired lock re-acquired by another request is left alone.
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Stores the result under KEYS[1] with a TTL of ARGV[2] seconds and
+# releases the lock key KEYS[2] if it still holds our token ARGV[3].
+SAVE_AND_RELEASE_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+if redis.call('GET', KEYS[2]) == ARGV[3] then
+    redis.call('DEL', KEYS[2])
+end
+return 1
+"""
+
 
 class RedisClient:
     """
@@ -47,23 +81,45 @@ class RedisClient:
             },
         )
 
-        self._client = redis.Redis(
+        # hiredis is used for parsing replies when installed; the pool is
+        # sized to the worker's concurrency so sockets are reused
+        pool = redis.ConnectionPool(
             host=self._settings.redis_host,
             port=self._settings.redis_port,
+            max_connections=self._settings.redis_max_connections,
             decode_responses=True,
+            socket_keepalive=True,
+            health_check_interval=30,
         )
+        self._client = redis.Redis(connection_pool=pool)
 
         # Test connection
         await self._client.ping()
 
+        # Register scripts (sent once, then invoked via EVALSHA)
+        self._claim_script = self._client.register_script(CLAIM_IDEMPOTENCY_SCRIPT)
+        self._release_lock_script = self._client.register_script(RELEASE_LOCK_SCRIPT)
+        self._save_and_release_script = self._client.register_script(
+            SAVE_AND_RELEASE_SCRIPT
+        )
+
+        # While connected, plain reads and deletes go straight to the
+        # client, skipping _ensure_connected on every call
+        self.get = self._client.get
+        self.delete = self._client.delete
+
         self._logger.info("Redis connected")
 
     async def disconnect(self) -> None:
         """Close Redis connection."""
         if self._client is not None:
             self._logger.info("Disconnecting from Redis")
-            await self._client.close()
+            # The pool was created here, so close it with the client
+            await self._client.close(close_connection_pool=True)
             self._client = None
+            # Restore the checking methods defined on the class
+            vars(self).pop("get", None)
+            vars(self).pop("delete", None)
             self._logger.info("Redis disconnected")
 
     def _ensure_connected(self) -> None:
@@ -89,7 +145,7 @@ class RedisClient:
     async def set(
         self,
         key: str,
-        value: str,
+        value: str | bytes,
         ttl_seconds: int | None = None,
     ) -> None:
         """
@@ -144,7 +200,7 @@ class RedisClient:
         """
         value = await self.get(key)
         if value:
-            return json.loads(value)
+            return orjson.loads(value)
         return None
 
     async def set_json(
@@ -161,7 +217,7 @@ class RedisClient:
             value: The dictionary to store as JSON
             ttl_seconds: Time-to-live in seconds (optional)
         """
-        await self.set(key, json.dumps(value), ttl_seconds)
+        await self.set(key, orjson.dumps(value), ttl_seconds)
 
     # ==================== Distributed Locks ====================
 
@@ -169,51 +225,59 @@ class RedisClient:
         self,
         lock_name: str,
         ttl_ms: int = 10000,
-    ) -> bool:
+    ) -> str | None:
         """
         Acquire a distributed lock.
 
-        Uses SET NX (set if not exists) for atomic lock acquisition.
+        Uses SET NX (set if not exists) for atomic lock acquisition. The
+        lock holds a random token, so only its holder can release it.
 
         Args:
             lock_name: Name of the lock
             ttl_ms: Lock time-to-live in milliseconds
 
         Returns:
-            True if lock acquired, False otherwise
+            The lock token if the lock was acquired, None otherwise
         """
         self._ensure_connected()
 
         lock_key = f"lock:{lock_name}"
+        token = uuid4().hex
         result = await self._client.set(
             lock_key,
-            "1",
+            token,
             px=ttl_ms,
             nx=True,
         )
 
         acquired = result is not None
 
-        self._logger.debug(
-            f"Lock {'acquired' if acquired else 'not available'}",
-            extra={"lock_name": lock_name},
-        )
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                f"Lock {'acquired' if acquired else 'not available'}",
+                extra={"lock_name": lock_name},
+            )
 
-        return acquired
+        return token if acquired else None
 
-    async def release_lock(self, lock_name: str) -> None:
+    async def release_lock(self, lock_name: str, token: str) -> None:
         """
         Release a distributed lock.
 
+        The lock is only deleted if it still holds the given token; after
+        its TTL expired another holder may own it.
+
         Args:
             lock_name: Name of the lock to release
+            token: Token returned when the lock was acquired
         """
         self._ensure_connected()
 
         lock_key = f"lock:{lock_name}"
-        await self._client.delete(lock_key)
+        await self._release_lock_script(keys=[lock_key], args=[token])
 
-        self._logger.debug("Lock released", extra={"lock_name": lock_name})
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug("Lock released", extra={"lock_name": lock_name})
 
     # ==================== Idempotency ====================
 
@@ -230,6 +294,47 @@ class RedisClient:
         idempotency_key = f"idempotency:{key}"
         return await self.get_json(idempotency_key)
 
+    async def claim_idempotency_key(
+        self,
+        key: str,
+        ttl_ms: int = 10000,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Get the stored result for an idempotency key or lock it.
+
+        Runs as a single Lua script, so the check and the lock
+        acquisition cost one round trip and cannot interleave.
+
+        Args:
+            key: The idempotency key
+            ttl_ms: Lock time-to-live in milliseconds
+
+        Returns:
+            Tuple of (stored result or None, lock token or None)
+        """
+        self._ensure_connected()
+
+        idempotency_key = f"idempotency:{key}"
+        lock_key = f"lock:idempotency:{key}"
+        token = uuid4().hex
+        found, value = await self._claim_script(
+            keys=[idempotency_key, lock_key],
+            args=[ttl_ms, token],
+        )
+
+        if found:
+            return orjson.loads(value), None
+
+        acquired = bool(value)
+
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                f"Lock {'acquired' if acquired else 'not available'}",
+                extra={"lock_name": f"idempotency:{key}"},
+            )
+
+        return None, token if acquired else None
+
     async def set_idempotency_key(
         self,
         key: str,
@@ -246,11 +351,46 @@ class RedisClient:
         ttl = self._settings.idempotency_ttl_seconds
         await self.set_json(idempotency_key, result, ttl)
 
-        self._logger.debug(
-            "Idempotency key stored",
-            extra={"key": key, "ttl_seconds": ttl},
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Idempotency key stored",
+                extra={"key": key, "ttl_seconds": ttl},
+            )
+
+    async def set_idempotency_key_and_release_lock(
+        self,
+        key: str,
+        result: dict[str, Any],
+        token: str,
+    ) -> None:
+        """
+        Store result for an idempotency key and release its lock.
+
+        Runs as a single Lua script, so both writes cost one round trip
+        and are applied atomically.
+
+        Args:
+            key: The idempotency key
+            result: The result to store
+            token: Token returned when the lock was acquired
+        """
+        self._ensure_connected()
+
+        idempotency_key = f"idempotency:{key}"
+        lock_key = f"lock:idempotency:{key}"
+        ttl = self._settings.idempotency_ttl_seconds
+
+        await self._save_and_release_script(
+            keys=[idempotency_key, lock_key],
+            args=[orjson.dumps(result), ttl, token],
         )
 
+        if self._logger.isEnabledFor(DEBUG):
+            self._logger.debug(
+                "Idempotency key stored and lock released",
+                extra={"key": key, "ttl_seconds": ttl},
+            )
+
     # ==================== Health Check ====================
 
     async def health_check(self) -> dict:
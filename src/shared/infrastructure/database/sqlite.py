@@ -1,7 +1,13 @@
 """SQLite async connection manager."""
 
-import aiosqlite
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from pathlib import Path
+from typing import AsyncIterator
+
+import aiosqlite
 
 from src.config.settings import get_settings
 from src.shared.utils.logger import Logger
@@ -13,16 +19,65 @@ class SQLiteConnection:
 
     Manages database connections and provides methods for
     executing queries and managing transactions.
+
+    Writes go through a single read-write connection. In WAL mode,
+    read-only queries can run in parallel on a small pool of read-only
+    connections (see fetch_one/fetch_all with read_only=True).
+
+    Every write goes through execute_write/execute_write_many and is
+    group committed: writes queued while a commit is in progress are
+    applied together in the next transaction. Anything else that uses the
+    read-write connection waits for the open transaction to finish.
     """
 
     _instance: "SQLiteConnection | None" = None
     _connection: aiosqlite.Connection | None = None
 
+    # Per-connection cache tuning, applied to the writer and every reader
+    CACHE_PRAGMAS = (
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA cache_size = -64000",
+        "PRAGMA mmap_size = 268435456",
+    )
+
+    # Payments table definition; {table} lets migrations build a copy.
+    # Timestamps are microseconds since the Unix epoch (UTC).
+    PAYMENTS_TABLE_SQL = """
+        CREATE TABLE IF NOT EXISTS {table} (
+            payment_id TEXT PRIMARY KEY,
+            reference TEXT NOT NULL,
+            amount_minor INTEGER NOT NULL,
+            currency TEXT NOT NULL CHECK(length(currency) = 3),
+            status TEXT NOT NULL DEFAULT 'PENDING'
+                CHECK(status IN ('PENDING', 'SUCCESS', 'FAILED', 'EXHAUSTED')),
+            retries INTEGER NOT NULL DEFAULT 0
+                CHECK(retries >= 0 AND retries <= 3),
+            created_at INTEGER NOT NULL,
+            updated_at INTEGER NOT NULL
+        )
+    """
+
+    # Stored in PRAGMA user_version once the schema is up to date; bump it
+    # whenever _initialize_schema changes
+    SCHEMA_VERSION = 1
+
+    # Most writes applied in one group-commit transaction
+    MAX_WRITE_BATCH = 256
+
+    # Accepted values for PRAGMA synchronous (it cannot take bound parameters)
+    SYNCHRONOUS_LEVELS = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
     def __init__(self) -> None:
         """Initialize SQLite connection manager."""
         self._settings = get_settings()
         self._logger = Logger("SQLITE")
         self._db_path = self._settings.database_path
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle_readers: asyncio.Queue | None = None
+        self._pending_writes: list[tuple[str, tuple | list, bool, asyncio.Future]] = []
+        self._write_task: asyncio.Task | None = None
+        # Held while a group-commit transaction is open on the writer
+        self._writer_lock = asyncio.Lock()
 
     @classmethod
     def get_instance(cls) -> "SQLiteConnection":
@@ -53,31 +108,112 @@ class SQLiteConnection:
         # Enable foreign keys
         await self._connection.execute("PRAGMA foreign_keys = ON")
 
+        # WAL with synchronous=NORMAL only fsyncs at checkpoints, not on
+        # every commit; the rest keeps hot pages and temp data in memory
+        await self._configure_pragmas()
+
         # Initialize schema
         await self._initialize_schema()
 
+        # Open readers last, once the database file and WAL exist
+        await self._open_readers()
+
         self._logger.info("SQLite connected and schema initialized")
 
+    async def _open_readers(self) -> None:
+        """Open the pool of read-only connections, if configured."""
+        pool_size = self._settings.sqlite_read_pool_size
+        if pool_size <= 0 or self._db_path == ":memory:":
+            return
+
+        uri = f"{Path(self._db_path).resolve().as_uri()}?mode=ro"
+        self._readers = []
+        self._idle_readers = asyncio.Queue()
+
+        for _ in range(pool_size):
+            reader = await aiosqlite.connect(uri, uri=True)
+            reader.row_factory = aiosqlite.Row
+            for pragma in self.CACHE_PRAGMAS:
+                await reader.execute(pragma)
+            self._readers.append(reader)
+            self._idle_readers.put_nowait(reader)
+
+    @asynccontextmanager
+    async def acquire_reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow a read-only connection from the pool.
+
+        Falls back to the read-write connection when no pool is configured,
+        once no group-commit transaction is open on it.
+
+        Yields:
+            A connection to run read-only queries on
+        """
+        if self._connection is None:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        if self._idle_readers is None:
+            async with self._writer_lock:
+                yield self._connection
+            return
+
+        reader = await self._idle_readers.get()
+        try:
+            yield reader
+        finally:
+            self._idle_readers.put_nowait(reader)
+
+    async def _configure_pragmas(self) -> None:
+        """
+        Tune journaling, durability and caching for this connection.
+
+        Raises:
+            ValueError: If the configured synchronous level is not valid
+        """
+        synchronous = self._settings.sqlite_synchronous.upper()
+        if synchronous not in self.SYNCHRONOUS_LEVELS:
+            raise ValueError(
+                f"Invalid SQLITE_SYNCHRONOUS '{synchronous}', "
+                f"expected one of {sorted(self.SYNCHRONOUS_LEVELS)}"
+            )
+
+        await self._connection.execute("PRAGMA journal_mode = WAL")
+        await self._connection.execute(f"PRAGMA synchronous = {synchronous}")
+        for pragma in self.CACHE_PRAGMAS:
+            await self._connection.execute(pragma)
+
     async def _initialize_schema(self) -> None:
-        """Create database tables if they don't exist."""
+        """
+        Create and migrate database tables, unless already up to date.
+
+        The schema version is kept in PRAGMA user_version, so a database
+        already at SCHEMA_VERSION skips the DDL, migrations and ANALYZE.
+        """
+        cursor = await self._connection.execute("PRAGMA user_version")
+        (user_version,) = await cursor.fetchone()
+        if user_version == self.SCHEMA_VERSION:
+            return
+
+        await self._connection.execute(
+            self.PAYMENTS_TABLE_SQL.format(table="payments")
+        )
+
+        await self._migrate_amount_to_minor_units()
+        await self._migrate_timestamps_to_epoch()
+
+        # Composite indexes serve keyset pagination (newest first) with and
+        # without a status filter; they supersede the single-column ones
+        await self._connection.execute("DROP INDEX IF EXISTS idx_payments_status")
+        await self._connection.execute("DROP INDEX IF EXISTS idx_payments_created_at")
+
         await self._connection.execute("""
-            CREATE TABLE IF NOT EXISTS payments (
-                payment_id TEXT PRIMARY KEY,
-                reference TEXT NOT NULL,
-                amount TEXT NOT NULL,
-                currency TEXT NOT NULL CHECK(length(currency) = 3),
-                status TEXT NOT NULL DEFAULT 'PENDING'
-                    CHECK(status IN ('PENDING', 'SUCCESS', 'FAILED', 'EXHAUSTED')),
-                retries INTEGER NOT NULL DEFAULT 0 
-                    CHECK(retries >= 0 AND retries <= 3),
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
+            CREATE INDEX IF NOT EXISTS idx_payments_status_created_at
+            ON payments(status, created_at DESC, payment_id DESC)
         """)
 
         await self._connection.execute("""
-            CREATE INDEX IF NOT EXISTS idx_payments_status 
-            ON payments(status)
+            CREATE INDEX IF NOT EXISTS idx_payments_created_at_id
+            ON payments(created_at DESC, payment_id DESC)
         """)
 
         await self._connection.execute("""
@@ -85,107 +221,328 @@ class SQLiteConnection:
             ON payments(reference)
         """)
 
-        await self._connection.execute("""
-            CREATE INDEX IF NOT EXISTS idx_payments_created_at 
-            ON payments(created_at)
-        """)
+        # Refresh planner statistics so the composite indexes are chosen;
+        # analysis_limit bounds the cost on large tables
+        await self._connection.execute("PRAGMA analysis_limit = 400")
+        await self._connection.execute("ANALYZE payments")
 
+        await self._connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
         await self._connection.commit()
 
+    async def _migrate_amount_to_minor_units(self) -> None:
+        """
+        Convert a legacy TEXT amount column to INTEGER minor units.
+
+        Databases created before amounts were stored in cents have an
+        amount column holding decimal strings. The values are converted
+        with Decimal, so large amounts don't lose precision, and the old
+        column is dropped. Runs once; later startups find no amount column.
+        """
+        cursor = await self._connection.execute("PRAGMA table_info(payments)")
+        columns = {row[1] for row in await cursor.fetchall()}
+        if "amount" not in columns:
+            return
+
+        self._logger.info("Migrating payment amounts to minor units")
+
+        await self._connection.execute(
+            "ALTER TABLE payments ADD COLUMN amount_minor INTEGER NOT NULL DEFAULT 0"
+        )
+
+        cursor = await self._connection.execute(
+            "SELECT payment_id, amount FROM payments"
+        )
+        rows = await cursor.fetchall()
+        await self._connection.executemany(
+            "UPDATE payments SET amount_minor = ? WHERE payment_id = ?",
+            [
+                (int(Decimal(amount).scaleb(2)), payment_id)
+                for payment_id, amount in rows
+            ],
+        )
+
+        await self._connection.execute("ALTER TABLE payments DROP COLUMN amount")
+
+    async def _migrate_timestamps_to_epoch(self) -> None:
+        """
+        Convert legacy TEXT timestamps to INTEGER epoch microseconds.
+
+        SQLite cannot change a column's type, so the table is rebuilt:
+        rows are copied into a new table with converted timestamps, which
+        then replaces the old one. Indexes are recreated afterwards by
+        _initialize_schema.
+        """
+        cursor = await self._connection.execute("PRAGMA table_info(payments)")
+        column_types = {row[1]: row[2] for row in await cursor.fetchall()}
+        if column_types.get("created_at") != "TEXT":
+            return
+
+        self._logger.info("Migrating payment timestamps to epoch microseconds")
+
+        await self._connection.execute("DROP TABLE IF EXISTS payments_new")
+        await self._connection.execute(
+            self.PAYMENTS_TABLE_SQL.format(table="payments_new")
+        )
+
+        columns = (
+            "payment_id, reference, amount_minor, currency, "
+            "status, retries, created_at, updated_at"
+        )
+        cursor = await self._connection.execute(f"SELECT {columns} FROM payments")
+        rows = await cursor.fetchall()
+
+        to_epoch = self._legacy_timestamp_to_epoch
+        await self._connection.executemany(
+            f"INSERT INTO payments_new ({columns}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (*fields, to_epoch(created_at), to_epoch(updated_at))
+                for *fields, created_at, updated_at in rows
+            ],
+        )
+
+        await self._connection.execute("DROP TABLE payments")
+        await self._connection.execute("ALTER TABLE payments_new RENAME TO payments")
+
+    @staticmethod
+    def _legacy_timestamp_to_epoch(value: str) -> int:
+        """
+        Convert a stored ISO 8601 timestamp to epoch microseconds.
+
+        Rows written before timestamps were timezone-aware are naive UTC.
+
+        Args:
+            value: ISO 8601 timestamp from the database
+
+        Returns:
+            Microseconds since the Unix epoch
+        """
+        parsed = datetime.fromisoformat(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        return (parsed - epoch) // timedelta(microseconds=1)
+
     async def disconnect(self) -> None:
         """Close database connection."""
         if self._connection is not None:
             self._logger.info("Disconnecting from SQLite")
+            # Let queued writes commit before the connection goes away
+            if self._write_task is not None:
+                await self._write_task
+            for reader in self._readers:
+                await reader.close()
+            self._readers = []
+            self._idle_readers = None
+            # Let SQLite refresh statistics the session's queries would use
+            await self._connection.execute("PRAGMA optimize")
             await self._connection.close()
             self._connection = None
             self._logger.info("SQLite disconnected")
 
-    async def execute(
+    async def execute_write(
         self,
         query: str,
         parameters: tuple = (),
-    ) -> aiosqlite.Cursor:
+    ) -> list[aiosqlite.Row]:
         """
-        Execute a query.
+        Run a write statement and commit it with other concurrent writes.
 
         Args:
             query: SQL query string
             parameters: Query parameters
 
         Returns:
-            Cursor with results
-        """
-        if self._connection is None:
-            raise RuntimeError("Database not connected. Call connect() first.")
+            Rows produced by the statement (e.g. with RETURNING)
 
-        return await self._connection.execute(query, parameters)
+        Raises:
+            RuntimeError: If the database is not connected
+        """
+        return await self._queue_write(query, parameters, many=False)
 
-    async def execute_many(
+    async def execute_write_many(
         self,
         query: str,
         parameters_list: list[tuple],
     ) -> None:
         """
-        Execute a query multiple times with different parameters.
+        Run a write statement for each parameter tuple, atomically, and
+        commit it with other concurrent writes.
 
         Args:
             query: SQL query string
             parameters_list: List of parameter tuples
+
+        Raises:
+            RuntimeError: If the database is not connected
         """
+        await self._queue_write(query, parameters_list, many=True)
+
+    def _queue_write(
+        self,
+        query: str,
+        parameters: tuple | list,
+        many: bool,
+    ) -> asyncio.Future:
+        """Queue a write for the next group commit and return its future."""
         if self._connection is None:
             raise RuntimeError("Database not connected. Call connect() first.")
 
-        await self._connection.executemany(query, parameters_list)
+        future = asyncio.get_running_loop().create_future()
+        self._pending_writes.append((query, parameters, many, future))
+        if self._write_task is None:
+            self._write_task = asyncio.create_task(self._run_writes())
+        return future
+
+    async def _run_writes(self) -> None:
+        """Commit queued writes in batches until the queue is empty."""
+        batch = []
+        try:
+            while self._pending_writes:
+                batch = self._pending_writes[: self.MAX_WRITE_BATCH]
+                del self._pending_writes[: self.MAX_WRITE_BATCH]
+                await self._commit_writes(batch)
+        finally:
+            self._write_task = None
+            # Stopped early (e.g. cancelled at shutdown): nothing will run
+            # the current batch or the writes still queued, so release
+            # their callers
+            pending, self._pending_writes = self._pending_writes, []
+            for _, _, _, future in batch + pending:
+                if not future.done():
+                    future.cancel()
+
+    async def _commit_writes(
+        self,
+        batch: list[tuple[str, tuple | list, bool, asyncio.Future]],
+    ) -> None:
+        """
+        Apply a batch of writes in one transaction.
+
+        A failing write only fails its own caller; the rest of the batch
+        is still committed. If the transaction itself fails, or a failing
+        write makes SQLite roll the whole transaction back, every write in
+        the batch fails with that error. Callers only see success once the
+        COMMIT has gone through.
+
+        Args:
+            batch: Queued (query, parameters, many, future) entries
+        """
+        async with self._writer_lock:
+            await self._apply_batch(self._connection, batch)
+
+    async def _apply_batch(
+        self,
+        connection: aiosqlite.Connection,
+        batch: list[tuple[str, tuple | list, bool, asyncio.Future]],
+    ) -> None:
+        """Run one group-commit transaction and settle its futures."""
+        results = []
+
+        try:
+            await connection.execute("BEGIN IMMEDIATE")
+
+            for query, parameters, many, future in batch:
+                try:
+                    if many:
+                        # Keep a multi-row write all-or-nothing
+                        await connection.execute("SAVEPOINT write_many")
+                        try:
+                            await connection.executemany(query, parameters)
+                        except Exception:
+                            if connection.in_transaction:
+                                await connection.execute("ROLLBACK TO write_many")
+                            raise
+                        finally:
+                            if connection.in_transaction:
+                                await connection.execute("RELEASE write_many")
+                        rows = None
+                    else:
+                        rows = await connection.execute_fetchall(query, parameters)
+                except Exception as exc:
+                    # Some errors abort the whole transaction, not just the
+                    # statement; nothing before it in the batch survives
+                    if not connection.in_transaction:
+                        raise
+                    if not future.done():
+                        future.set_exception(exc)
+                    continue
+                results.append((future, rows))
+
+            await connection.commit()
+
+        except Exception as exc:
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            with suppress(Exception):
+                await connection.rollback()
+            return
+
+        finally:
+            # Cancelled mid-batch: undo the transaction and release waiters
+            if connection.in_transaction:
+                with suppress(Exception):
+                    await connection.rollback()
+                for _, _, _, future in batch:
+                    if not future.done():
+                        future.cancel()
+
+        for future, rows in results:
+            if not future.done():
+                future.set_result(rows)
 
     async def fetch_one(
         self,
         query: str,
         parameters: tuple = (),
+        read_only: bool = False,
     ) -> aiosqlite.Row | None:
         """
         Execute query and fetch one row.
 
+        The query runs and its rows are fetched in a single hop to the
+        connection's worker thread, so it should return at most a few
+        rows (LIMIT 1, an aggregate, or RETURNING on a primary key).
+
         Args:
             query: SQL query string
             parameters: Query parameters
+            read_only: Run on a pooled read-only connection (the query
+                must not write, e.g. no UPDATE ... RETURNING)
 
         Returns:
             Single row or None
         """
-        cursor = await self.execute(query, parameters)
-        return await cursor.fetchone()
+        rows = await self.fetch_all(query, parameters, read_only=read_only)
+        return rows[0] if rows else None
 
     async def fetch_all(
         self,
         query: str,
         parameters: tuple = (),
+        read_only: bool = False,
     ) -> list[aiosqlite.Row]:
         """
-        Execute query and fetch all rows.
+        Execute query and fetch all rows in a single hop to the
+        connection's worker thread.
 
         Args:
             query: SQL query string
             parameters: Query parameters
+            read_only: Run on a pooled read-only connection
 
         Returns:
             List of rows
         """
-        cursor = await self.execute(query, parameters)
-        return await cursor.fetchall()
-
-    async def commit(self) -> None:
-        """Commit current transaction."""
-        if self._connection is None:
-            raise RuntimeError("Database not connected. Call connect() first.")
-
-        await self._connection.commit()
+        if read_only:
+            async with self.acquire_reader() as reader:
+                return await reader.execute_fetchall(query, parameters)
 
-    async def rollback(self) -> None:
-        """Rollback current transaction."""
         if self._connection is None:
             raise RuntimeError("Database not connected. Call connect() first.")
 
-        await self._connection.rollback()
+        async with self._writer_lock:
+            return await self._connection.execute_fetchall(query, parameters)
 
     async def health_check(self) -> dict:
         """
@@ -198,7 +555,8 @@ class SQLiteConnection:
             if self._connection is None:
                 return {"status": "unhealthy", "error": "Not connected"}
 
-            await self._connection.execute("SELECT 1")
+            async with self._writer_lock:
+                await self._connection.execute("SELECT 1")
             return {"status": "healthy"}
 
         except Exception as e:
@@ -1,7 +1,11 @@
 """Global error handlers for FastAPI application."""
 
+import json
+from typing import Any
+
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
 
 from src.modules.payments.domain.errors import PaymentError
@@ -9,18 +13,36 @@ from src.shared.utils.logger import Logger
 
 logger = Logger("ERROR_HANDLER")
 
+# The 500 response body never changes, so it is encoded once
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {
+        "success": False,
+        "error": {
+            "code": "INTERNAL_ERROR",
+            "message": "An unexpected error occurred",
+        },
+    }
+)
+
 
-def _make_serializable(obj):
-    """Convert objects to JSON-serializable types."""
-    if isinstance(obj, dict):
-        return {k: _make_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_make_serializable(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(_make_serializable(item) for item in obj)
-    elif hasattr(obj, '__str__') and not isinstance(obj, (str, int, float, bool, type(None))):
-        return str(obj)
-    return obj
+def _dumps(payload: dict[str, Any]) -> bytes:
+    """
+    Serialize a response payload, rendering unknown values with str().
+
+    orjson rejects integers beyond 64 bits (e.g. an oversized "input"
+    echoed back in a validation error), so those payloads fall back to
+    the standard library encoder.
+
+    Args:
+        payload: The response payload
+
+    Returns:
+        The JSON-encoded payload
+    """
+    try:
+        return orjson.dumps(payload, default=str)
+    except TypeError:
+        return json.dumps(payload, default=str).encode()
 
 
 def setup_error_handlers(app: FastAPI) -> None:
@@ -35,27 +57,28 @@ def setup_error_handlers(app: FastAPI) -> None:
     async def payment_error_handler(
         request: Request,
         exc: PaymentError,
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle domain payment errors."""
         logger.warning(
             "Payment error",
             extra={
                 "code": exc.code,
                 "message": exc.message,
-                "path": request.url.path,
+                "path": request.scope["path"],
             },
         )
 
-        return JSONResponse(
+        return Response(
+            content=exc.to_json(),
             status_code=exc.status_code,
-            content=exc.to_dict(),
+            media_type="application/json",
         )
 
     @app.exception_handler(RequestValidationError)
     async def validation_error_handler(
         request: Request,
         exc: RequestValidationError,
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle Pydantic validation errors."""
         errors = exc.errors()
 
@@ -69,46 +92,45 @@ def setup_error_handlers(app: FastAPI) -> None:
             extra={
                 "field": field,
                 "message": message,
-                "path": request.url.path,
+                "path": request.scope["path"],
             },
         )
 
-        # Convert errors to serializable format
-        serializable_errors = _make_serializable(errors)
-
-        return JSONResponse(
-            status_code=400,
-            content={
+        # Values that can't be serialized (e.g. exceptions in "ctx") are
+        # rendered with str() in the same pass
+        content = _dumps(
+            {
                 "success": False,
                 "error": {
                     "code": "VALIDATION_ERROR",
                     "message": f"{field}: {message}",
-                    "details": {"errors": serializable_errors},
+                    "details": {"errors": errors},
                 },
-            },
+            }
+        )
+
+        return Response(
+            content=content,
+            status_code=400,
+            media_type="application/json",
         )
 
     @app.exception_handler(Exception)
     async def generic_error_handler(
         request: Request,
         exc: Exception,
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle unexpected errors."""
         logger.error(
             "Unexpected error",
             extra={
                 "error": str(exc),
-                "path": request.url.path,
+                "path": request.scope["path"],
             },
         )
 
-        return JSONResponse(
+        return Response(
+            content=_INTERNAL_ERROR_BODY,
             status_code=500,
-            content={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "An unexpected error occurred",
-                },
-            },
+            media_type="application/json",
         )
\ No newline at end of file
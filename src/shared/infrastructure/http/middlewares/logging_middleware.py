@@ -1,15 +1,14 @@
 """Request/Response logging middleware."""
 
 import time
-from typing import Callable
+from logging import INFO, WARNING
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.shared.utils.logger import Logger
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware for logging HTTP requests and responses.
 
@@ -18,45 +17,76 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     - Request path
     - Response status code
     - Request duration
+
+    Implemented as plain ASGI middleware: it reads the method and path from
+    the scope and the status from the response start message, without
+    building Request/Response objects or streaming the body through a
+    BaseHTTPMiddleware task.
     """
 
-    def __init__(self, app) -> None:
-        """Initialize middleware."""
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        excluded_paths: frozenset[str] = frozenset({"/health"}),
+    ) -> None:
+        """
+        Initialize middleware.
+
+        Args:
+            app: The ASGI application to wrap
+            excluded_paths: Paths whose requests are not logged, such as
+                health probes
+        """
+        self.app = app
+        self._excluded_paths = excluded_paths
         self._logger = Logger("HTTP:REQUEST")
+        # Log method per level, resolved once instead of on every request
+        self._log_methods = {
+            INFO: self._logger.info,
+            WARNING: self._logger.warning,
+        }
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and log details.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
-
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        start_time = time.time()
+        if scope["type"] != "http" or scope["path"] in self._excluded_paths:
+            await self.app(scope, receive, send)
+            return
 
-        # Process request
-        response = await call_next(request)
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-        # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
+        # Process request
+        await self.app(scope, receive, send_wrapper)
 
         # Determine log level based on status code
-        status_code = response.status_code
-        log_method = self._logger.warning if status_code >= 400 else self._logger.info
+        level = WARNING if status_code >= 400 else INFO
+        if not self._logger.isEnabledFor(level):
+            return
+
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        method = scope["method"]
+        path = scope["path"]
 
         # Log request details
-        log_method(
-            f"{request.method} {request.url.path}",
+        self._log_methods[level](
+            f"{method} {path}",
             extra={
                 "status": status_code,
                 "duration": f"{duration_ms:.2f}ms",
-                "method": request.method,
-                "path": request.url.path,
+                "method": method,
+                "path": path,
             },
         )
-
-        return response
\ No newline at end of file
@@ -1,6 +1,17 @@
 """Shared HTTP schemas."""
 
-from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import TypedDict
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class HealthPayload(TypedDict):
+    """Health check response body, serialized directly without pydantic."""
+
+    status: str
+    timestamp: datetime
+    services: dict[str, dict[str, str]]
 
 
 class HealthServiceSchema(BaseModel):
@@ -15,6 +26,8 @@ class HealthServiceSchema(BaseModel):
         description="Error message if unhealthy",
     )
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class HealthResponseSchema(BaseModel):
     """Schema for health check response."""
@@ -32,16 +45,15 @@ class HealthResponseSchema(BaseModel):
         description="Individual service health statuses",
     )
 
-    class Config:
-        """Pydantic config."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
-                "timestamp": "2024-01-15T10:30:00",
+                "timestamp": "2024-01-15T10:30:00+00:00",
                 "services": {
                     "database": {"status": "healthy"},
                     "redis": {"status": "healthy"},
                 },
             }
-        }
\ No newline at end of file
+        },
+    )
@@ -1,13 +1,18 @@
 """FastAPI application factory."""
 
+import asyncio
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 
-from fastapi import FastAPI
+import orjson
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config.settings import get_settings
 from src.shared.infrastructure.http.error_handlers import setup_error_handlers
+from src.shared.infrastructure.http.schemas import HealthPayload, HealthResponseSchema
 from src.shared.infrastructure.http.middlewares import LoggingMiddleware
 from src.shared.infrastructure.database.sqlite import SQLiteConnection
 from src.shared.infrastructure.cache.redis_client import RedisClient
@@ -32,9 +37,8 @@ async def lifespan(app: FastAPI):
     sqlite_connection = SQLiteConnection.get_instance()
     redis_client = RedisClient.get_instance()
 
-    # Connect to databases
-    await sqlite_connection.connect()
-    await redis_client.connect()
+    # Connect to databases concurrently
+    await asyncio.gather(sqlite_connection.connect(), redis_client.connect())
 
     settings = get_settings()
     logger.info("Service started successfully", extra={
@@ -47,9 +51,111 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down...")
-    await sqlite_connection.disconnect()
-    await redis_client.disconnect()
+    # One failing teardown must not skip the other
+    results = await asyncio.gather(
+        sqlite_connection.disconnect(),
+        redis_client.disconnect(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Error during shutdown", extra={"error": str(result)})
     logger.info("Service stopped")
+    Logger.shutdown()
+
+
+# OpenAPI description, only attached when docs are served
+_API_DESCRIPTION = """
+Payment processing service with idempotency support.
+
+## Features
+
+- **Payment Creation**: Create new payments with idempotency guarantees
+- **Payment Retrieval**: Get payment details by ID
+- **Payment Retry**: Retry failed payments (max 3 attempts)
+- **Payment Listing**: List payments with filtering and pagination
+
+## Business Rules
+
+- Payments with amount ≤ 1000 succeed immediately
+- Payments with amount > 1000 fail and can be retried
+- Each retry has a 50% chance of success
+- After 3 failed retries, payment status becomes EXHAUSTED
+"""
+
+
+health_router = APIRouter(tags=["Health"])
+
+# Probes within this many seconds of a check reuse its result
+_HEALTH_CACHE_SECONDS = 1.0
+
+# Last health payload and the monotonic time it was computed
+_health_cache: dict = {"checked_at": float("-inf"), "payload": None}
+_health_lock = asyncio.Lock()
+
+
+@health_router.get(
+    "/health",
+    responses={200: {"model": HealthResponseSchema}},
+    summary="Health check",
+    description="Check the health status of the service and its dependencies.",
+)
+async def health_check() -> ORJSONResponse:
+    """Check service health."""
+    # Returned as a response so FastAPI skips jsonable_encoder
+    return ORJSONResponse(await _get_health_payload())
+
+
+async def _get_health_payload() -> HealthPayload:
+    """
+    Get the health payload, checking dependencies at most once a second.
+
+    Concurrent probes after the cache expires wait for a single check.
+
+    Returns:
+        The current health payload
+    """
+    if time.monotonic() - _health_cache["checked_at"] < _HEALTH_CACHE_SECONDS:
+        return _health_cache["payload"]
+
+    async with _health_lock:
+        # Another probe may have refreshed it while we waited
+        if time.monotonic() - _health_cache["checked_at"] < _HEALTH_CACHE_SECONDS:
+            return _health_cache["payload"]
+
+        payload = await _check_health()
+        _health_cache["payload"] = payload
+        _health_cache["checked_at"] = time.monotonic()
+
+    return payload
+
+
+async def _check_health() -> HealthPayload:
+    """Check the database and Redis concurrently and build the payload."""
+    sqlite_connection = SQLiteConnection.get_instance()
+    redis_client = RedisClient.get_instance()
+
+    db_health, redis_health = await asyncio.gather(
+        sqlite_connection.health_check(),
+        redis_client.health_check(),
+    )
+
+    is_healthy = (
+        db_health["status"] == "healthy" and
+        redis_health["status"] == "healthy"
+    )
+
+    payload: HealthPayload = {
+        "status": "healthy" if is_healthy else "unhealthy",
+        # orjson writes the datetime natively as RFC 3339
+        "timestamp": datetime.now(timezone.utc),
+        "services": {
+            "database": db_health,
+            "redis": redis_health,
+        },
+    }
+
+    return payload
 
 
 def create_app() -> FastAPI:
@@ -60,39 +166,36 @@ def create_app() -> FastAPI:
         Configured FastAPI application
     """
     settings = get_settings()
+    # Without docs the OpenAPI schema is never built
+    docs_enabled = settings.docs_enabled
 
     app = FastAPI(
         title="Payment Service",
-        description="""
-        Payment processing service with idempotency support.
-
-        ## Features
-
-        - **Payment Creation**: Create new payments with idempotency guarantees
-        - **Payment Retrieval**: Get payment details by ID
-        - **Payment Retry**: Retry failed payments (max 3 attempts)
-        - **Payment Listing**: List payments with filtering and pagination
-
-        ## Business Rules
-
-        - Payments with amount ≤ 1000 succeed immediately
-        - Payments with amount > 1000 fail and can be retried
-        - Each retry has a 50% chance of success
-        - After 3 failed retries, payment status becomes EXHAUSTED
-        """,
+        description=_API_DESCRIPTION if docs_enabled else "",
         version=settings.app_version,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        docs_url="/docs" if docs_enabled else None,
+        redoc_url="/redoc" if docs_enabled else None,
+        openapi_url="/openapi.json" if docs_enabled else None,
     )
 
     # Add middlewares
     app.add_middleware(LoggingMiddleware)
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Service-to-service deployments can leave CORS off entirely
+    cors_origins = [
+        origin.strip()
+        for origin in settings.cors_allow_origins.split(",")
+        if origin.strip()
+    ]
+    if cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=cors_origins,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
     # Setup error handlers
     setup_error_handlers(app)
@@ -102,32 +205,35 @@ def create_app() -> FastAPI:
     app.include_router(payment_router)
 
     # Health check endpoint
-    @app.get(
-        "/health",
-        tags=["Health"],
-        summary="Health check",
-        description="Check the health status of the service and its dependencies.",
-    )
-    async def health_check():
-        """Check service health."""
-        sqlite_connection = SQLiteConnection.get_instance()
-        redis_client = RedisClient.get_instance()
+    app.include_router(health_router)
 
-        db_health = await sqlite_connection.health_check()
-        redis_health = await redis_client.health_check()
+    # Serve the OpenAPI document as prebuilt bytes
+    _serve_static_openapi(app)
 
-        is_healthy = (
-            db_health["status"] == "healthy" and
-            redis_health["status"] == "healthy"
-        )
+    return app
+
+
+def _serve_static_openapi(app: FastAPI) -> None:
+    """
+    Replace the default OpenAPI route with one serving precomputed bytes.
+
+    The schema is generated and serialized once here, at startup, instead
+    of on the first request to the docs.
+
+    Args:
+        app: FastAPI application with all routes registered
+    """
+    if not app.openapi_url:
+        return
+
+    openapi_bytes = orjson.dumps(app.openapi())
 
-        return {
-            "status": "healthy" if is_healthy else "unhealthy",
-            "timestamp": datetime.utcnow().isoformat(),
-            "services": {
-                "database": db_health,
-                "redis": redis_health,
-            },
-        }
+    app.router.routes = [
+        route for route in app.router.routes
+        if getattr(route, "path", None) != app.openapi_url
+    ]
 
-    return app
\ No newline at end of file
+    @app.get(app.openapi_url, include_in_schema=False)
+    async def openapi() -> Response:
+        """Serve the prebuilt OpenAPI document."""
+        return Response(content=openapi_bytes, media_type="application/json")
\ No newline at end of file
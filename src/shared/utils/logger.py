@@ -1,28 +1,88 @@
 """Structured logger for the application."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 from src.config.settings import get_settings
 
 
+class _LazyMessage:
+    """Log message whose context prefix and extras are formatted only if emitted."""
+
+    __slots__ = ("_logger", "_message", "_extra")
+
+    def __init__(self, logger: "Logger", message: str, extra: dict[str, Any] | None) -> None:
+        self._logger = logger
+        self._message = message
+        self._extra = extra
+
+    def __str__(self) -> str:
+        return self._logger._format_message(self._message, self._extra)
+
+
+class _JsonFormatter(logging.Formatter):
+    """Formats each record as a single JSON line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.msg
+        payload = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+        }
+
+        if isinstance(message, _LazyMessage):
+            payload["ctx"] = message._logger.context
+            payload["msg"] = message._message
+            if message._extra:
+                payload.update(message._extra)
+        else:
+            payload["ctx"] = record.name
+            payload["msg"] = record.getMessage()
+
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+
+        # Values orjson can't serialize (e.g. Decimal) are written with str()
+        return orjson.dumps(payload, default=str).decode()
+
+
 class Logger:
     """Structured logger with context prefixes."""
 
     _configured: bool = False
+    _instances: dict[str, "Logger"] = {}
+    _listener: QueueListener | None = None
+    _queue_handler: QueueHandler | None = None
 
-    def __init__(self, context: str) -> None:
+    def __new__(cls, context: str) -> "Logger":
         """
-        Initialize logger with a context prefix.
+        Get the logger for a context prefix, creating it only once.
 
         Args:
             context: Prefix for all log messages (e.g., 'USE_CASE:CREATE_PAYMENT')
+
+        Returns:
+            The shared Logger instance for the context
         """
-        self.context = context
-        self._logger = logging.getLogger(context)
-        self._configure_logging()
+        instance = cls._instances.get(context)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.context = context
+            instance._prefix = f"[{context}] "
+            instance._logger = logging.getLogger(context)
+            # Guards call this on every hot-path log; skip the wrapper.
+            # The stdlib check stays correct when levels change later.
+            instance.isEnabledFor = instance._logger.isEnabledFor
+            cls._configure_logging()
+            cls._instances[context] = instance
+        return instance
 
     @classmethod
     def _configure_logging(cls) -> None:
@@ -34,10 +94,13 @@ class Logger:
         level = logging.DEBUG if settings.debug else logging.INFO
 
         # Create formatter
-        formatter = logging.Formatter(
-            fmt="%(asctime)s [%(levelname)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        if settings.log_format.lower() == "json":
+            formatter = _JsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+        else:
+            formatter = logging.Formatter(
+                fmt="%(asctime)s [%(levelname)s] %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
 
         # Configure root logger
         root_logger = logging.getLogger()
@@ -46,40 +109,78 @@ class Logger:
         # Remove existing handlers
         root_logger.handlers.clear()
 
-        # Add stdout handler
+        # Records are formatted by the caller and handed to a background
+        # thread that writes them, so a slow stdout never blocks the loop
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(level)
+        queue_handler.setFormatter(formatter)
+        root_logger.addHandler(queue_handler)
+
+        # Add stdout handler (messages arrive already formatted)
         stdout_handler = logging.StreamHandler(sys.stdout)
-        stdout_handler.setLevel(level)
-        stdout_handler.setFormatter(formatter)
-        root_logger.addHandler(stdout_handler)
+        cls._listener = QueueListener(log_queue, stdout_handler)
+        cls._listener.start()
+        cls._queue_handler = queue_handler
+        atexit.unregister(cls.shutdown)
+        atexit.register(cls.shutdown)
 
         cls._configured = True
 
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Write out queued log records and stop the background writer.
+
+        Records logged afterwards are written directly to stdout, and the
+        next new Logger sets up the background writer again.
+        """
+        if cls._listener is None:
+            return
+
+        # Swap in a direct handler before draining, so no record is queued
+        # after the writer stops
+        queue_handler = cls._queue_handler
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setLevel(queue_handler.level)
+        stdout_handler.setFormatter(queue_handler.formatter)
+        root_logger = logging.getLogger()
+        root_logger.addHandler(stdout_handler)
+        root_logger.removeHandler(queue_handler)
+        cls._listener.stop()
+
+        cls._listener = None
+        cls._queue_handler = None
+        cls._configured = False
+
     def _format_message(self, message: str, extra: dict[str, Any] | None = None) -> str:
         """Format message with context and extra data."""
-        formatted = f"[{self.context}] {message}"
+        if not extra:
+            return self._prefix + message
 
-        if extra:
-            extra_str = " | ".join(f"{k}={v}" for k, v in extra.items())
-            formatted = f"{formatted} | {extra_str}"
+        extra_str = " | ".join([f"{k}={v}" for k, v in extra.items()])
+        return f"{self._prefix}{message} | {extra_str}"
 
-        return formatted
+    def isEnabledFor(self, level: int) -> bool:
+        """Check if a message of the given level would be emitted."""
+        return self._logger.isEnabledFor(level)
 
     def debug(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log debug message."""
-        self._logger.debug(self._format_message(message, extra))
+        self._logger.debug(_LazyMessage(self, message, extra))
 
     def info(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log info message."""
-        self._logger.info(self._format_message(message, extra))
+        self._logger.info(_LazyMessage(self, message, extra))
 
     def warning(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log warning message."""
-        self._logger.warning(self._format_message(message, extra))
+        self._logger.warning(_LazyMessage(self, message, extra))
 
     def error(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log error message."""
-        self._logger.error(self._format_message(message, extra))
+        self._logger.error(_LazyMessage(self, message, extra))
 
     def critical(self, message: str, extra: dict[str, Any] | None = None) -> None:
         """Log critical message."""
-        self._logger.critical(self._format_message(message, extra))
\ No newline at end of file
+        self._logger.critical(_LazyMessage(self, message, extra))
\ No newline at end of file
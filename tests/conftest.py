@@ -1,10 +1,17 @@
 """Pytest fixtures and configuration."""
 
+import copy
+from contextlib import asynccontextmanager
+
 import pytest
+import pytest_asyncio
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import AsyncContextManager, AsyncIterator, Callable, Iterator
 from unittest.mock import AsyncMock, MagicMock
 
+from src.config.settings import get_settings
+
 from src.modules.payments.domain.payment import Payment
 from src.modules.payments.domain.payment_status import PaymentStatus
 from src.modules.payments.domain.repository import PaymentRepository
@@ -12,123 +19,257 @@ from src.modules.payments.application.ports.payment_processor import (
     PaymentProcessor,
     ProcessingResult,
 )
-from src.modules.payments.application.ports.idempotency_service import IdempotencyService
+from src.modules.payments.application.ports.idempotency_service import (
+    ClaimResult,
+    IdempotencyService,
+)
+from src.shared.infrastructure.database.sqlite import SQLiteConnection
+
+
+def pytest_collection_modifyitems(items) -> None:
+    """Run every async test on one session-wide event loop."""
+    session_loop = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 # ============================================
 # PAYMENT FIXTURES
 # ============================================
 
+# Immutable values shared by every payment fixture
+_CREATED_AT = datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
+_AMOUNT_500 = Decimal("500.00")
+_AMOUNT_1500 = Decimal("1500.00")
+
+# Every payment fixture hands out its own copy of a template built once per
+# session, so tests may mutate it freely. Payment fields are all immutable
+# values, so a shallow copy is fully isolated.
+
+
+@pytest.fixture(scope="session")
+def _payment_templates(payment_factory) -> dict[str, Payment]:
+    """Build the template of every payment fixture, keyed by fixture name."""
+    return {
+        "sample_payment": payment_factory("pay-123-456", reference="FAC-12345"),
+        "failed_payment": payment_factory(
+            "pay-789-012",
+            reference="FAC-67890",
+            amount=_AMOUNT_1500,
+            status=PaymentStatus.FAILED,
+        ),
+        "success_payment": payment_factory(
+            "pay-success-123",
+            reference="FAC-SUCCESS",
+            status=PaymentStatus.SUCCESS,
+        ),
+        "exhausted_payment": payment_factory(
+            "pay-exhausted-123",
+            reference="FAC-EXHAUSTED",
+            amount=_AMOUNT_1500,
+            status=PaymentStatus.EXHAUSTED,
+            retries=3,
+        ),
+        "failed_payment_max_retries": payment_factory(
+            "pay-max-retries",
+            reference="FAC-MAX",
+            amount=_AMOUNT_1500,
+            status=PaymentStatus.FAILED,
+            retries=3,
+        ),
+        "failed_payment_almost_exhausted": payment_factory(
+            "pay-almost-exhausted",
+            reference="FAC-123",
+            amount=_AMOUNT_1500,
+            status=PaymentStatus.FAILED,
+            retries=2,
+        ),
+    }
+
+
 @pytest.fixture
-def sample_payment() -> Payment:
+def sample_payment(_payment_templates) -> Payment:
     """Create a sample payment in PENDING status."""
-    return Payment(
-        payment_id="pay-123-456",
-        reference="FAC-12345",
-        amount=Decimal("500.00"),
-        currency="MXN",
-        status=PaymentStatus.PENDING,
-        retries=0,
-        created_at=datetime(2024, 1, 15, 10, 30, 0),
-        updated_at=datetime(2024, 1, 15, 10, 30, 0),
-    )
+    return copy.copy(_payment_templates["sample_payment"])
 
 
 @pytest.fixture
-def failed_payment() -> Payment:
+def failed_payment(_payment_templates) -> Payment:
     """Create a sample payment in FAILED status."""
-    return Payment(
-        payment_id="pay-789-012",
-        reference="FAC-67890",
-        amount=Decimal("1500.00"),
-        currency="MXN",
-        status=PaymentStatus.FAILED,
-        retries=0,
-        created_at=datetime(2024, 1, 15, 10, 30, 0),
-        updated_at=datetime(2024, 1, 15, 10, 30, 0),
-    )
+    return copy.copy(_payment_templates["failed_payment"])
 
 
 @pytest.fixture
-def success_payment() -> Payment:
+def success_payment(_payment_templates) -> Payment:
     """Create a sample payment in SUCCESS status."""
-    return Payment(
-        payment_id="pay-success-123",
-        reference="FAC-SUCCESS",
-        amount=Decimal("500.00"),
-        currency="MXN",
-        status=PaymentStatus.SUCCESS,
-        retries=0,
-        created_at=datetime(2024, 1, 15, 10, 30, 0),
-        updated_at=datetime(2024, 1, 15, 10, 30, 0),
-    )
+    return copy.copy(_payment_templates["success_payment"])
 
 
 @pytest.fixture
-def exhausted_payment() -> Payment:
+def exhausted_payment(_payment_templates) -> Payment:
     """Create a sample payment in EXHAUSTED status."""
-    return Payment(
-        payment_id="pay-exhausted-123",
-        reference="FAC-EXHAUSTED",
-        amount=Decimal("1500.00"),
-        currency="MXN",
-        status=PaymentStatus.EXHAUSTED,
-        retries=3,
-        created_at=datetime(2024, 1, 15, 10, 30, 0),
-        updated_at=datetime(2024, 1, 15, 10, 30, 0),
-    )
+    return copy.copy(_payment_templates["exhausted_payment"])
 
 
 @pytest.fixture
-def failed_payment_max_retries() -> Payment:
+def failed_payment_max_retries(_payment_templates) -> Payment:
     """Create a FAILED payment with max retries reached."""
-    return Payment(
-        payment_id="pay-max-retries",
-        reference="FAC-MAX",
-        amount=Decimal("1500.00"),
-        currency="MXN",
-        status=PaymentStatus.FAILED,
-        retries=3,
-        created_at=datetime(2024, 1, 15, 10, 30, 0),
-        updated_at=datetime(2024, 1, 15, 10, 30, 0),
-    )
+    return copy.copy(_payment_templates["failed_payment_max_retries"])
+
+
+@pytest.fixture
+def failed_payment_almost_exhausted(_payment_templates) -> Payment:
+    """Create a FAILED payment with one retry left."""
+    return copy.copy(_payment_templates["failed_payment_almost_exhausted"])
+
+
+@pytest.fixture(scope="session")
+def payment_factory() -> Callable[..., Payment]:
+    """Build payments from shared defaults, overriding only what a test needs."""
+    defaults = {
+        "reference": "REF-1",
+        "amount": _AMOUNT_500,
+        "currency": "MXN",
+        "status": PaymentStatus.PENDING,
+        "retries": 0,
+        "created_at": _CREATED_AT,
+        "updated_at": _CREATED_AT,
+    }
+
+    def make(payment_id: str, **overrides) -> Payment:
+        return Payment(payment_id=payment_id, **{**defaults, **overrides})
+
+    return make
 
 
 # ============================================
 # MOCK FIXTURES
 # ============================================
 
-@pytest.fixture
-def mock_payment_repository() -> AsyncMock:
-    """Create a mock payment repository."""
+# Spec'd mocks are built once per session and reset before every test by
+# the autouse fixture below, so use cases holding them can be shared too.
+
+
+def _reset(mock: AsyncMock) -> AsyncMock:
+    """Clear calls, return values and side effects left by a previous test."""
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def _payment_repository_template() -> AsyncMock:
+    """Build the spec'd payment repository mock once."""
     mock = AsyncMock(spec=PaymentRepository)
     mock.save = AsyncMock()
-    mock.find_by_id = AsyncMock(return_value=None)
+    mock.find_by_id = AsyncMock()
     mock.update = AsyncMock()
-    mock.find_all = AsyncMock(return_value=[])
-    mock.count = AsyncMock(return_value=0)
+    mock.update_status = AsyncMock()
+    mock.try_increment_retry = AsyncMock()
+    mock.find_all = AsyncMock()
+    mock.count = AsyncMock()
+    mock.count_by_status = AsyncMock()
     return mock
 
 
-@pytest.fixture
-def mock_payment_processor() -> AsyncMock:
-    """Create a mock payment processor."""
+@pytest.fixture(scope="session")
+def _payment_processor_template() -> AsyncMock:
+    """Build the spec'd payment processor mock once."""
     mock = AsyncMock(spec=PaymentProcessor)
-    mock.process = AsyncMock(
-        return_value=ProcessingResult(success=True, message="Success")
-    )
-    mock.process_retry = AsyncMock(
-        return_value=ProcessingResult(success=True, message="Retry success")
-    )
+    mock.process = AsyncMock()
+    mock.process_retry = AsyncMock()
     return mock
 
 
-@pytest.fixture
-def mock_idempotency_service() -> AsyncMock:
-    """Create a mock idempotency service."""
+@pytest.fixture(scope="session")
+def _idempotency_service_template() -> AsyncMock:
+    """Build the spec'd idempotency service mock once."""
     mock = AsyncMock(spec=IdempotencyService)
-    mock.get_existing_result = AsyncMock(return_value=None)
+    mock.try_claim = AsyncMock()
+    mock.get_existing_result = AsyncMock()
     mock.save_result = AsyncMock()
-    mock.acquire_lock = AsyncMock(return_value=True)
+    mock.save_result_and_release = AsyncMock()
+    mock.acquire_lock = AsyncMock()
     mock.release_lock = AsyncMock()
-    return mock
\ No newline at end of file
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(
+    _payment_repository_template,
+    _payment_processor_template,
+    _idempotency_service_template,
+) -> None:
+    """Reset the shared mocks and re-apply their defaults before each test."""
+    repository = _reset(_payment_repository_template)
+    repository.find_by_id.return_value = None
+    repository.try_increment_retry.return_value = None
+    repository.update_status.return_value = True
+    repository.find_all.return_value = ([], None)
+    repository.count.return_value = 0
+    repository.count_by_status.return_value = {}
+
+    processor = _reset(_payment_processor_template)
+    processor.process.return_value = ProcessingResult(
+        success=True, message="Success"
+    )
+    processor.process_retry.return_value = ProcessingResult(
+        success=True, message="Retry success"
+    )
+
+    idempotency = _reset(_idempotency_service_template)
+    idempotency.try_claim.return_value = ClaimResult(
+        existing_result=None, lock_token="lock-token"
+    )
+    idempotency.get_existing_result.return_value = None
+    idempotency.acquire_lock.return_value = "lock-token"
+
+
+@pytest.fixture
+def mock_payment_repository(_payment_repository_template) -> AsyncMock:
+    """Create a mock payment repository."""
+    return _payment_repository_template
+
+
+@pytest.fixture
+def mock_payment_processor(_payment_processor_template) -> AsyncMock:
+    """Create a mock payment processor."""
+    return _payment_processor_template
+
+
+@pytest.fixture
+def mock_idempotency_service(_idempotency_service_template) -> AsyncMock:
+    """Create a mock idempotency service."""
+    return _idempotency_service_template
+
+
+# ============================================
+# DATABASE FIXTURES
+# ============================================
+
+
+@pytest.fixture
+def sqlite_database(
+    tmp_path,
+    monkeypatch,
+) -> Iterator[Callable[[], AsyncContextManager[SQLiteConnection]]]:
+    """
+    Point the settings at a fresh SQLite file and open connections to it.
+
+    Connections are opened inside the test, so they are bound to the
+    event loop the test runs on.
+    """
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "payments.db"))
+    get_settings.cache_clear()
+
+    @asynccontextmanager
+    async def open_connection() -> AsyncIterator[SQLiteConnection]:
+        connection = SQLiteConnection()
+        await connection.connect()
+        try:
+            yield connection
+        finally:
+            await connection.disconnect()
+
+    yield open_connection
+    get_settings.cache_clear()
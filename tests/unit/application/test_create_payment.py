@@ -7,25 +7,30 @@ from unittest.mock import AsyncMock
 from src.modules.payments.application.use_cases.create_payment import CreatePaymentUseCase
 from src.modules.payments.application.dtos import CreatePaymentRequest
 from src.modules.payments.application.ports.payment_processor import ProcessingResult
+from src.modules.payments.application.ports.idempotency_service import ClaimResult
 from src.modules.payments.domain.payment_status import PaymentStatus
 from src.modules.payments.domain.errors import PaymentValidationError
 
+# Amounts reused across tests, built once at import
+_AMOUNT_500 = Decimal("500.00")
+_AMOUNT_1500 = Decimal("1500.00")
+
 
 class TestCreatePaymentUseCase:
     """Tests for CreatePaymentUseCase."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def use_case(
         self,
-        mock_payment_repository,
-        mock_payment_processor,
-        mock_idempotency_service,
+        _payment_repository_template,
+        _payment_processor_template,
+        _idempotency_service_template,
     ) -> CreatePaymentUseCase:
         """Create use case with mocked dependencies."""
         return CreatePaymentUseCase(
-            payment_repository=mock_payment_repository,
-            payment_processor=mock_payment_processor,
-            idempotency_service=mock_idempotency_service,
+            payment_repository=_payment_repository_template,
+            payment_processor=_payment_processor_template,
+            idempotency_service=_idempotency_service_template,
         )
 
     @pytest.fixture
@@ -33,7 +38,7 @@ class TestCreatePaymentUseCase:
         """Create a valid payment request."""
         return CreatePaymentRequest(
             reference="FAC-12345",
-            amount=Decimal("500.00"),
+            amount=_AMOUNT_500,
             currency="MXN",
             idempotency_key="test-key-123",
         )
@@ -57,13 +62,15 @@ class TestCreatePaymentUseCase:
 
         assert is_new is True
         assert response.reference == "FAC-12345"
-        assert response.amount == 500.00
+        assert response.amount == "500.00"
         assert response.currency == "MXN"
         assert response.status == PaymentStatus.SUCCESS.value
 
         mock_payment_repository.save.assert_called_once()
-        mock_payment_repository.update.assert_called_once()
-        mock_idempotency_service.save_result.assert_called_once()
+        mock_payment_repository.update.assert_not_called()
+        saved_payment = mock_payment_repository.save.call_args.args[0]
+        assert saved_payment.status == PaymentStatus.SUCCESS
+        mock_idempotency_service.save_result_and_release.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_create_payment_failed_amount_over_threshold(
@@ -76,7 +83,7 @@ class TestCreatePaymentUseCase:
         """Should create payment with FAILED status when amount > 1000."""
         request = CreatePaymentRequest(
             reference="FAC-12345",
-            amount=Decimal("1500.00"),
+            amount=_AMOUNT_1500,
             currency="MXN",
             idempotency_key="test-key-456",
         )
@@ -89,7 +96,7 @@ class TestCreatePaymentUseCase:
         response, is_new = await use_case.execute(request)
 
         assert is_new is True
-        assert response.amount == 1500.00
+        assert response.amount == "1500.00"
         assert response.status == PaymentStatus.FAILED.value
 
     @pytest.mark.asyncio
@@ -102,9 +109,10 @@ class TestCreatePaymentUseCase:
         sample_payment,
     ):
         """Should return existing payment when idempotency key exists."""
-        mock_idempotency_service.get_existing_result.return_value = {
-            "payment_id": sample_payment.payment_id,
-        }
+        mock_idempotency_service.try_claim.return_value = ClaimResult(
+            existing_result={"payment_id": sample_payment.payment_id},
+            lock_token=None,
+        )
         mock_payment_repository.find_by_id.return_value = sample_payment
 
         response, is_new = await use_case.execute(valid_request)
@@ -113,6 +121,36 @@ class TestCreatePaymentUseCase:
         assert response.payment_id == sample_payment.payment_id
 
         mock_payment_repository.save.assert_not_called()
+        mock_idempotency_service.release_lock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_payment_waits_for_concurrent_request(
+        self,
+        use_case,
+        valid_request,
+        mock_payment_repository,
+        mock_idempotency_service,
+        sample_payment,
+        monkeypatch,
+    ):
+        """Should return the payment created by a concurrent request holding the lock."""
+        monkeypatch.setattr(use_case, "CLAIM_POLL_DELAYS", (0, 0))
+        mock_idempotency_service.try_claim.return_value = ClaimResult(
+            existing_result=None,
+            lock_token=None,
+        )
+        mock_idempotency_service.get_existing_result.side_effect = [
+            None,
+            {"payment_id": sample_payment.payment_id},
+        ]
+        mock_payment_repository.find_by_id.return_value = sample_payment
+
+        response, is_new = await use_case.execute(valid_request)
+
+        assert is_new is False
+        assert response.payment_id == sample_payment.payment_id
+        assert mock_idempotency_service.get_existing_result.call_count == 2
+        mock_payment_repository.save.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_payment_acquires_and_releases_lock(
@@ -122,20 +160,23 @@ class TestCreatePaymentUseCase:
         mock_payment_processor,
         mock_idempotency_service,
     ):
-        """Should acquire and release lock during creation."""
+        """Should acquire the lock and release it together with the result."""
         mock_payment_processor.process.return_value = ProcessingResult(
             success=True,
             message="Success",
         )
 
-        await use_case.execute(valid_request)
+        response, _ = await use_case.execute(valid_request)
 
-        mock_idempotency_service.acquire_lock.assert_called_once_with(
+        mock_idempotency_service.try_claim.assert_called_once_with(
             valid_request.idempotency_key
         )
-        mock_idempotency_service.release_lock.assert_called_once_with(
-            valid_request.idempotency_key
+        mock_idempotency_service.save_result_and_release.assert_called_once_with(
+            idempotency_key=valid_request.idempotency_key,
+            result={"payment_id": response.payment_id},
+            lock_token="lock-token",
         )
+        mock_idempotency_service.release_lock.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_payment_releases_lock_on_error(
@@ -148,7 +189,7 @@ class TestCreatePaymentUseCase:
         """Should release lock even when error occurs."""
         request = CreatePaymentRequest(
             reference="",  # Invalid - will raise error
-            amount=Decimal("500.00"),
+            amount=_AMOUNT_500,
             currency="MXN",
             idempotency_key="test-key-error",
         )
@@ -156,7 +197,9 @@ class TestCreatePaymentUseCase:
         with pytest.raises(PaymentValidationError):
             await use_case.execute(request)
 
-        mock_idempotency_service.release_lock.assert_called_once()
+        mock_idempotency_service.release_lock.assert_called_once_with(
+            "test-key-error", "lock-token"
+        )
 
     @pytest.mark.asyncio
     async def test_create_payment_invalid_reference_raises_error(
@@ -167,7 +210,7 @@ class TestCreatePaymentUseCase:
         """Should raise validation error for empty reference."""
         request = CreatePaymentRequest(
             reference="",
-            amount=Decimal("500.00"),
+            amount=_AMOUNT_500,
             currency="MXN",
             idempotency_key="test-key",
         )
@@ -205,7 +248,7 @@ class TestCreatePaymentUseCase:
         """Should raise validation error for invalid currency."""
         request = CreatePaymentRequest(
             reference="FAC-12345",
-            amount=Decimal("500.00"),
+            amount=_AMOUNT_500,
             currency="INVALID",
             idempotency_key="test-key",
         )
@@ -1,5 +1,6 @@
 """Unit tests for GetPaymentUseCase."""
 
+import orjson
 import pytest
 
 from src.modules.payments.application.use_cases.get_payment import GetPaymentUseCase
@@ -10,11 +11,11 @@ from src.modules.payments.domain.errors import PaymentNotFoundError
 class TestGetPaymentUseCase:
     """Tests for GetPaymentUseCase."""
 
-    @pytest.fixture
-    def use_case(self, mock_payment_repository) -> GetPaymentUseCase:
+    @pytest.fixture(scope="class")
+    def use_case(self, _payment_repository_template) -> GetPaymentUseCase:
         """Create use case with mocked dependencies."""
         return GetPaymentUseCase(
-            payment_repository=mock_payment_repository,
+            payment_repository=_payment_repository_template,
         )
 
     @pytest.mark.asyncio
@@ -32,7 +33,7 @@ class TestGetPaymentUseCase:
 
         assert response.payment_id == sample_payment.payment_id
         assert response.reference == sample_payment.reference
-        assert response.amount == float(sample_payment.amount)
+        assert response.amount == str(sample_payment.amount)
         assert response.currency == sample_payment.currency
         assert response.status == sample_payment.status.value
 
@@ -56,4 +57,5 @@ class TestGetPaymentUseCase:
 
         assert exc_info.value.code == "PAYMENT_NOT_FOUND"
         assert "non-existent-id" in exc_info.value.message
-        assert exc_info.value.status_code == 404
\ No newline at end of file
+        assert exc_info.value.status_code == 404
+        assert orjson.loads(exc_info.value.to_json()) == exc_info.value.to_dict()
@@ -0,0 +1,83 @@
+"""Unit tests for ListPaymentsUseCase."""
+
+import pytest
+
+from src.modules.payments.application.use_cases.list_payments import ListPaymentsUseCase
+from src.modules.payments.application.dtos import ListPaymentsRequest
+from src.modules.payments.domain.payment_status import PaymentStatus
+
+
+class TestListPaymentsUseCase:
+    """Tests for ListPaymentsUseCase."""
+
+    @pytest.fixture(scope="class")
+    def use_case(self, _payment_repository_template) -> ListPaymentsUseCase:
+        """Create use case with mocked dependencies."""
+        return ListPaymentsUseCase(
+            payment_repository=_payment_repository_template,
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_payments_returns_page_and_cursor(
+        self,
+        use_case,
+        mock_payment_repository,
+        sample_payment,
+        failed_payment,
+    ):
+        """Should return one page of payments and the next cursor."""
+        mock_payment_repository.find_all.return_value = (
+            [sample_payment, failed_payment],
+            "next-page",
+        )
+
+        request = ListPaymentsRequest(limit=2, cursor="this-page")
+        response = await use_case.execute(request)
+
+        assert [p.payment_id for p in response.payments] == [
+            sample_payment.payment_id,
+            failed_payment.payment_id,
+        ]
+        assert response.next_cursor == "next-page"
+        assert response.limit == 2
+        assert response.total is None
+
+        mock_payment_repository.find_all.assert_called_once_with(
+            status=None,
+            cursor="this-page",
+            limit=2,
+        )
+        mock_payment_repository.count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_payments_counts_only_when_requested(
+        self,
+        use_case,
+        mock_payment_repository,
+    ):
+        """Should include the total only when include_total is set."""
+        mock_payment_repository.count.return_value = 25
+
+        request = ListPaymentsRequest(status=PaymentStatus.FAILED, include_total=True)
+        response = await use_case.execute(request)
+
+        assert response.total == 25
+        assert response.next_cursor is None
+        mock_payment_repository.count.assert_called_once_with(status=PaymentStatus.FAILED)
+
+    @pytest.mark.asyncio
+    async def test_list_payments_forwards_status_filter(
+        self,
+        use_case,
+        mock_payment_repository,
+    ):
+        """Should pass the status filter through to the repository."""
+        request = ListPaymentsRequest(status=PaymentStatus.FAILED)
+
+        await use_case.execute(request)
+
+        mock_payment_repository.find_all.assert_called_once_with(
+            status=PaymentStatus.FAILED,
+            cursor=None,
+            limit=100,
+        )
@@ -1,13 +1,11 @@
 """Unit tests for RetryPaymentUseCase."""
 
 import pytest
-from decimal import Decimal
-from datetime import datetime
+from unittest.mock import ANY
 
 from src.modules.payments.application.use_cases.retry_payment import RetryPaymentUseCase
 from src.modules.payments.application.dtos import RetryPaymentRequest
 from src.modules.payments.application.ports.payment_processor import ProcessingResult
-from src.modules.payments.domain.payment import Payment
 from src.modules.payments.domain.payment_status import PaymentStatus
 from src.modules.payments.domain.errors import (
     PaymentNotFoundError,
@@ -19,16 +17,23 @@ from src.modules.payments.domain.errors import (
 class TestRetryPaymentUseCase:
     """Tests for RetryPaymentUseCase."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def use_case(
         self,
-        mock_payment_repository,
-        mock_payment_processor,
+        _payment_repository_template,
+        _payment_processor_template,
     ) -> RetryPaymentUseCase:
         """Create use case with mocked dependencies."""
         return RetryPaymentUseCase(
-            payment_repository=mock_payment_repository,
-            payment_processor=mock_payment_processor,
+            payment_repository=_payment_repository_template,
+            payment_processor=_payment_processor_template,
+        )
+
+    @pytest.fixture(scope="class")
+    def failed_retry_request(self, _payment_templates) -> RetryPaymentRequest:
+        """Build the frozen retry request for failed_payment once."""
+        return RetryPaymentRequest(
+            payment_id=_payment_templates["failed_payment"].payment_id
         )
 
     @pytest.mark.asyncio
@@ -38,21 +43,67 @@ class TestRetryPaymentUseCase:
         mock_payment_repository,
         mock_payment_processor,
         failed_payment,
+        failed_retry_request,
     ):
         """Should retry and succeed."""
-        mock_payment_repository.find_by_id.return_value = failed_payment
+        failed_payment.increment_retries()
+        mock_payment_repository.try_increment_retry.return_value = failed_payment
         mock_payment_processor.process_retry.return_value = ProcessingResult(
             success=True,
             message="Retry successful",
         )
 
-        request = RetryPaymentRequest(payment_id=failed_payment.payment_id)
-        response = await use_case.execute(request)
+        response = await use_case.execute(failed_retry_request)
 
         assert response.status == PaymentStatus.SUCCESS.value
         assert response.retries == 1
 
-        mock_payment_repository.update.assert_called_once()
+        mock_payment_repository.try_increment_retry.assert_called_once_with(
+            failed_payment.payment_id,
+            max_retries=3,
+            now=ANY,
+        )
+        mock_payment_repository.find_by_id.assert_not_called()
+        mock_payment_repository.update_status.assert_called_once_with(
+            failed_payment.payment_id,
+            PaymentStatus.SUCCESS,
+            ANY,
+            expected_retries=1,
+        )
+        mock_payment_repository.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retry_payment_superseded_returns_current_payment(
+        self,
+        use_case,
+        mock_payment_repository,
+        mock_payment_processor,
+        failed_payment,
+        success_payment,
+        failed_retry_request,
+    ):
+        """Should report the stored payment when a concurrent retry settled it first."""
+        failed_payment.increment_retries()
+        mock_payment_repository.try_increment_retry.return_value = failed_payment
+        mock_payment_processor.process_retry.return_value = ProcessingResult(
+            success=False,
+            message="Retry failed",
+        )
+        mock_payment_repository.update_status.return_value = False
+        mock_payment_repository.find_by_id.return_value = success_payment
+
+        response = await use_case.execute(failed_retry_request)
+
+        assert response.status == PaymentStatus.SUCCESS.value
+        mock_payment_repository.update_status.assert_called_once_with(
+            failed_payment.payment_id,
+            PaymentStatus.FAILED,
+            ANY,
+            expected_retries=1,
+        )
+        mock_payment_repository.find_by_id.assert_called_once_with(
+            failed_payment.payment_id
+        )
 
     @pytest.mark.asyncio
     async def test_retry_payment_failed_with_retries_remaining(
@@ -61,16 +112,17 @@ class TestRetryPaymentUseCase:
         mock_payment_repository,
         mock_payment_processor,
         failed_payment,
+        failed_retry_request,
     ):
         """Should stay FAILED when retry fails but retries remain."""
-        mock_payment_repository.find_by_id.return_value = failed_payment
+        failed_payment.increment_retries()
+        mock_payment_repository.try_increment_retry.return_value = failed_payment
         mock_payment_processor.process_retry.return_value = ProcessingResult(
             success=False,
             message="Retry failed",
         )
 
-        request = RetryPaymentRequest(payment_id=failed_payment.payment_id)
-        response = await use_case.execute(request)
+        response = await use_case.execute(failed_retry_request)
 
         assert response.status == PaymentStatus.FAILED.value
         assert response.retries == 1
@@ -81,21 +133,14 @@ class TestRetryPaymentUseCase:
         use_case,
         mock_payment_repository,
         mock_payment_processor,
+        failed_payment_almost_exhausted,
     ):
         """Should become EXHAUSTED after 3rd failed retry."""
         # Payment with 2 retries already
-        payment = Payment(
-            payment_id="pay-almost-exhausted",
-            reference="FAC-123",
-            amount=Decimal("1500.00"),
-            currency="MXN",
-            status=PaymentStatus.FAILED,
-            retries=2,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
+        payment = failed_payment_almost_exhausted
 
-        mock_payment_repository.find_by_id.return_value = payment
+        payment.increment_retries()
+        mock_payment_repository.try_increment_retry.return_value = payment
         mock_payment_processor.process_retry.return_value = ProcessingResult(
             success=False,
             message="Retry failed",
@@ -124,74 +169,35 @@ class TestRetryPaymentUseCase:
         assert exc_info.value.code == "PAYMENT_NOT_FOUND"
         assert exc_info.value.status_code == 404
 
+    @pytest.mark.parametrize(
+        ("payment_fixture", "error_class", "code"),
+        [
+            ("success_payment", CannotRetryPaymentError, "CANNOT_RETRY_PAYMENT"),
+            ("sample_payment", CannotRetryPaymentError, "CANNOT_RETRY_PAYMENT"),
+            ("exhausted_payment", CannotRetryPaymentError, "CANNOT_RETRY_PAYMENT"),
+            ("failed_payment_max_retries", MaxRetriesExceededError, "MAX_RETRIES_EXCEEDED"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_retry_success_payment_raises_error(
-        self,
-        use_case,
-        mock_payment_repository,
-        success_payment,
-    ):
-        """Should raise CannotRetryPaymentError for SUCCESS payment."""
-        mock_payment_repository.find_by_id.return_value = success_payment
-
-        request = RetryPaymentRequest(payment_id=success_payment.payment_id)
-
-        with pytest.raises(CannotRetryPaymentError) as exc_info:
-            await use_case.execute(request)
-
-        assert exc_info.value.code == "CANNOT_RETRY_PAYMENT"
-        assert exc_info.value.status_code == 409
-
-    @pytest.mark.asyncio
-    async def test_retry_pending_payment_raises_error(
-        self,
-        use_case,
-        mock_payment_repository,
-        sample_payment,
-    ):
-        """Should raise CannotRetryPaymentError for PENDING payment."""
-        mock_payment_repository.find_by_id.return_value = sample_payment
-
-        request = RetryPaymentRequest(payment_id=sample_payment.payment_id)
-
-        with pytest.raises(CannotRetryPaymentError) as exc_info:
-            await use_case.execute(request)
-
-        assert exc_info.value.code == "CANNOT_RETRY_PAYMENT"
-
-    @pytest.mark.asyncio
-    async def test_retry_exhausted_payment_raises_error(
-        self,
-        use_case,
-        mock_payment_repository,
-        exhausted_payment,
-    ):
-        """Should raise CannotRetryPaymentError for EXHAUSTED payment."""
-        mock_payment_repository.find_by_id.return_value = exhausted_payment
-
-        request = RetryPaymentRequest(payment_id=exhausted_payment.payment_id)
-
-        with pytest.raises(CannotRetryPaymentError) as exc_info:
-            await use_case.execute(request)
-
-        assert exc_info.value.code == "CANNOT_RETRY_PAYMENT"
-
-    @pytest.mark.asyncio
-    async def test_retry_max_retries_exceeded_raises_error(
+    async def test_retry_ineligible_payment_raises_error(
         self,
+        request,
         use_case,
         mock_payment_repository,
-        failed_payment_max_retries,
+        payment_fixture,
+        error_class,
+        code,
     ):
-        """Should raise MaxRetriesExceededError when max retries reached."""
-        mock_payment_repository.find_by_id.return_value = failed_payment_max_retries
+        """Should reject payments that are not FAILED or have no retries left."""
+        payment = request.getfixturevalue(payment_fixture)
+        mock_payment_repository.find_by_id.return_value = payment
 
-        request = RetryPaymentRequest(payment_id=failed_payment_max_retries.payment_id)
+        retry_request = RetryPaymentRequest(payment_id=payment.payment_id)
 
-        with pytest.raises(MaxRetriesExceededError) as exc_info:
-            await use_case.execute(request)
+        with pytest.raises(error_class) as exc_info:
+            await use_case.execute(retry_request)
 
-        assert exc_info.value.code == "MAX_RETRIES_EXCEEDED"
+        assert exc_info.value.code == code
         assert exc_info.value.status_code == 409
 
     @pytest.mark.asyncio
@@ -201,16 +207,17 @@ class TestRetryPaymentUseCase:
         mock_payment_repository,
         mock_payment_processor,
         failed_payment,
+        failed_retry_request,
     ):
         """Should call process_retry, not process."""
-        mock_payment_repository.find_by_id.return_value = failed_payment
+        failed_payment.increment_retries()
+        mock_payment_repository.try_increment_retry.return_value = failed_payment
         mock_payment_processor.process_retry.return_value = ProcessingResult(
             success=True,
             message="Success",
         )
 
-        request = RetryPaymentRequest(payment_id=failed_payment.payment_id)
-        await use_case.execute(request)
+        await use_case.execute(failed_retry_request)
 
         mock_payment_processor.process_retry.assert_called_once()
         mock_payment_processor.process.assert_not_called()
\ No newline at end of file
@@ -2,16 +2,24 @@
 
 import pytest
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.modules.payments.domain.payment import Payment
 from src.modules.payments.domain.payment_status import PaymentStatus
+from src.modules.payments.domain.retry_eligibility import RetryEligibility
 from src.modules.payments.domain.errors import (
     PaymentValidationError,
     CannotRetryPaymentError,
     MaxRetriesExceededError,
 )
 
+# Values reused across tests, built once at import
+_AMOUNT_100 = Decimal("100.00")
+_AMOUNT_1500 = Decimal("1500.00")
+_AMOUNT_1500_50 = Decimal("1500.50")
+_CREATED_AT = datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
+_LATER = datetime(2024, 2, 1, 12, 0, 0, tzinfo=timezone.utc)
+
 
 class TestPaymentCreate:
     """Tests for Payment.create() factory method."""
@@ -20,14 +28,14 @@ class TestPaymentCreate:
         """Should create a payment with valid data."""
         payment = Payment.create(
             reference="FAC-12345",
-            amount=Decimal("1500.00"),
+            amount=_AMOUNT_1500,
             currency="MXN",
         )
 
         assert payment.payment_id is not None
         assert len(payment.payment_id) == 36  # UUID format
         assert payment.reference == "FAC-12345"
-        assert payment.amount == Decimal("1500.00")
+        assert payment.amount == _AMOUNT_1500
         assert payment.currency == "MXN"
         assert payment.status == PaymentStatus.PENDING
         assert payment.retries == 0
@@ -38,7 +46,7 @@ class TestPaymentCreate:
         """Should trim whitespace from reference."""
         payment = Payment.create(
             reference="  FAC-12345  ",
-            amount=Decimal("100.00"),
+            amount=_AMOUNT_100,
             currency="MXN",
         )
 
@@ -48,133 +56,100 @@ class TestPaymentCreate:
         """Should convert currency to uppercase."""
         payment = Payment.create(
             reference="FAC-12345",
-            amount=Decimal("100.00"),
+            amount=_AMOUNT_100,
             currency="mxn",
         )
 
         assert payment.currency == "MXN"
 
-    def test_create_payment_empty_reference_raises_error(self):
-        """Should raise error when reference is empty."""
-        with pytest.raises(PaymentValidationError) as exc_info:
-            Payment.create(
-                reference="",
-                amount=Decimal("100.00"),
-                currency="MXN",
-            )
-
-        assert exc_info.value.code == "VALIDATION_ERROR"
-        assert "reference" in exc_info.value.message.lower()
-
-    def test_create_payment_whitespace_reference_raises_error(self):
-        """Should raise error when reference is only whitespace."""
-        with pytest.raises(PaymentValidationError) as exc_info:
-            Payment.create(
-                reference="   ",
-                amount=Decimal("100.00"),
-                currency="MXN",
-            )
-
-        assert exc_info.value.code == "VALIDATION_ERROR"
-
-    def test_create_payment_zero_amount_raises_error(self):
-        """Should raise error when amount is zero."""
-        with pytest.raises(PaymentValidationError) as exc_info:
-            Payment.create(
-                reference="FAC-12345",
-                amount=Decimal("0"),
-                currency="MXN",
-            )
-
-        assert exc_info.value.code == "VALIDATION_ERROR"
-        assert "amount" in exc_info.value.message.lower()
-
-    def test_create_payment_negative_amount_raises_error(self):
-        """Should raise error when amount is negative."""
-        with pytest.raises(PaymentValidationError) as exc_info:
-            Payment.create(
-                reference="FAC-12345",
-                amount=Decimal("-100.00"),
-                currency="MXN",
-            )
-
-        assert exc_info.value.code == "VALIDATION_ERROR"
-        assert "amount" in exc_info.value.message.lower()
-
-    def test_create_payment_invalid_currency_length_raises_error(self):
-        """Should raise error when currency is not 3 characters."""
-        with pytest.raises(PaymentValidationError) as exc_info:
-            Payment.create(
-                reference="FAC-12345",
-                amount=Decimal("100.00"),
-                currency="MXNN",
-            )
-
-        assert exc_info.value.code == "VALIDATION_ERROR"
-        assert "currency" in exc_info.value.message.lower()
+    def test_create_payment_stores_minor_units(self):
+        """Should keep the amount as exact integer minor units."""
+        payment = Payment.create(
+            reference="FAC-12345",
+            amount=Decimal("1500.5"),
+            currency="MXN",
+        )
 
-    def test_create_payment_short_currency_raises_error(self):
-        """Should raise error when currency is too short."""
+        assert payment.amount_minor == 150050
+        assert payment.amount == _AMOUNT_1500_50
+
+    @pytest.mark.parametrize(
+        ("reference", "amount", "currency", "field"),
+        [
+            pytest.param("", _AMOUNT_100, "MXN", "reference", id="empty_reference"),
+            pytest.param("   ", _AMOUNT_100, "MXN", "reference", id="whitespace_reference"),
+            pytest.param("FAC-12345", Decimal("10.001"), "MXN", "amount", id="too_many_decimals"),
+            pytest.param("FAC-12345", Decimal("0"), "MXN", "amount", id="zero_amount"),
+            pytest.param("FAC-12345", -_AMOUNT_100, "MXN", "amount", id="negative_amount"),
+            pytest.param("FAC-12345", _AMOUNT_100, "MXNN", "currency", id="long_currency"),
+            pytest.param("FAC-12345", _AMOUNT_100, "MX", "currency", id="short_currency"),
+        ],
+    )
+    def test_create_payment_invalid_input_raises_error(
+        self,
+        reference,
+        amount,
+        currency,
+        field,
+    ):
+        """Should raise a validation error naming the invalid field."""
         with pytest.raises(PaymentValidationError) as exc_info:
             Payment.create(
-                reference="FAC-12345",
-                amount=Decimal("100.00"),
-                currency="MX",
+                reference=reference,
+                amount=amount,
+                currency=currency,
             )
 
         assert exc_info.value.code == "VALIDATION_ERROR"
-        assert "currency" in exc_info.value.message.lower()
+        assert field in exc_info.value.message.lower()
 
 
 class TestPaymentStatus:
     """Tests for PaymentStatus enum."""
 
-    def test_pending_is_not_final(self):
-        """PENDING should not be a final status."""
-        assert not PaymentStatus.PENDING.is_final()
-
-    def test_success_is_final(self):
-        """SUCCESS should be a final status."""
-        assert PaymentStatus.SUCCESS.is_final()
-
-    def test_failed_is_not_final(self):
-        """FAILED should not be a final status."""
-        assert not PaymentStatus.FAILED.is_final()
-
-    def test_exhausted_is_final(self):
-        """EXHAUSTED should be a final status."""
-        assert PaymentStatus.EXHAUSTED.is_final()
-
-    def test_only_failed_can_retry(self):
-        """Only FAILED status should allow retry."""
-        assert PaymentStatus.FAILED.can_retry()
-        assert not PaymentStatus.PENDING.can_retry()
-        assert not PaymentStatus.SUCCESS.can_retry()
-        assert not PaymentStatus.EXHAUSTED.can_retry()
+    @pytest.mark.parametrize(
+        ("status", "is_final", "can_retry"),
+        [
+            (PaymentStatus.PENDING, False, False),
+            (PaymentStatus.SUCCESS, True, False),
+            (PaymentStatus.FAILED, False, True),
+            (PaymentStatus.EXHAUSTED, True, False),
+        ],
+    )
+    def test_status_flags(self, status, is_final, can_retry):
+        """Only SUCCESS and EXHAUSTED are final; only FAILED allows retry."""
+        assert status.is_final() is is_final
+        assert status.can_retry() is can_retry
 
 
 class TestPaymentCanRetry:
     """Tests for Payment.can_retry() method."""
 
-    def test_failed_payment_can_retry(self, failed_payment):
-        """FAILED payment with retries < 3 can retry."""
-        assert failed_payment.can_retry()
-
-    def test_failed_payment_max_retries_cannot_retry(self, failed_payment_max_retries):
-        """FAILED payment with retries = 3 cannot retry."""
-        assert not failed_payment_max_retries.can_retry()
-
-    def test_success_payment_cannot_retry(self, success_payment):
-        """SUCCESS payment cannot retry."""
-        assert not success_payment.can_retry()
-
-    def test_pending_payment_cannot_retry(self, sample_payment):
-        """PENDING payment cannot retry."""
-        assert not sample_payment.can_retry()
-
-    def test_exhausted_payment_cannot_retry(self, exhausted_payment):
-        """EXHAUSTED payment cannot retry."""
-        assert not exhausted_payment.can_retry()
+    @pytest.mark.parametrize(
+        ("payment_fixture", "can_retry"),
+        [
+            ("failed_payment", True),
+            ("failed_payment_max_retries", False),
+            ("success_payment", False),
+            ("sample_payment", False),
+            ("exhausted_payment", False),
+        ],
+    )
+    def test_can_retry(self, request, payment_fixture, can_retry):
+        """Only FAILED payments with retries < 3 can retry."""
+        payment = request.getfixturevalue(payment_fixture)
+        assert payment.can_retry() is can_retry
+
+    def test_retry_eligibility_reports_reason(
+        self,
+        failed_payment,
+        failed_payment_max_retries,
+        success_payment,
+    ):
+        """Should report why a payment cannot be retried."""
+        assert failed_payment.retry_eligibility() == RetryEligibility.OK
+        assert failed_payment_max_retries.retry_eligibility() == RetryEligibility.MAX_RETRIES
+        assert success_payment.retry_eligibility() == RetryEligibility.WRONG_STATUS
 
 
 class TestPaymentIncrementRetries:
@@ -189,12 +164,13 @@ class TestPaymentIncrementRetries:
         assert failed_payment.retries == initial_retries + 1
 
     def test_increment_retries_updates_timestamp(self, failed_payment):
-        """Should update updated_at timestamp."""
-        old_updated_at = failed_payment.updated_at
+        """Should set updated_at to the time of the change."""
+        now = _LATER
 
-        failed_payment.increment_retries()
+        failed_payment.increment_retries(now=now)
 
-        assert failed_payment.updated_at > old_updated_at
+        assert failed_payment.updated_at == now
+        assert failed_payment.created_at < now
 
     def test_increment_retries_non_failed_raises_error(self, success_payment):
         """Should raise error for non-FAILED payment."""
@@ -234,12 +210,13 @@ class TestPaymentMarkAs:
         assert failed_payment.status == PaymentStatus.EXHAUSTED
 
     def test_mark_as_updates_timestamp(self, sample_payment):
-        """Should update updated_at timestamp."""
-        old_updated_at = sample_payment.updated_at
+        """Should set updated_at to the time of the change."""
+        now = _LATER
 
-        sample_payment.mark_as_success()
+        sample_payment.mark_as_success(now=now)
 
-        assert sample_payment.updated_at > old_updated_at
+        assert sample_payment.updated_at == now
+        assert sample_payment.created_at < now
 
 
 class TestPaymentProcessRetryResult:
@@ -261,6 +238,15 @@ class TestPaymentProcessRetryResult:
 
         assert failed_payment.status == PaymentStatus.FAILED
 
+    def test_process_retry_uses_given_timestamp(self, failed_payment):
+        """Should stamp updated_at with the timestamp passed in."""
+        now = datetime(2024, 1, 15, 11, 0, 0, tzinfo=timezone.utc)
+        failed_payment.increment_retries(now=now)
+
+        failed_payment.process_retry_result(success=False, now=now)
+
+        assert failed_payment.updated_at == now
+
     def test_process_retry_failed_exhausted(self, failed_payment):
         """Should mark as EXHAUSTED when final retry fails."""
         # Increment to max retries
@@ -280,18 +266,18 @@ class TestPaymentToDict:
 
         assert "payment_id" in result
         assert "reference" in result
-        assert "amount" in result
+        assert "amount_minor" in result
         assert "currency" in result
         assert "status" in result
         assert "retries" in result
         assert "created_at" in result
         assert "updated_at" in result
 
-    def test_to_dict_amount_is_float(self, sample_payment):
-        """Should convert amount to float."""
+    def test_to_dict_amount_is_minor_units(self, sample_payment):
+        """Should emit the exact amount as integer minor units."""
         result = sample_payment.to_dict()
 
-        assert isinstance(result["amount"], float)
+        assert result["amount_minor"] == 50000
 
     def test_to_dict_status_is_string(self, sample_payment):
         """Should convert status to string value."""
@@ -300,55 +286,76 @@ class TestPaymentToDict:
         assert result["status"] == "PENDING"
 
 
+class TestPaymentRestoreBatch:
+    """Tests for Payment.restore_batch() and Payment.hydrate()."""
+
+    def test_restore_batch_rebuilds_payments(self):
+        """Should rebuild payments from persisted field tuples."""
+        created_at = _CREATED_AT
+
+        payments = Payment.restore_batch([
+            ("pay-1", "FAC-1", 50000, "MXN", PaymentStatus.SUCCESS, 0, created_at, created_at),
+            ("pay-2", "FAC-2", 150050, "MXN", PaymentStatus.FAILED, 2, created_at, created_at),
+        ])
+
+        assert [p.payment_id for p in payments] == ["pay-1", "pay-2"]
+        assert payments[1].amount == _AMOUNT_1500_50
+        assert payments[1].status == PaymentStatus.FAILED
+        assert payments[1].retries == 2
+        assert payments[1].can_retry()
+
+    def test_hydrate_keeps_persisted_values(self):
+        """Should rebuild a payment without normalizing persisted data."""
+        created_at = _CREATED_AT
+
+        payment = Payment.hydrate(
+            ("pay-1", " FAC-1 ", 50000, "mxn", PaymentStatus.PENDING, 0, created_at, created_at)
+        )
+
+        assert payment.payment_id == "pay-1"
+        assert payment.reference == " FAC-1 "
+        assert payment.currency == "mxn"
+        assert payment.amount == Decimal("500.00")
+        assert payment.created_at == created_at
+
+
 class TestPaymentEquality:
     """Tests for Payment equality."""
 
-    def test_payments_equal_by_id(self):
+    def test_payments_equal_by_id(self, payment_factory):
         """Payments with same ID should be equal."""
-        payment1 = Payment(
-            payment_id="same-id",
-            reference="REF-1",
-            amount=Decimal("100"),
-            currency="MXN",
-            status=PaymentStatus.PENDING,
-            retries=0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-        payment2 = Payment(
-            payment_id="same-id",
+        payment1 = payment_factory("same-id")
+        payment2 = payment_factory(
+            "same-id",
             reference="REF-2",
             amount=Decimal("200"),
             currency="USD",
             status=PaymentStatus.SUCCESS,
             retries=1,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
         )
 
         assert payment1 == payment2
 
-    def test_payments_not_equal_different_id(self):
+    def test_payments_not_equal_different_id(self, payment_factory):
         """Payments with different IDs should not be equal."""
-        payment1 = Payment(
-            payment_id="id-1",
-            reference="REF-1",
-            amount=Decimal("100"),
-            currency="MXN",
-            status=PaymentStatus.PENDING,
-            retries=0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-        payment2 = Payment(
-            payment_id="id-2",
-            reference="REF-1",
-            amount=Decimal("100"),
-            currency="MXN",
-            status=PaymentStatus.PENDING,
-            retries=0,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+        payment1 = payment_factory("id-1")
+        payment2 = payment_factory("id-2")
+
+        assert payment1 != payment2
+
+    def test_equal_payments_share_hash(self, sample_payment):
+        """Payments with the same ID should collapse in a set."""
+        copy = Payment.hydrate(
+            (
+                sample_payment.payment_id,
+                sample_payment.reference,
+                sample_payment.amount_minor,
+                sample_payment.currency,
+                sample_payment.status,
+                sample_payment.retries,
+                sample_payment.created_at,
+                sample_payment.updated_at,
+            )
         )
 
-        assert payment1 != payment2
\ No newline at end of file
+        assert len({sample_payment, copy}) == 1
@@ -0,0 +1,128 @@
+"""Unit tests for CachedPaymentRepository."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.payments.domain.payment_status import PaymentStatus
+from src.modules.payments.infrastructure.persistence.cached_payment_repository import (
+    CachedPaymentRepository,
+)
+from src.modules.payments.infrastructure.persistence.sqlite_payment_repository import (
+    SQLitePaymentRepository,
+)
+
+
+class TestCachedPaymentRepository:
+    """Tests for the caching decorator over a SQLite repository."""
+
+    @pytest.mark.asyncio
+    async def test_final_payment_is_served_from_cache(
+        self,
+        sqlite_database,
+        monkeypatch,
+        payment_factory,
+    ):
+        """Should read a final payment from the database only once."""
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            cached = CachedPaymentRepository(repository)
+            await cached.save(payment_factory("pay-1", status=PaymentStatus.SUCCESS))
+            find_by_id = AsyncMock(wraps=repository.find_by_id)
+            monkeypatch.setattr(repository, "find_by_id", find_by_id)
+
+            first = await cached.find_by_id("pay-1")
+            second = await cached.find_by_id("pay-1")
+
+            assert first.payment_id == second.payment_id == "pay-1"
+            assert first is not second
+            assert find_by_id.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_write_evicts_cached_payment(
+        self,
+        sqlite_database,
+        payment_factory,
+    ):
+        """Should return the written values after a write through the cache."""
+        now = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+        async with sqlite_database() as connection:
+            cached = CachedPaymentRepository(SQLitePaymentRepository(connection))
+            await cached.save(payment_factory("pay-1", status=PaymentStatus.FAILED))
+            before = await cached.find_by_id("pay-1")
+
+            await cached.try_increment_retry("pay-1", max_retries=3, now=now)
+            after_increment = await cached.find_by_id("pay-1")
+
+            await cached.update_status(
+                "pay-1", PaymentStatus.SUCCESS, now, expected_retries=1
+            )
+            after_update = await cached.find_by_id("pay-1")
+
+            assert before.retries == 0
+            assert after_increment.retries == 1
+            assert after_update.status == PaymentStatus.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_callers_get_their_own_copy(
+        self,
+        sqlite_database,
+        payment_factory,
+    ):
+        """Should not let a caller's changes leak into the cached payment."""
+        async with sqlite_database() as connection:
+            cached = CachedPaymentRepository(SQLitePaymentRepository(connection))
+            await cached.save(payment_factory("pay-1", status=PaymentStatus.FAILED))
+
+            payment = await cached.find_by_id("pay-1")
+            payment.increment_retries()
+
+            assert (await cached.find_by_id("pay-1")).retries == 0
+
+    @pytest.mark.asyncio
+    async def test_read_overlapping_a_write_is_not_cached(
+        self,
+        sqlite_database,
+        monkeypatch,
+        payment_factory,
+    ):
+        """Should not cache a row read while a write to it was in progress."""
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            cached = CachedPaymentRepository(repository)
+            await cached.save(payment_factory("pay-1", status=PaymentStatus.FAILED))
+            find_by_id = repository.find_by_id
+
+            async def find_then_write(payment_id):
+                payment = await find_by_id(payment_id)
+                await cached.save(
+                    payment_factory("pay-1", status=PaymentStatus.SUCCESS)
+                )
+                return payment
+
+            monkeypatch.setattr(repository, "find_by_id", find_then_write)
+            stale = await cached.find_by_id("pay-1")
+            monkeypatch.setattr(repository, "find_by_id", find_by_id)
+
+            assert stale.status == PaymentStatus.FAILED
+            assert (await cached.find_by_id("pay-1")).status == PaymentStatus.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_write_drops_cached_counts(
+        self,
+        sqlite_database,
+        payment_factory,
+    ):
+        """Should recount after a write instead of serving cached counts."""
+        async with sqlite_database() as connection:
+            cached = CachedPaymentRepository(SQLitePaymentRepository(connection))
+            await cached.save(payment_factory("pay-1"))
+
+            assert await cached.count() == 1
+
+            await cached.save(payment_factory("pay-2"))
+
+            assert await cached.count() == 2
+            assert (await cached.count_by_status())[PaymentStatus.PENDING] == 2
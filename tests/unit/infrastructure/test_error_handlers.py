@@ -0,0 +1,69 @@
+"""Unit tests for the global error handlers."""
+
+import orjson
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+
+from src.shared.infrastructure.http.error_handlers import setup_error_handlers
+
+
+class TestValidationErrorHandler:
+    """Tests for the request validation error handler."""
+
+    @pytest.fixture(scope="class")
+    def handler(self):
+        """Get the validation error handler registered on an app."""
+        app = FastAPI()
+        setup_error_handlers(app)
+        return app.exception_handlers[RequestValidationError]
+
+    @pytest.fixture
+    def request_(self) -> Request:
+        """Create a bare request for the payments endpoint."""
+        return Request({"type": "http", "method": "POST", "path": "/payments"})
+
+    @pytest.mark.asyncio
+    async def test_validation_error_returns_400(self, handler, request_):
+        """Should return 400 with the first error in the message."""
+        exc = RequestValidationError(
+            [
+                {
+                    "type": "missing",
+                    "loc": ("body", "reference"),
+                    "msg": "Field required",
+                    "input": {},
+                }
+            ]
+        )
+
+        response = await handler(request_, exc)
+        body = orjson.loads(response.body)
+
+        assert response.status_code == 400
+        assert body["error"]["code"] == "VALIDATION_ERROR"
+        assert body["error"]["message"] == "body.reference: Field required"
+
+    @pytest.mark.asyncio
+    async def test_validation_error_with_oversized_amount_returns_400(
+        self, handler, request_
+    ):
+        """Should still return 400 when the input is beyond orjson's int range."""
+        exc = RequestValidationError(
+            [
+                {
+                    "type": "decimal_max_digits",
+                    "loc": ("body", "amount"),
+                    "msg": "Decimal input should have no more than 18 digits in total",
+                    "input": 10**30,
+                    "ctx": {"max_digits": 18},
+                }
+            ]
+        )
+
+        response = await handler(request_, exc)
+        body = orjson.loads(response.body)
+
+        assert response.status_code == 400
+        assert body["error"]["code"] == "VALIDATION_ERROR"
+        assert body["error"]["message"].startswith("body.amount: ")
@@ -0,0 +1,250 @@
+"""Unit tests for SQLiteConnection group commits and schema migrations."""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from src.modules.payments.infrastructure.persistence.sqlite_payment_repository import (
+    SQLitePaymentRepository,
+)
+
+# Payments table as created before amounts and timestamps were migrated
+_BASELINE_SCHEMA = """
+    CREATE TABLE payments (
+        payment_id TEXT PRIMARY KEY,
+        reference TEXT NOT NULL,
+        amount TEXT NOT NULL,
+        currency TEXT NOT NULL CHECK(length(currency) = 3),
+        status TEXT NOT NULL DEFAULT 'PENDING'
+            CHECK(status IN ('PENDING', 'SUCCESS', 'FAILED', 'EXHAUSTED')),
+        retries INTEGER NOT NULL DEFAULT 0
+            CHECK(retries >= 0 AND retries <= 3),
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE INDEX idx_payments_status ON payments(status);
+    CREATE INDEX idx_payments_reference ON payments(reference);
+    CREATE INDEX idx_payments_created_at ON payments(created_at);
+"""
+
+
+def _create_baseline_database(path, rows: list[tuple]) -> None:
+    """Write a baseline-schema database holding the given payment rows."""
+    db = sqlite3.connect(path)
+    db.executescript(_BASELINE_SCHEMA)
+    db.executemany("INSERT INTO payments VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    db.commit()
+    db.close()
+
+
+class TestSQLiteGroupCommit:
+    """Tests for writes committed together by SQLiteConnection."""
+
+    @pytest.mark.asyncio
+    async def test_failing_write_does_not_fail_the_batch(self, sqlite_database):
+        """Should commit the other writes of a batch when one statement fails."""
+        async with sqlite_database() as connection:
+            await connection.execute_write("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+            await connection.execute_write("INSERT INTO items VALUES (1)")
+
+            results = await asyncio.gather(
+                connection.execute_write("INSERT INTO items VALUES (2)"),
+                connection.execute_write("INSERT INTO items VALUES (1)"),
+                connection.execute_write("INSERT INTO items VALUES (3)"),
+                return_exceptions=True,
+            )
+
+            assert results[0] == []
+            assert isinstance(results[1], sqlite3.IntegrityError)
+            assert results[2] == []
+
+            rows = await connection.fetch_all("SELECT id FROM items ORDER BY id")
+            assert [row[0] for row in rows] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_write_aborting_the_transaction_fails_the_batch(self, sqlite_database):
+        """Should fail every write of a batch when SQLite rolls the transaction back."""
+        async with sqlite_database() as connection:
+            await connection.execute_write("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+            await connection.execute_write("INSERT INTO items VALUES (1)")
+
+            results = await asyncio.gather(
+                connection.execute_write("INSERT INTO items VALUES (2)"),
+                connection.execute_write("INSERT OR ROLLBACK INTO items VALUES (1)"),
+                connection.execute_write("INSERT INTO items VALUES (3)"),
+                return_exceptions=True,
+            )
+
+            assert all(isinstance(result, sqlite3.IntegrityError) for result in results)
+
+            rows = await connection.fetch_all("SELECT id FROM items")
+            assert [row[0] for row in rows] == [1]
+
+    @pytest.mark.asyncio
+    async def test_failing_write_many_rolls_back_to_its_savepoint(self, sqlite_database):
+        """Should undo every row of a failing write_many and keep the rest of the batch."""
+        async with sqlite_database() as connection:
+            await connection.execute_write("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+            await connection.execute_write("INSERT INTO items VALUES (1)")
+
+            results = await asyncio.gather(
+                connection.execute_write_many(
+                    "INSERT INTO items VALUES (?)",
+                    [(10,), (11,), (1,)],
+                ),
+                connection.execute_write("INSERT INTO items VALUES (20)"),
+                return_exceptions=True,
+            )
+
+            assert isinstance(results[0], sqlite3.IntegrityError)
+            assert results[1] == []
+
+            rows = await connection.fetch_all("SELECT id FROM items ORDER BY id")
+            assert [row[0] for row in rows] == [1, 20]
+
+    @pytest.mark.asyncio
+    async def test_write_returns_rows(self, sqlite_database):
+        """Should hand RETURNING rows back to the caller once committed."""
+        async with sqlite_database() as connection:
+            await connection.execute_write("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+            rows = await connection.execute_write(
+                "INSERT INTO items VALUES (?) RETURNING id", (7,)
+            )
+
+            assert [row[0] for row in rows] == [7]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_write_task_releases_queued_writes(
+        self,
+        sqlite_database,
+        monkeypatch,
+    ):
+        """Should cancel the waiting writes instead of leaving them pending."""
+        async with sqlite_database() as connection:
+            await connection.execute_write("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+            monkeypatch.setattr(connection, "MAX_WRITE_BATCH", 1)
+
+            commit_started = asyncio.Event()
+
+            async def commit_never(batch):
+                commit_started.set()
+                await asyncio.Event().wait()
+
+            monkeypatch.setattr(connection, "_commit_writes", commit_never)
+
+            writes = [
+                asyncio.ensure_future(
+                    connection.execute_write("INSERT INTO items VALUES (?)", (i,))
+                )
+                for i in range(3)
+            ]
+            await commit_started.wait()
+            connection._write_task.cancel()
+
+            results = await asyncio.wait_for(
+                asyncio.gather(*writes, return_exceptions=True), timeout=1
+            )
+
+            assert all(isinstance(result, asyncio.CancelledError) for result in results)
+            assert connection._pending_writes == []
+
+
+class TestSQLiteMigrations:
+    """Tests for migrating a baseline-schema database on connect."""
+
+    @pytest.mark.asyncio
+    async def test_migrates_text_amounts_to_minor_units(
+        self,
+        sqlite_database,
+        tmp_path,
+    ):
+        """Should convert decimal-string amounts to exact minor units."""
+        _create_baseline_database(
+            tmp_path / "payments.db",
+            [
+                ("pay-1", "FAC-1", "1500.50", "MXN", "SUCCESS", 0,
+                 "2024-01-15T10:30:00", "2024-01-15T10:30:00"),
+                ("pay-2", "FAC-2", "9999999999999999.99", "MXN", "FAILED", 1,
+                 "2024-01-15T10:31:00", "2024-01-15T10:31:00"),
+            ],
+        )
+
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+
+            first = await repository.find_by_id("pay-1")
+            second = await repository.find_by_id("pay-2")
+            columns = await connection.fetch_all("PRAGMA table_info(payments)")
+
+            assert first.amount == Decimal("1500.50")
+            assert second.amount == Decimal("9999999999999999.99")
+            assert second.retries == 1
+            assert "amount" not in {column[1] for column in columns}
+
+    @pytest.mark.asyncio
+    async def test_migrates_text_timestamps_to_epoch(
+        self,
+        sqlite_database,
+        tmp_path,
+    ):
+        """Should convert naive and aware ISO timestamps and rebuild the indexes."""
+        _create_baseline_database(
+            tmp_path / "payments.db",
+            [
+                ("pay-1", "FAC-1", "10.00", "MXN", "PENDING", 0,
+                 "2024-01-15T10:30:00", "2024-01-15T10:30:00.250000"),
+                ("pay-2", "FAC-2", "20.00", "MXN", "PENDING", 0,
+                 "2024-01-15T12:30:00+02:00", "2024-01-15T12:30:00+02:00"),
+            ],
+        )
+
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+
+            first = await repository.find_by_id("pay-1")
+            second = await repository.find_by_id("pay-2")
+            (version,) = await connection.fetch_one("PRAGMA user_version")
+            indexes = await connection.fetch_all(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'payments'"
+            )
+
+            assert first.created_at == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+            assert first.updated_at == datetime(
+                2024, 1, 15, 10, 30, 0, 250000, tzinfo=timezone.utc
+            )
+            assert second.created_at == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+            assert version == connection.SCHEMA_VERSION
+            assert {index[0] for index in indexes} >= {
+                "idx_payments_status_created_at",
+                "idx_payments_created_at_id",
+                "idx_payments_reference",
+            }
+            assert "idx_payments_status" not in {index[0] for index in indexes}
+
+    @pytest.mark.asyncio
+    async def test_migrated_database_is_not_migrated_again(
+        self,
+        sqlite_database,
+        tmp_path,
+    ):
+        """Should keep migrated rows intact when connecting a second time."""
+        _create_baseline_database(
+            tmp_path / "payments.db",
+            [
+                ("pay-1", "FAC-1", "10.00", "MXN", "PENDING", 0,
+                 "2024-01-15T10:30:00", "2024-01-15T10:30:00"),
+            ],
+        )
+
+        async with sqlite_database():
+            pass
+
+        async with sqlite_database() as connection:
+            payment = await SQLitePaymentRepository(connection).find_by_id("pay-1")
+
+            assert payment.amount == Decimal("10.00")
+            assert payment.created_at == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
@@ -0,0 +1,229 @@
+"""Unit tests for SQLitePaymentRepository."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.modules.payments.domain.errors import PaymentValidationError
+from src.modules.payments.domain.payment_status import PaymentStatus
+from src.modules.payments.infrastructure.persistence import sqlite_payment_repository
+from src.modules.payments.infrastructure.persistence.sqlite_payment_repository import (
+    SQLitePaymentRepository,
+)
+
+
+class TestSQLitePaymentRepositoryLookups:
+    """Tests for coalesced find_by_id lookups."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(
+        self,
+        sqlite_database,
+        monkeypatch,
+        payment_factory,
+    ):
+        """Should answer concurrent lookups, including missing ids, with one query."""
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            await repository.save_many(
+                [payment_factory("pay-1"), payment_factory("pay-2")]
+            )
+            fetch_all = AsyncMock(wraps=connection.fetch_all)
+            monkeypatch.setattr(connection, "fetch_all", fetch_all)
+
+            first, second, missing, first_again = await asyncio.gather(
+                repository.find_by_id("pay-1"),
+                repository.find_by_id("pay-2"),
+                repository.find_by_id("pay-missing"),
+                repository.find_by_id("pay-1"),
+            )
+
+            assert first.payment_id == "pay-1"
+            assert second.payment_id == "pay-2"
+            assert missing is None
+            assert first_again.payment_id == "pay-1"
+            assert first_again is not first
+            assert fetch_all.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_large_lookup_bursts_are_split_into_batches(
+        self,
+        sqlite_database,
+        monkeypatch,
+        payment_factory,
+    ):
+        """Should split a burst of lookups into queries of at most _LOOKUP_BATCH ids."""
+        monkeypatch.setattr(sqlite_payment_repository, "_LOOKUP_BATCH", 2)
+
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            payment_ids = [f"pay-{i}" for i in range(5)]
+            await repository.save_many([payment_factory(pid) for pid in payment_ids])
+            fetch_all = AsyncMock(wraps=connection.fetch_all)
+            monkeypatch.setattr(connection, "fetch_all", fetch_all)
+
+            payments = await asyncio.gather(
+                *(repository.find_by_id(pid) for pid in payment_ids)
+            )
+
+            assert [payment.payment_id for payment in payments] == payment_ids
+            assert fetch_all.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_query_fails_every_waiter(
+        self,
+        sqlite_database,
+        monkeypatch,
+    ):
+        """Should hand the query error to every coalesced lookup."""
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            error = RuntimeError("database is locked")
+            monkeypatch.setattr(connection, "fetch_all", AsyncMock(side_effect=error))
+
+            results = await asyncio.gather(
+                repository.find_by_id("pay-1"),
+                repository.find_by_id("pay-2"),
+                return_exceptions=True,
+            )
+
+            assert results == [error, error]
+
+
+class TestSQLitePaymentRepositoryPagination:
+    """Tests for keyset-paginated find_all."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_round_trip_returns_every_payment_once(
+        self,
+        sqlite_database,
+        payment_factory,
+    ):
+        """Should walk every page newest first, breaking created_at ties by id."""
+        start = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        payments = [
+            payment_factory(f"pay-{i}", created_at=start + timedelta(minutes=i // 2))
+            for i in range(5)
+        ]
+
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            await repository.save_many(payments)
+
+            seen = []
+            cursor = None
+            while True:
+                page, cursor = await repository.find_all(cursor=cursor, limit=2)
+                seen.extend(payment.payment_id for payment in page)
+                if cursor is None:
+                    break
+
+            assert seen == ["pay-4", "pay-3", "pay-2", "pay-1", "pay-0"]
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_keep_the_status_filter(
+        self,
+        sqlite_database,
+        payment_factory,
+    ):
+        """Should only return payments of the filtered status on every page."""
+        start = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        payments = [
+            payment_factory(
+                f"pay-{i}",
+                status=PaymentStatus.FAILED if i % 2 else PaymentStatus.PENDING,
+                created_at=start + timedelta(minutes=i),
+            )
+            for i in range(6)
+        ]
+
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            await repository.save_many(payments)
+
+            first, cursor = await repository.find_all(
+                status=PaymentStatus.FAILED, limit=2
+            )
+            second, last_cursor = await repository.find_all(
+                status=PaymentStatus.FAILED, cursor=cursor, limit=2
+            )
+
+            assert [payment.payment_id for payment in first] == ["pay-5", "pay-3"]
+            assert [payment.payment_id for payment in second] == ["pay-1"]
+            assert last_cursor is None
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "bm8tc2VwYXJhdG9y", "YWJjfHBheS0x"])
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_raises_validation_error(
+        self,
+        sqlite_database,
+        cursor,
+    ):
+        """Should reject cursors that don't decode to a sort key."""
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+
+            with pytest.raises(PaymentValidationError) as exc_info:
+                await repository.find_all(cursor=cursor)
+
+            assert exc_info.value.code == "VALIDATION_ERROR"
+
+
+class TestSQLitePaymentRepositoryRetryOutcome:
+    """Tests for the guarded retry outcome write."""
+
+    @pytest.mark.asyncio
+    async def test_late_failure_does_not_overwrite_success(
+        self,
+        sqlite_database,
+        payment_factory,
+    ):
+        """Should keep a concurrent retry's SUCCESS when an older retry fails late."""
+        now = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            await repository.save(
+                payment_factory("pay-1", status=PaymentStatus.FAILED)
+            )
+            first = await repository.try_increment_retry("pay-1", max_retries=3, now=now)
+            second = await repository.try_increment_retry("pay-1", max_retries=3, now=now)
+
+            succeeded = await repository.update_status(
+                "pay-1", PaymentStatus.SUCCESS, now, expected_retries=first.retries
+            )
+            failed = await repository.update_status(
+                "pay-1", PaymentStatus.FAILED, now, expected_retries=second.retries
+            )
+
+            assert succeeded is True
+            assert failed is False
+            payment = await repository.find_by_id("pay-1")
+            assert payment.status == PaymentStatus.SUCCESS
+            assert payment.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_failure_is_not_recorded(
+        self,
+        sqlite_database,
+        payment_factory,
+    ):
+        """Should skip a failure whose retry counter was overtaken by a newer retry."""
+        now = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+        async with sqlite_database() as connection:
+            repository = SQLitePaymentRepository(connection)
+            await repository.save(
+                payment_factory("pay-1", status=PaymentStatus.FAILED, retries=2)
+            )
+            await repository.try_increment_retry("pay-1", max_retries=3, now=now)
+
+            updated = await repository.update_status(
+                "pay-1", PaymentStatus.EXHAUSTED, now, expected_retries=2
+            )
+
+            assert updated is False
+            payment = await repository.find_by_id("pay-1")
+            assert payment.status == PaymentStatus.FAILED